@@ -0,0 +1,14 @@
+"""
+FASE 0.8 - Enriquecimiento con Tests (TDD).
+
+Adds a ``test_strategy`` to every implementation task of
+``docs/state/tasks.json``. Equivalent to
+``python -m migration_framework enrich``; see that command for options.
+"""
+
+import sys
+
+from migration_framework.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main(["enrich", *sys.argv[1:]]))
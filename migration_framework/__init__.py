@@ -0,0 +1,71 @@
+"""Migration Framework v4.3 - orchestrator tooling.
+
+Python helpers used by the orchestrator to import pre-generated tasks,
+assign them to agents, schedule their execution and track their state.
+"""
+
+from migration_framework.assignment import (
+    AssignmentDecision,
+    AssignmentEngine,
+    AssignmentRuleError,
+    assign_agent,
+)
+from migration_framework.benchmark import (
+    Benchmark,
+    BenchmarkError,
+    BenchmarkRun,
+    LoadProfile,
+    Regression,
+    compare,
+)
+from migration_framework.cache import CachedResult, CachedRunner, ResultCache
+from migration_framework.enrichment import EnrichmentPipeline, generate_test_strategy
+from migration_framework.graph import DependencyGraphError, TaskGraph
+from migration_framework.loader import TaskLoader, TaskValidationError, ValidationIssue, iter_tasks
+from migration_framework.scheduler import Schedule, Scheduler, TaskOutcome
+from migration_framework.state_store import TaskStateStore
+from migration_framework.tasks import effort_minutes, load_tasks, task_role
+from migration_framework.telemetry import Tracer, build_report, current_span, get_tracer, set_tracer
+from migration_framework.testrunner import RunReport, ShardedTestStage, Suite, SuiteError
+
+__version__ = "4.3.0"
+
+__all__ = [
+    "AssignmentDecision",
+    "AssignmentEngine",
+    "AssignmentRuleError",
+    "Benchmark",
+    "BenchmarkError",
+    "BenchmarkRun",
+    "CachedResult",
+    "CachedRunner",
+    "DependencyGraphError",
+    "EnrichmentPipeline",
+    "LoadProfile",
+    "Regression",
+    "ResultCache",
+    "RunReport",
+    "Schedule",
+    "Scheduler",
+    "ShardedTestStage",
+    "Suite",
+    "SuiteError",
+    "TaskGraph",
+    "TaskLoader",
+    "TaskOutcome",
+    "TaskStateStore",
+    "TaskValidationError",
+    "Tracer",
+    "ValidationIssue",
+    "assign_agent",
+    "build_report",
+    "compare",
+    "current_span",
+    "effort_minutes",
+    "generate_test_strategy",
+    "get_tracer",
+    "iter_tasks",
+    "load_tasks",
+    "set_tracer",
+    "task_role",
+]
@@ -0,0 +1,283 @@
+"""
+Agent auto-assignment (FASE 0 - Paso 0.4).
+
+Maps every task to the agent role responsible for it with a declarative
+rule list instead of an if/elif chain:
+
+- Each rule names an agent and the conditions that select it:
+  substrings of the deliverable paths (case-sensitive, as in the original
+  chain), of the description or the title (case-insensitive), or an exact
+  ``implementation_layer``. Rules are evaluated in order and the first
+  one whose conditions all hold wins.
+- Rules are compiled once into a per-field index of distinct patterns,
+  each with its own bit. Each distinct pattern is searched for once per
+  task with a substring test, however many rules share it, and rules are
+  then bitmask tests. Fields are only scanned when a rule needs them, so a
+  task settled by an early rule never pays for scanning its description.
+  Description and title hits are remembered per text, since the same tasks
+  are classified again every time a task graph is built.
+- Every classification returns an :class:`AssignmentDecision` recording
+  which rule fired and which patterns matched.
+
+Teams add roles (e.g. ``shadcn-ui-agent``) by writing rules to
+``docs/config/assignment-rules.json`` instead of editing this module; by
+default those rules are tried before the built-in ones.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+DEFAULT_AGENT = "infrastructure-agent"
+DEFAULT_RULES_PATH = "docs/config/assignment-rules.json"
+
+# Fields matched by substring; implementation_layer is matched exactly
+TEXT_FIELDS = ("deliverables", "description", "title")
+CASE_INSENSITIVE_FIELDS = ("description", "title")
+LAYER_FIELD = "implementation_layer"
+# Distinct descriptions/titles whose hits are remembered per engine
+MEMO_SIZE = 4096
+
+# Paso 0.4, preceded by the v4.3 layer ownership (CLAUDE_V4.3_CHANGES.md §4)
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "name": "domain-layer",
+        "agent": "domain-agent",
+        "when": {"implementation_layer": ["domain"]},
+    },
+    {
+        "name": "application-layer",
+        "agent": "use-case-agent",
+        "when": {"implementation_layer": ["application", "use_case"]},
+    },
+    {
+        "name": "infrastructure-layer",
+        "agent": "infrastructure-agent",
+        "when": {
+            "implementation_layer": [
+                "infrastructure",
+                "infrastructure_backend",
+                "infrastructure_frontend",
+            ]
+        },
+    },
+    {
+        "name": "sqlalchemy-models",
+        "agent": "infrastructure-agent",
+        "when": {"deliverables": ["models/"]},
+    },
+    {"name": "pydantic-schemas", "agent": "use-case-agent", "when": {"deliverables": ["schemas/"]}},
+    {
+        "name": "business-rules",
+        "agent": "domain-agent",
+        "when": {"description": ["business logic", "domain"]},
+    },
+    {
+        "name": "e2e-tests",
+        "agent": "e2e-qa-agent",
+        "when": [{"deliverables": ["tests/"]}, {"deliverables": ["e2e"]}],
+    },
+    {
+        "name": "unit-integration-tests",
+        "agent": "qa-test-generator",
+        "when": {"deliverables": ["tests/"]},
+    },
+    {
+        "name": "api-and-ui",
+        "agent": "infrastructure-agent",
+        "when": {"deliverables": ["api/", "frontend/"]},
+    },
+]
+
+
+class AssignmentRuleError(ValueError):
+    """Raised for a malformed assignment rule."""
+
+
+class Condition(NamedTuple):
+    """Holds when ``field`` matches at least one of ``patterns``."""
+
+    field: str
+    patterns: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    agent: str
+    conditions: Tuple[Condition, ...]
+
+
+# A rule with its conditions as (field, bitmask of the field's patterns)
+_Compiled = Tuple[Rule, Tuple[Tuple[str, int], ...]]
+
+
+@dataclass
+class AssignmentDecision:
+    """Why a task was assigned to an agent."""
+
+    task_id: str
+    agent: str
+    # None when no rule matched and the default agent was used
+    rule: Optional[str]
+    matched: Dict[str, List[str]] = field(default_factory=dict)
+
+    def explain(self) -> str:
+        if self.rule is None:
+            return f"{self.task_id} → {self.agent} (default)"
+        hits = "; ".join(f"{f}: {', '.join(p)}" for f, p in self.matched.items())
+        return f"{self.task_id} → {self.agent} [{self.rule}] {hits}"
+
+
+class AssignmentEngine:
+    """Ordered rules compiled into a per-field pattern index."""
+
+    def __init__(self, rules: Iterable[Mapping[str, Any]], default_agent: str = DEFAULT_AGENT):
+        self.default_agent = default_agent
+        self.rules = tuple(_parse_rule(i, raw) for i, raw in enumerate(rules))
+        # field -> distinct patterns across all rules
+        self.patterns: Dict[str, Tuple[str, ...]] = {}
+        for rule in self.rules:
+            for condition in rule.conditions:
+                known = self.patterns.get(condition.field, ())
+                self.patterns[condition.field] = known + tuple(
+                    sorted(p for p in condition.patterns if p not in known)
+                )
+        # Pattern i of a field is bit 1 << i of that field's hit mask
+        self._bits = {
+            name: {p: 1 << i for i, p in enumerate(patterns)}
+            for name, patterns in self.patterns.items()
+        }
+        self._items = {name: tuple(bits.items()) for name, bits in self._bits.items()}
+        self._memo: Dict[str, Dict[str, int]] = {name: {} for name in CASE_INSENSITIVE_FIELDS}
+        self._compiled: Tuple[_Compiled, ...] = tuple(
+            (
+                rule,
+                tuple(
+                    (c.field, sum(self._bits[c.field][p] for p in c.patterns))
+                    for c in rule.conditions
+                ),
+            )
+            for rule in self.rules
+        )
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "AssignmentEngine":
+        """
+        Build from ``{"rules": [...], "default_agent": ..., "extend_defaults": true}``.
+
+        With ``extend_defaults`` (the default) the configured rules are tried
+        first and the built-in :data:`DEFAULT_RULES` after them.
+        """
+        rules = list(config.get("rules", []))
+        if config.get("extend_defaults", True):
+            rules.extend(DEFAULT_RULES)
+        return cls(rules, config.get("default_agent", DEFAULT_AGENT))
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "AssignmentEngine":
+        with open(path, encoding="utf-8") as fh:
+            return cls.from_config(json.load(fh))
+
+    def classify(self, task: Mapping[str, Any]) -> AssignmentDecision:
+        found: Dict[str, int] = {}
+        match = self._match(task, found)
+        if match is None:
+            return AssignmentDecision(task.get("id", ""), self.default_agent, None)
+        rule, conditions = match
+        matched: Dict[str, List[str]] = {}
+        for name, mask in conditions:
+            matched.setdefault(name, []).extend(self._decode(name, found[name] & mask))
+        return AssignmentDecision(task.get("id", ""), rule.agent, rule.name, matched)
+
+    def classify_all(self, tasks: Iterable[Mapping[str, Any]]) -> List[AssignmentDecision]:
+        return [self.classify(task) for task in tasks]
+
+    def agent_for(self, task: Mapping[str, Any]) -> str:
+        """Like :meth:`classify` but only the agent, without building the decision."""
+        match = self._match(task, {})
+        return self.default_agent if match is None else match[0].agent
+
+    def _match(self, task: Mapping[str, Any], found: Dict[str, int]) -> Optional[_Compiled]:
+        """First rule whose conditions hold; ``found`` collects each scanned field's hits."""
+        for compiled in self._compiled:
+            for name, mask in compiled[1]:
+                hits = found.get(name)
+                if hits is None:
+                    hits = found[name] = self._scan(task, name)
+                if not hits & mask:
+                    break
+            else:
+                return compiled
+        return None
+
+    def _scan(self, task: Mapping[str, Any], name: str) -> int:
+        """Bitmask of the patterns of field ``name`` present in ``task``."""
+        value = task.get(name)
+        if not value:
+            return 0
+        if name == LAYER_FIELD:
+            return self._bits[name].get(value, 0) if isinstance(value, str) else 0
+        # Newline-joined so a pattern cannot span two deliverables
+        text = "\n".join(value) if isinstance(value, list) else str(value)
+        if name not in CASE_INSENSITIVE_FIELDS:
+            return self._search(name, text)
+        # Long prose fields are lowercased and searched once per distinct text
+        memo = self._memo[name]
+        hits = memo.get(text)
+        if hits is None:
+            if len(memo) >= MEMO_SIZE:
+                memo.clear()
+            hits = memo[text] = self._search(name, text.lower())
+        return hits
+
+    def _search(self, name: str, text: str) -> int:
+        hits = 0
+        for pattern, bit in self._items[name]:
+            if pattern in text:
+                hits |= bit
+        return hits
+
+    def _decode(self, name: str, hits: int) -> List[str]:
+        return [p for p, bit in self._items[name] if hits & bit]
+
+
+def _parse_rule(index: int, raw: Mapping[str, Any]) -> Rule:
+    name = raw.get("name") or f"rule-{index}"
+    if not raw.get("agent"):
+        raise AssignmentRuleError(f"assignment rule {name!r}: missing 'agent'")
+    when = raw.get("when") or {}
+    groups = when if isinstance(when, list) else [when]
+    conditions = []
+    for group in groups:
+        for field_name, patterns in group.items():
+            if field_name not in TEXT_FIELDS and field_name != LAYER_FIELD:
+                raise AssignmentRuleError(f"assignment rule {name!r}: unknown field {field_name!r}")
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            if field_name in CASE_INSENSITIVE_FIELDS:
+                patterns = [p.lower() for p in patterns]
+            conditions.append(Condition(field_name, frozenset(patterns)))
+    if not conditions:
+        raise AssignmentRuleError(f"assignment rule {name!r}: no conditions")
+    return Rule(name, raw["agent"], tuple(conditions))
+
+
+_default_engine: Optional[AssignmentEngine] = None
+
+
+def default_engine() -> AssignmentEngine:
+    """The built-in rules, extended by :data:`DEFAULT_RULES_PATH` when present."""
+    global _default_engine
+    if _default_engine is None:
+        if Path(DEFAULT_RULES_PATH).exists():
+            _default_engine = AssignmentEngine.from_file(DEFAULT_RULES_PATH)
+        else:
+            _default_engine = AssignmentEngine(DEFAULT_RULES)
+    return _default_engine
+
+
+def assign_agent(task: Mapping[str, Any]) -> str:
+    """Return the agent role that should implement ``task``."""
+    return default_engine().agent_for(task)
@@ -0,0 +1,753 @@
+"""
+Performance baseline stage for the generated FastAPI backend (FASE 4).
+
+TASK-041/TASK-073 ask the agents for Locust scripts, but nothing runs
+them, so N+1 relationship loading (``Customer.accounts``) and missing
+indexes reach production unnoticed. This stage measures the generated
+backend on every iteration instead:
+
+- the ASGI app (``app.main:app``) runs in-process against a throwaway
+  SQLite database, or a local Postgres given with ``database_url``. No
+  server or network is involved, so the numbers compare run to run;
+- synthetic customers, accounts and transactions are seeded through the
+  API itself, so the seed follows whatever schemas the agents generated;
+- concurrent virtual users then drive a weighted mix of endpoints for a
+  fixed time. Each scenario records p50/p95/p99 latency, throughput and
+  queries per request, counted with SQLAlchemy cursor events. On SQLite
+  the captured statements are also checked with ``EXPLAIN QUERY PLAN``
+  for filtered full scans (missing indexes);
+- the run is compared with a stored baseline and with each scenario's
+  SLO. Every regression names the tasks that own the endpoint (by their
+  deliverables) and their NFRs (``relatedRequirements``).
+
+The load profile comes from :data:`DEFAULT_PROFILE`, overridden by
+``docs/config/benchmark.json`` when present.
+"""
+
+import asyncio
+import contextvars
+import importlib
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from migration_framework.telemetry import get_tracer
+
+DEFAULT_PROFILE_PATH = "docs/config/benchmark.json"
+DEFAULT_BASELINE_PATH = "docs/state/benchmark-baseline.json"
+DEFAULT_RESULTS_PATH = "docs/state/benchmark.json"
+# TASK-041: "fail if response time increases >20%"
+DEFAULT_TOLERANCE = 0.2
+# Latency differences below this are noise on a local run
+MIN_LATENCY_DELTA_MS = 5.0
+
+# Endpoints of TASK-025 (customers), TASK-026 (accounts) and TASK-054 (transactions).
+# ``{name}`` draws a value saved while seeding; ``{name_2}`` draws a second, independent one.
+DEFAULT_PROFILE: Dict[str, Any] = {
+    "app": "app.main:app",
+    "database_url": "sqlite+aiosqlite:///{db_path}",
+    "database_env": "DATABASE_URL",
+    # "module:attr" of the declarative Base/MetaData; when set, tables are recreated before seeding
+    "metadata": None,
+    "users": 10,
+    "duration_s": 15,
+    "warmup_s": 2,
+    "random_seed": 42,
+    "data": [
+        {
+            "name": "customers",
+            "method": "POST",
+            "path": "/api/v1/customers",
+            "count": 200,
+            "json": {
+                "title": "Mr",
+                "first_name": "Load",
+                "last_name": "Customer{i}",
+                "date_of_birth": "1980-01-01",
+                "address_line1": "{i} Main Street",
+                "city": "Edinburgh",
+                "postal_code": "EH1 1AA",
+                "country": "UK",
+            },
+            "save": {"customer_number": "customer_number"},
+        },
+        {
+            "name": "accounts",
+            "method": "POST",
+            "path": "/api/v1/customers/{customer_number}/accounts",
+            "count": 400,
+            "json": {"account_type": "CURRENT", "interest_rate": 1.5, "overdraft_limit": 500},
+            "save": {"account_number": "account_number"},
+        },
+        {
+            "name": "transactions",
+            "method": "POST",
+            "path": "/api/v1/transactions/credit",
+            "count": 2000,
+            "json": {
+                "account_number": "{account_number}",
+                "amount": 100,
+                "description": "Seed {i}",
+            },
+        },
+    ],
+    "scenarios": [
+        {
+            "name": "get-customer",
+            "path": "/api/v1/customers/{customer_number}",
+            "weight": 5,
+            "requirements": ["NFR-3"],
+            "slo": {"p95_ms": 200},
+        },
+        {"name": "list-customers", "path": "/api/v1/customers?limit=50", "weight": 3},
+        {
+            "name": "customer-accounts",
+            "path": "/api/v1/customers/{customer_number}/accounts",
+            "weight": 3,
+        },
+        {"name": "get-account", "path": "/api/v1/accounts/{account_number}", "weight": 3},
+        {
+            "name": "account-transactions",
+            "path": "/api/v1/accounts/{account_number}/transactions",
+            "weight": 2,
+        },
+        {
+            "name": "transfer",
+            "method": "POST",
+            "path": "/api/v1/transactions/transfer",
+            "resource": "transactions",
+            "weight": 1,
+            "json": {
+                "from_account_number": "{account_number}",
+                "to_account_number": "{account_number_2}",
+                "amount": 1,
+                "description": "Load test transfer",
+            },
+            "requirements": ["NFR-21"],
+            "slo": {"p95_ms": 500},
+        },
+    ],
+}
+
+_VERSION_SEGMENT = re.compile(r"^v\d+$")
+_PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+_NUMBERED = re.compile(r"^(\w+?)_\d+$")
+_FILTERED = re.compile(r"\bWHERE\b", re.I)
+
+
+class BenchmarkError(ValueError):
+    """Raised for a malformed load profile or a backend that cannot be benchmarked."""
+
+
+@dataclass
+class SeedStep:
+    """Requests that create synthetic data, saving response fields for later steps."""
+
+    name: str
+    path: str
+    count: int
+    method: str = "POST"
+    json: Any = None
+    # variable -> response field (dotted path)
+    save: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Scenario:
+    """One endpoint of the load mix."""
+
+    name: str
+    path: str
+    method: str = "GET"
+    weight: float = 1.0
+    json: Any = None
+    # Path segment naming the endpoint module (default: last literal segment of ``path``)
+    resource: Optional[str] = None
+    tasks: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+    slo: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def endpoint_resource(self) -> str:
+        if self.resource:
+            return self.resource
+        literal = [
+            s
+            for s in PurePosixPath(self.path.split("?")[0]).parts
+            if s not in ("/", "api") and not _VERSION_SEGMENT.match(s) and not _PLACEHOLDER.match(s)
+        ]
+        return literal[-1] if literal else ""
+
+
+@dataclass
+class LoadProfile:
+    app: str
+    database_url: str
+    database_env: str
+    metadata: Optional[str]
+    users: int
+    duration_s: float
+    warmup_s: float
+    random_seed: int
+    data: List[SeedStep]
+    scenarios: List[Scenario]
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "LoadProfile":
+        """Build from :data:`DEFAULT_PROFILE` overridden key by key by ``config``."""
+        merged = {**DEFAULT_PROFILE, **config}
+        try:
+            data = [SeedStep(**step) for step in merged["data"]]
+            scenarios = [Scenario(**scenario) for scenario in merged["scenarios"]]
+        except TypeError as exc:
+            raise BenchmarkError(f"benchmark profile: {exc}") from None
+        if not scenarios:
+            raise BenchmarkError("benchmark profile: no scenarios")
+        names = [s.name for s in scenarios]
+        if len(set(names)) != len(names):
+            raise BenchmarkError("benchmark profile: duplicate scenario names")
+        profile = cls(
+            app=merged["app"],
+            database_url=merged["database_url"],
+            database_env=merged["database_env"],
+            metadata=merged["metadata"],
+            users=int(merged["users"]),
+            duration_s=float(merged["duration_s"]),
+            warmup_s=float(merged["warmup_s"]),
+            random_seed=int(merged["random_seed"]),
+            data=data,
+            scenarios=scenarios,
+        )
+        profile.check()
+        return profile
+
+    def check(self) -> None:
+        """Reject load settings that leave nothing to measure; re-run after overriding them."""
+        if self.users < 1 or self.duration_s <= 0:
+            raise BenchmarkError("benchmark profile: users and duration_s must be positive")
+        if not 0 <= self.warmup_s < self.duration_s:
+            raise BenchmarkError(
+                f"benchmark profile: warmup_s ({self.warmup_s:g}) must be shorter than"
+                f" duration_s ({self.duration_s:g})"
+            )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "LoadProfile":
+        with open(path, encoding="utf-8") as fh:
+            return cls.from_config(json.load(fh))
+
+
+def default_profile() -> LoadProfile:
+    """The built-in profile, overridden by :data:`DEFAULT_PROFILE_PATH` when present."""
+    if Path(DEFAULT_PROFILE_PATH).exists():
+        return LoadProfile.from_file(DEFAULT_PROFILE_PATH)
+    return LoadProfile.from_config({})
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int = 0
+    errors: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    throughput_rps: float = 0.0
+    queries_per_request: float = 0.0
+    max_queries: int = 0
+    db_ms_per_request: float = 0.0
+    # Tables read by a filtered full scan (SQLite only)
+    full_scans: List[str] = field(default_factory=list)
+    tasks: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of one benchmark run, as stored in the results and baseline files."""
+
+    started_at: str
+    database: str
+    users: int
+    duration_s: float
+    seeded: Dict[str, int] = field(default_factory=dict)
+    scenarios: Dict[str, ScenarioResult] = field(default_factory=dict)
+
+    @property
+    def throughput_rps(self) -> float:
+        return sum(r.throughput_rps for r in self.scenarios.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "BenchmarkRun":
+        scenarios = {name: ScenarioResult(**r) for name, r in data.get("scenarios", {}).items()}
+        return cls(
+            started_at=data["started_at"],
+            database=data["database"],
+            users=data["users"],
+            duration_s=data["duration_s"],
+            seeded=dict(data.get("seeded", {})),
+            scenarios=scenarios,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(
+            json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        os.replace(tmp, path)
+
+
+def load_run(path: Union[str, Path]) -> Optional[BenchmarkRun]:
+    """The run stored at ``path``, or None if there is none."""
+    if not Path(path).exists():
+        return None
+    with open(path, encoding="utf-8") as fh:
+        return BenchmarkRun.from_dict(json.load(fh))
+
+
+@dataclass
+class Regression:
+    """A metric of a scenario that got worse than the baseline or broke its SLO."""
+
+    scenario: str
+    metric: str
+    current: float
+    # Baseline value, or the SLO limit when ``slo`` is set
+    reference: float
+    slo: bool = False
+    tasks: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        if self.metric.startswith("full scan"):
+            text = f"{self.scenario}: new {self.metric}"
+        elif self.slo:
+            text = f"{self.scenario}: {self.metric} {self.current:.2f} (SLO {self.reference:g})"
+        else:
+            text = f"{self.scenario}: {self.metric} {self.reference:.2f} → {self.current:.2f}"
+        if self.tasks:
+            text += f" — {', '.join(self.tasks)}"
+        if self.requirements:
+            text += f" ({', '.join(self.requirements)})"
+        return text
+
+
+def compare(
+    run: BenchmarkRun,
+    baseline: Optional[BenchmarkRun],
+    slos: Optional[Mapping[str, Mapping[str, float]]] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """
+    Regressions of ``run`` against ``baseline`` and the per-scenario ``slos``.
+
+    p95 latency regresses when it grows by more than ``tolerance`` and
+    :data:`MIN_LATENCY_DELTA_MS`; p99 rests on too few samples to gate on
+    a baseline and is only checked against SLOs. Query counts are
+    deterministic, so one extra query per request on average (an N+1) is
+    a regression, as is any new full scan. Throughput is compared for the
+    whole run only.
+    """
+    regressions: List[Regression] = []
+    for name, result in run.scenarios.items():
+        # (metric, current, reference, slo)
+        found: List[Tuple[str, float, float, bool]] = []
+        for metric, limit in (slos or {}).get(name, {}).items():
+            current = result.error_rate if metric == "error_rate" else getattr(result, metric, None)
+            if current is None:
+                continue
+            if current < limit if metric == "throughput_rps" else current > limit:
+                found.append((metric, current, limit, True))
+
+        base = baseline.scenarios.get(name) if baseline else None
+        if base is not None and base.requests:
+            slower = result.p95_ms - base.p95_ms
+            if slower > base.p95_ms * tolerance and slower > MIN_LATENCY_DELTA_MS:
+                found.append(("p95_ms", result.p95_ms, base.p95_ms, False))
+            queries, base_queries = result.queries_per_request, base.queries_per_request
+            if queries - base_queries >= 1:
+                found.append(("queries_per_request", queries, base_queries, False))
+            if result.error_rate > base.error_rate + 0.01:
+                found.append(("error_rate", result.error_rate, base.error_rate, False))
+            for table in sorted(set(result.full_scans) - set(base.full_scans)):
+                found.append((f"full scan {table}", 1, 0, False))
+
+        regressions.extend(
+            Regression(name, metric, current, reference, slo, result.tasks, result.requirements)
+            for metric, current, reference, slo in found
+        )
+
+    # Users send requests back to back, so one slow endpoint lowers every scenario's throughput
+    if baseline is not None and run.throughput_rps < baseline.throughput_rps * (1 - tolerance):
+        regressions.append(
+            Regression("total", "throughput_rps", run.throughput_rps, baseline.throughput_rps)
+        )
+    return regressions
+
+
+def attribute(scenarios: Iterable[Scenario], tasks: Iterable[Mapping[str, Any]]) -> None:
+    """
+    Fill each scenario's ``tasks`` and ``requirements`` from the task list.
+
+    A task owns a scenario when it creates or updates the module of the
+    scenario's resource in some layer: ``endpoints/accounts.py``,
+    ``models/account.py``, ``schemas/account.py``,
+    ``services/account_service.py`` or ``account_repository.py``. The
+    requirements are the owners' NFRs plus the explicit ones.
+    """
+    tasks = list(tasks)
+    for scenario in scenarios:
+        resource = scenario.endpoint_resource.lower().replace("-", "_")
+        singular = resource[:-1] if resource.endswith("s") else resource
+        modules = {resource, singular, f"{singular}_service", f"{singular}_repository"}
+        owners = set(scenario.tasks)
+        for task in tasks:
+            for deliverable in task.get("deliverables") or []:
+                # "app/services/customer_service.py (updated)"
+                path = PurePosixPath(deliverable.split(" (")[0].strip())
+                if (
+                    path.suffix == ".py"
+                    and path.stem.lower() in modules
+                    and "tests" not in path.parts
+                ):
+                    owners.add(task["id"])
+                    break
+        requirements = set(scenario.requirements)
+        for task in tasks:
+            if task["id"] in owners:
+                requirements.update(
+                    r for r in task.get("related_requirements") or [] if r.startswith("NFR")
+                )
+        scenario.tasks = sorted(owners, key=_natural_key)
+        scenario.requirements = sorted(requirements, key=_natural_key)
+
+
+# ----------------------------------------------------------------------
+# Running
+# ----------------------------------------------------------------------
+
+
+class _RequestStats:
+    __slots__ = ("queries", "db_time", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        # statement -> sample parameters, for the query plan check
+        self.statements: Dict[str, Any] = {}
+
+
+# Stats of the request being served; inherited by the tasks and threads the app spawns
+_request: "contextvars.ContextVar[Optional[_RequestStats]]" = contextvars.ContextVar(
+    "migration_framework_benchmark_request", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request.get()
+    if stats is None:
+        return
+    stats.queries += 1
+    if not executemany and statement.lstrip()[:6].upper() in ("SELECT", "UPDATE", "DELETE"):
+        stats.statements.setdefault(statement, parameters)
+    conn.info.setdefault("benchmark_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request.get()
+    started = conn.info.get("benchmark_started")
+    if stats is not None and started:
+        stats.db_time += time.perf_counter() - started.pop()
+
+
+class Benchmark:
+    """Seeds and load-tests the backend under ``backend_dir`` with a :class:`LoadProfile`."""
+
+    def __init__(
+        self,
+        profile: LoadProfile,
+        backend_dir: Union[str, Path] = "backend",
+        database_url: Optional[str] = None,
+    ):
+        profile.check()
+        self.profile = profile
+        self.backend_dir = Path(backend_dir).resolve()
+        self.database_url = database_url or profile.database_url
+        self.rng = random.Random(profile.random_seed)
+        # variable -> values saved while seeding
+        self.pools: Dict[str, List[Any]] = {}
+
+    def run(self) -> BenchmarkRun:
+        if not self.backend_dir.is_dir():
+            raise BenchmarkError(f"backend directory not found: {self.backend_dir}")
+        with tempfile.TemporaryDirectory(prefix="migration-benchmark-") as tmp:
+            url = self.database_url.replace("{db_path}", str(Path(tmp) / "benchmark.db"))
+            with get_tracer().span("benchmark", kind="benchmark", users=self.profile.users) as span:
+                run = asyncio.run(self._run(url))
+                span.set(
+                    database=run.database,
+                    requests=sum(r.requests for r in run.scenarios.values()),
+                    throughput_rps=round(run.throughput_rps, 2),
+                )
+        return run
+
+    async def _run(self, url: str) -> BenchmarkRun:
+        # Imported here: only this stage needs the backend's dependencies
+        import httpx
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine, make_url
+
+        app = self._load_app(url)
+        run = BenchmarkRun(
+            started_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            database=make_url(url).get_backend_name(),
+            users=self.profile.users,
+            duration_s=self.profile.duration_s,
+        )
+        if self.profile.metadata:
+            await self._create_schema(url, self.profile.metadata)
+
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        try:
+            async with AsyncExitStack() as stack:
+                lifespan = getattr(getattr(app, "router", None), "lifespan_context", None)
+                if lifespan is not None:
+                    await stack.enter_async_context(lifespan(app))
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(
+                        transport=httpx.ASGITransport(app=app),
+                        base_url="http://benchmark",
+                        timeout=60,
+                    )
+                )
+                for step in self.profile.data:
+                    run.seeded[step.name] = await self._seed(client, step)
+                samples = await self._load(client)
+        finally:
+            event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+
+        window = self.profile.duration_s - self.profile.warmup_s
+        sqlite_path = make_url(url).database if run.database == "sqlite" else None
+        for scenario in self.profile.scenarios:
+            result = _summarize(scenario, samples[scenario.name], window)
+            if sqlite_path:
+                statements: Dict[str, Any] = {}
+                for _, _, stats in samples[scenario.name]:
+                    for statement, params in stats.statements.items():
+                        statements.setdefault(statement, params)
+                result.full_scans = _full_scans(sqlite_path, statements)
+            run.scenarios[scenario.name] = result
+        return run
+
+    def _load_app(self, url: str) -> Any:
+        module_name, _, attr = self.profile.app.partition(":")
+        # The generated settings read the database URL from the environment
+        os.environ[self.profile.database_env] = url
+        if str(self.backend_dir) not in sys.path:
+            sys.path.insert(0, str(self.backend_dir))
+        try:
+            return getattr(importlib.import_module(module_name), attr or "app")
+        except (ImportError, AttributeError) as exc:
+            raise BenchmarkError(
+                f"cannot load {self.profile.app} from {self.backend_dir}: {exc}"
+            ) from exc
+
+    async def _create_schema(self, url: str, metadata_ref: str) -> None:
+        """Recreate the tables of the ``module:attr`` Base/MetaData ``metadata_ref``."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.engine import make_url
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        module_name, _, attr = metadata_ref.partition(":")
+        target = getattr(importlib.import_module(module_name), attr)
+        metadata = getattr(target, "metadata", target)
+        if not make_url(url).get_dialect().is_async:
+            # Sync backends (``sqlite:///``, ``postgresql+psycopg2://``)
+            sync_engine = create_engine(url)
+            metadata.drop_all(sync_engine)
+            metadata.create_all(sync_engine)
+            sync_engine.dispose()
+            return
+        engine = create_async_engine(url)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.drop_all)
+                await conn.run_sync(metadata.create_all)
+        finally:
+            await engine.dispose()
+
+    async def _seed(self, client: Any, step: SeedStep) -> int:
+        created = 0
+        last_error = ""
+        for i in range(1, step.count + 1):
+            values = _Values(self.pools, self.rng, i=i)
+            response = await client.request(
+                step.method, _render(step.path, values), json=_render(step.json, values)
+            )
+            if response.status_code >= 400:
+                last_error = f"{response.status_code} {response.text[:200]}"
+                continue
+            created += 1
+            if step.save:
+                body = response.json()
+                for name, path in step.save.items():
+                    value = _lookup(body, path)
+                    if value is not None:
+                        self.pools.setdefault(name, []).append(value)
+        if step.count and not created:
+            raise BenchmarkError(
+                f"seed step {step.name!r}: every request failed (last: {last_error})"
+            )
+        return created
+
+    async def _load(self, client: Any) -> Dict[str, List[tuple]]:
+        """Per scenario, ``(latency, ok, stats)`` for every request after the warm-up."""
+        scenarios = self.profile.scenarios
+        weights = [s.weight for s in scenarios]
+        samples: Dict[str, List[tuple]] = {s.name: [] for s in scenarios}
+        started = time.perf_counter()
+        measure_from = started + self.profile.warmup_s
+        deadline = started + self.profile.duration_s
+
+        async def user() -> None:
+            while time.perf_counter() < deadline:
+                scenario = self.rng.choices(scenarios, weights)[0]
+                values = _Values(self.pools, self.rng)
+                path, body = _render(scenario.path, values), _render(scenario.json, values)
+                stats = _RequestStats()
+                token = _request.set(stats)
+                t0 = time.perf_counter()
+                try:
+                    response = await client.request(scenario.method, path, json=body)
+                    ok = response.status_code < 400
+                except Exception:  # an app crash is a failed request, not a failed benchmark
+                    ok = False
+                finally:
+                    _request.reset(token)
+                elapsed = time.perf_counter() - t0
+                if t0 >= measure_from:
+                    samples[scenario.name].append((elapsed, ok, stats))
+
+        await asyncio.gather(*(user() for _ in range(self.profile.users)))
+        return samples
+
+
+class _Values(dict):
+    """Template values; a saved variable is drawn at random on first use."""
+
+    def __init__(self, pools: Dict[str, List[Any]], rng: random.Random, **fixed: Any):
+        super().__init__(fixed)
+        self.pools = pools
+        self.rng = rng
+
+    def __missing__(self, key: str) -> Any:
+        numbered = _NUMBERED.match(key)
+        pool = self.pools.get(key) or (self.pools.get(numbered.group(1)) if numbered else None)
+        if not pool:
+            raise BenchmarkError(f"no seeded values for {{{key}}}")
+        value = self[key] = self.rng.choice(pool)
+        return value
+
+
+def _render(template: Any, values: _Values) -> Any:
+    if isinstance(template, str):
+        whole = _PLACEHOLDER.match(template)
+        # A lone placeholder keeps the value's type (e.g. integer IDs in JSON bodies)
+        return values[whole.group(1)] if whole else template.format_map(values)
+    if isinstance(template, dict):
+        return {k: _render(v, values) for k, v in template.items()}
+    if isinstance(template, list):
+        return [_render(v, values) for v in template]
+    return template
+
+
+def _natural_key(value: str) -> List[Any]:
+    """``NFR-3`` before ``NFR-21``."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", value)]
+
+
+def _lookup(body: Any, path: str) -> Any:
+    for key in path.split("."):
+        if not isinstance(body, dict):
+            return None
+        body = body.get(key)
+    return body
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+def _summarize(scenario: Scenario, samples: List[tuple], window: float) -> ScenarioResult:
+    result = ScenarioResult(scenario.name, tasks=scenario.tasks, requirements=scenario.requirements)
+    if not samples:
+        return result
+    latencies = sorted(s[0] * 1000 for s in samples)
+    queries = [s[2].queries for s in samples]
+    result.requests = len(samples)
+    result.errors = sum(1 for s in samples if not s[1])
+    result.p50_ms = round(_percentile(latencies, 50), 3)
+    result.p95_ms = round(_percentile(latencies, 95), 3)
+    result.p99_ms = round(_percentile(latencies, 99), 3)
+    result.mean_ms = round(sum(latencies) / len(latencies), 3)
+    result.throughput_rps = round(len(samples) / window, 3) if window > 0 else 0.0
+    result.queries_per_request = round(sum(queries) / len(queries), 3)
+    result.max_queries = max(queries)
+    result.db_ms_per_request = round(sum(s[2].db_time for s in samples) * 1000 / len(samples), 3)
+    return result
+
+
+def _full_scans(database: str, statements: Mapping[str, Any]) -> List[str]:
+    """
+    Tables read by a full scan in a filtered statement, or through an
+    index SQLite had to build on the fly: both mean a missing index.
+    Unfiltered scans (plain listings) are expected and not reported.
+    """
+    scans = set()
+    conn = sqlite3.connect(database)
+    try:
+        for statement, params in statements.items():
+            filtered = _FILTERED.search(statement) is not None
+            try:
+                plan = conn.execute(f"EXPLAIN QUERY PLAN {statement}", params or ()).fetchall()
+            except (sqlite3.Error, ValueError):
+                continue
+            for row in plan:
+                # "SCAN customers", "SEARCH accounts USING AUTOMATIC INDEX (...)";
+                # older SQLite versions add "TABLE"
+                words = [w for w in row[-1].split() if w != "TABLE"]
+                if len(words) < 2 or words[0] not in ("SCAN", "SEARCH"):
+                    continue
+                if "AUTOMATIC" in words or (
+                    filtered and words[0] == "SCAN" and "USING" not in words
+                ):
+                    scans.add(words[1])
+    finally:
+        conn.close()
+    return sorted(scans)
@@ -0,0 +1,389 @@
+"""
+Content-addressed task result cache (``docs/state/cache.db``).
+
+When a migration is restarted, tasks whose inputs did not change are
+restored from the cache instead of re-invoking their agent.
+
+- The cache key of a task is a hash of its definition (``description``,
+  ``deliverables``, ``acceptance_criteria``, ``test_strategy``) plus the
+  output hashes of its dependencies.
+- The output hash of a task is a hash of the contents of its
+  ``files_generated``. Changing a task therefore only misses for that task
+  and for the dependents whose inputs actually changed. If a re-run
+  produces identical files, the rest of the subgraph still hits.
+- Dependencies are the graph's edges: ``dependencies`` and
+  ``layer_dependencies``.
+- A result without ``files_generated`` has no output to hash, so it is
+  not cached and its dependents always run.
+- Hits restore the recorded files (stored as content-addressed blobs) and
+  the ``ExecutionMetrics`` of the original run.
+- Entries are evicted least-recently-used first once ``max_entries`` or
+  ``max_bytes`` is exceeded.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from migration_framework._sqlite import SQLiteDatabase, utc_now
+from migration_framework.graph import COMPLETED, TaskGraph, dependency_ids
+from migration_framework.scheduler import RunTask
+from migration_framework.telemetry import current_span
+
+DEFAULT_CACHE_PATH = "docs/state/cache.db"
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Task fields that define what an agent is asked to produce
+KEY_FIELDS = ("description", "deliverables", "acceptance_criteria", "test_strategy")
+
+_MISSING = "missing"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    output_hash TEXT NOT NULL,
+    execution_metrics TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_task ON entries (task_id, last_used);
+CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (last_used);
+CREATE TABLE IF NOT EXISTS entry_files (
+    key TEXT NOT NULL REFERENCES entries (key) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    PRIMARY KEY (key, path)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_files_blob ON entry_files (blob);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+"""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@dataclass
+class CachedResult:
+    """What a cache hit restores for a task."""
+
+    task_id: str
+    output_hash: str
+    files_generated: List[str] = field(default_factory=list)
+    execution_metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+class ResultCache(SQLiteDatabase):
+    """LRU, size-bounded store of task results keyed by task content."""
+
+    SCHEMA = _SCHEMA
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        root: Union[str, Path] = ".",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: float = 30.0,
+    ):
+        super().__init__(path, timeout)
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def task_key(task: Dict[str, Any], dependency_hashes: Dict[str, str]) -> str:
+        """Hash of the task definition plus its dependencies' output hashes."""
+        definition = {name: task.get(name) for name in KEY_FIELDS}
+        return _sha256(_canonical({"task": definition, "dependencies": dependency_hashes}))
+
+    def latest_output_hash(self, task_id: str) -> Optional[str]:
+        """Output hash recorded by the most recent entry of ``task_id``."""
+        row = (
+            self._conn()
+            .execute(
+                "SELECT output_hash FROM entries WHERE task_id = ? ORDER BY last_used DESC LIMIT 1",
+                (task_id,),
+            )
+            .fetchone()
+        )
+        return row["output_hash"] if row else None
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def peek(self, key: str) -> Optional[CachedResult]:
+        """Look up ``key`` without restoring files or touching LRU order."""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT task_id, output_hash, execution_metrics FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        files = [
+            r["path"]
+            for r in conn.execute(
+                "SELECT path FROM entry_files WHERE key = ? ORDER BY path", (key,)
+            )
+        ]
+        return CachedResult(
+            task_id=row["task_id"],
+            output_hash=row["output_hash"],
+            files_generated=files,
+            execution_metrics=json.loads(row["execution_metrics"]),
+        )
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Return the result cached under ``key`` and restore its files."""
+        result = self.peek(key)
+        if result is None:
+            return None
+        conn = self._conn()
+        for row in conn.execute(
+            "SELECT f.path, f.blob, b.data FROM entry_files f JOIN blobs b ON b.hash = f.blob"
+            " WHERE f.key = ?",
+            (key,),
+        ):
+            target = self.root / row["path"]
+            if target.is_file() and _sha256(target.read_bytes()) == row["blob"]:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(row["data"])
+        conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return result
+
+    def put(
+        self,
+        key: str,
+        task_id: str,
+        files_generated: Iterable[str],
+        execution_metrics: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Record a task result under ``key`` and return its output hash."""
+        files = sorted(set(files_generated))
+        blobs: Dict[str, Optional[bytes]] = {}
+        digests: Dict[str, str] = {}
+        for path in files:
+            target = self.root / path
+            data = target.read_bytes() if target.is_file() else None
+            digest = _sha256(data) if data is not None else _MISSING
+            digests[path] = digest
+            blobs[digest] = data
+        output_hash = _sha256(_canonical(digests))
+        size = sum(len(data) for data in blobs.values() if data is not None)
+
+        with self._write() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT INTO entries (key, task_id, output_hash, execution_metrics, size,"
+                " last_used, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    task_id,
+                    output_hash,
+                    json.dumps(execution_metrics or {}),
+                    size,
+                    time.time(),
+                    utc_now(),
+                ),
+            )
+            for digest, data in blobs.items():
+                if data is not None:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO blobs (hash, data) VALUES (?, ?)", (digest, data)
+                    )
+            conn.executemany(
+                "INSERT INTO entry_files (key, path, blob) VALUES (?, ?, ?)",
+                [(key, path, digest) for path, digest in digests.items()],
+            )
+            self._evict(conn)
+        return output_hash
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, task_ids: Iterable[str]) -> int:
+        """Drop every entry of ``task_ids``; their dependents miss on the next run."""
+        ids = list(task_ids)
+        with self._write() as conn:
+            removed = conn.executemany("DELETE FROM entries WHERE task_id = ?", [(t,) for t in ids])
+            count = removed.rowcount
+            self._drop_orphan_blobs(conn)
+        return count
+
+    def clear(self) -> None:
+        with self._write() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM blobs")
+
+    def stats(self) -> Dict[str, int]:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT COUNT(*) AS entries, COUNT(DISTINCT task_id) AS tasks,"
+                " COALESCE(SUM(size), 0) AS bytes FROM entries"
+            )
+            .fetchone()
+        )
+        return {"entries": row["entries"], "tasks": row["tasks"], "bytes": row["bytes"]}
+
+    def _evict(self, conn) -> None:
+        total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        count, size = total[0], total[1]
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        for row in conn.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (row["key"],))
+            count -= 1
+            size -= row["size"]
+        self._drop_orphan_blobs(conn)
+
+    @staticmethod
+    def _drop_orphan_blobs(conn) -> None:
+        conn.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT blob FROM entry_files)")
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def plan(self, graph: TaskGraph, misses: Iterable[str] = ()) -> Set[str]:
+        """
+        Return the IDs of the pending tasks of ``graph`` that would be cache hits.
+
+        A dependency that misses makes every task downstream of it miss too,
+        since its new output hash is unknown until it runs. Tasks in
+        ``misses`` are planned as misses without touching their entries
+        (:meth:`invalidate` drops them for good).
+        """
+        misses = set(misses)
+        outputs: Dict[str, Optional[str]] = {}
+        hits: Set[str] = set()
+        for tid in graph.order:
+            if graph.status[tid] == COMPLETED:
+                outputs[tid] = self.latest_output_hash(tid) or _MISSING
+                continue
+            if tid in misses:
+                outputs[tid] = None
+                continue
+            dep_hashes = {}
+            for dep in graph.dependencies[tid]:
+                dep_hash = outputs.get(dep)
+                if dep_hash is None:
+                    break
+                dep_hashes[dep] = dep_hash
+            else:
+                entry = self.peek(self.task_key(graph.tasks[tid], dep_hashes))
+                if entry is not None:
+                    outputs[tid] = entry.output_hash
+                    hits.add(tid)
+                    continue
+            outputs[tid] = None
+        return hits
+
+
+ResultOf = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class CachedRunner:
+    """
+    Wrap a scheduler ``run_task`` so unchanged tasks skip their agent.
+
+    On a hit the cached files and ``ExecutionMetrics`` are restored,
+    ``on_hit(task, result)`` is called (e.g. to mark the task completed in
+    the state store) and the agent is not invoked. On a miss ``run_task``
+    runs and, if it succeeds, ``result_of(task)`` supplies the task as the
+    agent left it, with the ``files_generated`` and ``execution_metrics``
+    to record - typically ``lambda task: store.get(task["id"])``.
+    """
+
+    def __init__(
+        self,
+        run_task: RunTask,
+        cache: ResultCache,
+        result_of: ResultOf,
+        on_hit: Optional[Callable[[Dict[str, Any], CachedResult], None]] = None,
+        enabled: bool = True,
+    ):
+        self.run_task = run_task
+        self.cache = cache
+        self.result_of = result_of
+        self.on_hit = on_hit
+        self.enabled = enabled
+        self.hits: List[str] = []
+        # None marks a task whose output could not be hashed in this run
+        self._outputs: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, task: Dict[str, Any]) -> Optional[bool]:
+        if not self.enabled:
+            return self.run_task(task)
+
+        dep_hashes = self._dependency_hashes(task)
+        if dep_hashes is None:
+            current_span().set(cache_hit=False)
+            return self._run_uncached(task)
+
+        key = self.cache.task_key(task, dep_hashes)
+        cached = self.cache.get(key)
+        current_span().set(cache_hit=cached is not None)
+        if cached is not None:
+            self._record(task["id"], cached.output_hash, hit=True)
+            if self.on_hit is not None:
+                self.on_hit(task, cached)
+            return True
+
+        outcome = self.run_task(task)
+        if outcome is False:
+            return outcome
+        result = self.result_of(task)
+        files = result.get("files_generated") or []
+        if not files:
+            self._record(task["id"], None, hit=False)
+            return outcome
+        output_hash = self.cache.put(key, task["id"], files, result.get("execution_metrics"))
+        self._record(task["id"], output_hash, hit=False)
+        return outcome
+
+    def _run_uncached(self, task: Dict[str, Any]) -> Optional[bool]:
+        # A dependency's output is unknown, so this task's cache key would be too
+        outcome = self.run_task(task)
+        self._record(task["id"], None, hit=False)
+        return outcome
+
+    def _dependency_hashes(self, task: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        hashes = {}
+        for dep in dependency_ids(task):
+            with self._lock:
+                ran, known = dep in self._outputs, self._outputs.get(dep)
+            if ran and known is None:
+                return None
+            hashes[dep] = known or self.cache.latest_output_hash(dep) or _MISSING
+        return hashes
+
+    def _record(self, task_id: str, output_hash: Optional[str], hit: bool) -> None:
+        with self._lock:
+            self._outputs[task_id] = output_hash
+            if hit:
+                self.hits.append(task_id)
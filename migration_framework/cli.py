@@ -0,0 +1,730 @@
+"""
+Command-line entry point: ``python -m migration_framework <command>``.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from migration_framework.assignment import (
+    DEFAULT_RULES_PATH,
+    AssignmentEngine,
+    AssignmentRuleError,
+    default_engine,
+)
+from migration_framework.benchmark import DEFAULT_BASELINE_PATH, DEFAULT_PROFILE_PATH
+from migration_framework.benchmark import DEFAULT_RESULTS_PATH as DEFAULT_BENCHMARK_PATH
+from migration_framework.benchmark import (
+    DEFAULT_TOLERANCE,
+    Benchmark,
+    BenchmarkError,
+    LoadProfile,
+    attribute,
+    compare,
+    default_profile,
+    load_run,
+)
+from migration_framework.cache import DEFAULT_CACHE_PATH, ResultCache
+from migration_framework.enrichment import (
+    DEFAULT_CHECKPOINT_PATH,
+    DEFAULT_CONCURRENCY,
+    EnrichmentPipeline,
+)
+from migration_framework.graph import DependencyGraphError, TaskGraph
+from migration_framework.loader import TaskLoader, TaskValidationError, collection_fields
+from migration_framework.scheduler import Scheduler
+from migration_framework.state_store import DEFAULT_DB_PATH, TaskStateStore
+from migration_framework.tasks import load_tasks
+from migration_framework.telemetry import (
+    DEFAULT_TELEMETRY_PATH,
+    Tracer,
+    build_report,
+    get_tracer,
+    parse_time_ns,
+    read_spans,
+    set_tracer,
+)
+from migration_framework.testrunner import (
+    DEFAULT_RESULTS_PATH,
+    DEFAULT_WORKERS,
+    PLAYWRIGHT,
+    PYTEST,
+    ShardedTestStage,
+    Suite,
+    SuiteError,
+)
+
+DEFAULT_TASKS_FILE = "docs/input/tasks.json"
+
+# Commands traced as a whole, with the framework phase they implement
+PHASES = {
+    "validate": "FASE 0: import & validation",
+    "assign": "Paso 0.4: agent assignment",
+    "enrich": "FASE 0.8: test strategies",
+}
+
+
+def _positive_int(value: str) -> int:
+    """``type=`` for worker and user counts: argparse reports bad values as usage errors."""
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return int(value)
+
+
+def _positive_float(value: str) -> float:
+    """``type=`` for durations in seconds."""
+    try:
+        number = float(value)
+    except ValueError:
+        number = 0.0
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value!r}")
+    return number
+
+
+def _role_workers(value: str) -> Tuple[str, int]:
+    """``type=`` for ``--role-workers ROLE=N``."""
+    role, sep, count = value.partition("=")
+    if not role or not sep or not count.isdigit() or int(count) < 1:
+        raise argparse.ArgumentTypeError(f"invalid value {value!r} (expected ROLE=N, N >= 1)")
+    return role, int(count)
+
+
+def _format_minutes(minutes: float) -> str:
+    hours, mins = divmod(int(round(minutes)), 60)
+    return f"{hours}h {mins:02d}m"
+
+
+def cmd_schedule(args: argparse.Namespace) -> int:
+    tasks = load_tasks(*args.tasks)
+    scheduler = Scheduler(
+        tasks,
+        workers_per_role=dict(args.role_workers),
+        default_workers=args.workers,
+    )
+    cached = set()
+    if not args.no_cache and Path(args.cache).exists():
+        # A dry-run: forced misses are only planned, "cache invalidate" deletes them
+        cached = ResultCache(args.cache).plan(scheduler.graph, misses=args.invalidate)
+    schedule = scheduler.dry_run(cached=cached)
+
+    sequential = schedule.sequential_time
+    makespan = schedule.makespan
+    speedup = sequential / makespan if makespan else 1.0
+    tasks_per_role = Counter(scheduler.roles.values())
+
+    print("📅 PLAN DE EJECUCIÓN (dry-run)")
+    print("━" * 41)
+    print(f"Tareas pendientes: {len(scheduler.tasks)}")
+    if cached:
+        print(f"Tareas en caché:   {len(cached)} (no se invoca al agente)")
+    print(f"Makespan proyectado: {_format_minutes(makespan)}")
+    print(f"Tiempo secuencial:   {_format_minutes(sequential)}")
+    print(f"Speedup:             {speedup:.2f}x")
+    print("\n🤖 Workers por agente:")
+    for role, count in sorted(tasks_per_role.items()):
+        print(f"   • {role}: {scheduler.workers_for(role)} workers, {count} tareas")
+    print(f"\n🎯 Ruta crítica ({len(schedule.critical_path)} tareas):")
+    print("   " + " → ".join(schedule.critical_path))
+
+    if args.verbose:
+        print("\n⏱️  Cronograma:")
+        for outcome in sorted(schedule.outcomes.values(), key=lambda o: (o.start, o.task_id)):
+            print(
+                f"   {outcome.task_id:<10} {outcome.role:<22} "
+                f"{_format_minutes(outcome.start)} → {_format_minutes(outcome.end)}"
+            )
+    return 0
+
+
+def cmd_assign(args: argparse.Namespace) -> int:
+    engine = AssignmentEngine.from_file(args.rules) if args.rules else default_engine()
+    decisions = engine.classify_all(load_tasks(*args.tasks))
+
+    print(f"🤖 ASIGNACIÓN DE AGENTES ({len(decisions)} tareas, {len(engine.rules)} reglas)")
+    print("━" * 41)
+    for agent, count in sorted(Counter(d.agent for d in decisions).items()):
+        print(f"   • {agent}: {count} tareas")
+    print("\n📏 Reglas aplicadas:")
+    for rule, count in Counter(d.rule or "(default)" for d in decisions).most_common():
+        print(f"   • {rule}: {count}")
+
+    if args.explain:
+        print("\n🔎 Decisiones:")
+        for decision in decisions:
+            print(f"   {decision.explain()}")
+    return 0
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    cache = ResultCache(args.cache)
+
+    if args.action == "stats":
+        stats = cache.stats()
+        print(
+            f"🗄️  {stats['entries']} entradas, {stats['tasks']} tareas,"
+            f" {stats['bytes'] / 1024:.1f} KB"
+        )
+    elif args.action == "invalidate":
+        removed = cache.invalidate(args.task_ids)
+        print(f"🧹 {removed} entradas invalidadas ({', '.join(args.task_ids)})")
+    elif args.action == "clear":
+        cache.clear()
+        print("🧹 Caché vaciada")
+    return 0
+
+
+def cmd_enrich(args: argparse.Namespace) -> int:
+    checkpoint = Path(args.checkpoint)
+    if args.fresh and checkpoint.exists():
+        checkpoint.unlink()
+
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    if args.db:
+        store = TaskStateStore(args.db)
+        tasks = store.tasks()
+
+        def save_strategy(task_id: str, strategy: Dict[str, Any]) -> None:
+            store.update(task_id, test_strategy=strategy)
+
+        on_result = save_strategy
+    else:
+        tasks = load_tasks(*args.tasks)
+
+    pipeline = EnrichmentPipeline(
+        tasks, concurrency=args.concurrency, checkpoint=checkpoint, on_result=on_result
+    )
+    results = pipeline.run()
+
+    if not args.db:
+        for task in tasks:
+            if task["id"] in results:
+                task["test_strategy"] = results[task["id"]]
+        # Keep project_name, framework_version, summary... of a TaskCollection input
+        collection = collection_fields(args.tasks[0])
+        payload = {**collection, "total_tasks": len(tasks), "tasks": tasks}
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    generated = len(results) - len(pipeline.resumed)
+    print(
+        f"🧪 Test strategies: {generated} generadas ({pipeline.generated} llamadas al generador),"
+        f" {len(pipeline.resumed)} reanudadas del checkpoint"
+    )
+    for task_id, error in sorted(pipeline.errors.items()):
+        print(f"   ❌ {task_id}: {error}")
+    return 1 if pipeline.errors else 0
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    loader = TaskLoader(args.tasks)
+    valid = list(loader)
+    issues = [str(issue) for issue in loader.errors]
+    # Tasks that failed field validation still take part in the cycle check
+    checked = [t for t in valid + loader.rejected if isinstance(t.get("id"), str)]
+    known = {task["id"] for task in checked}
+    edges = [_dependency_edges(task, known) for task in checked]
+    try:
+        TaskGraph(edges, weight=lambda task: 0.0, role_of=lambda task: "")
+    except DependencyGraphError as exc:
+        issues.extend(exc.issues)
+    if issues:
+        print(f"❌ {len(issues)} errores de validación:")
+        for issue in issues:
+            print(f"   • {issue}")
+        return 1
+    print(f"✅ {len(valid)} tareas válidas ({len(args.tasks)} archivos)")
+    return 0
+
+
+def _dependency_edges(task: Dict[str, Any], known: Set[str]) -> Dict[str, Any]:
+    """Only the dependency fields of ``task``, minus the ones the loader already reported."""
+    dependencies = task.get("dependencies")
+    layer_dependencies = task.get("layer_dependencies", task.get("layerDependencies"))
+    return {
+        "id": task["id"],
+        "dependencies": [
+            dep
+            for dep in (dependencies if isinstance(dependencies, list) else [])
+            if isinstance(dep, str) and dep in known and dep != task["id"]
+        ],
+        "layer_dependencies": layer_dependencies if isinstance(layer_dependencies, dict) else {},
+    }
+
+
+def cmd_state(args: argparse.Namespace) -> int:
+    store = TaskStateStore(args.db)
+
+    if args.action == "import":
+        written = store.import_tasks(load_tasks(*args.tasks), replace=args.replace)
+        print(f"📥 {written} tareas importadas en {args.db}")
+    elif args.action == "export":
+        store.export_json(args.output, framework_version="4.3")
+        print(f"💾 Estado exportado: {args.output}")
+    elif args.action == "claim":
+        if not store.claim(args.task_id, args.agent):
+            print(f"⏭️  {args.task_id} ya fue reclamada por otro agente")
+            return 1
+        print(f"✅ {args.task_id} reclamada por {args.agent}")
+    elif args.action == "claim-next":
+        task = store.claim_next(args.agent, implementation_layer=args.layer, role=args.agent)
+        if task is None:
+            return 1
+        print(json.dumps(task, indent=2, ensure_ascii=False))
+    elif args.action == "update":
+        changes = {"status": args.status} if args.status else {}
+        changes.update(json.loads(args.set) if args.set else {})
+        if not store.update(args.task_id, agent=args.agent, **changes):
+            print(f"❌ {args.task_id} no pertenece a {args.agent}")
+            return 1
+        print(f"✅ {args.task_id} actualizada")
+    return 0
+
+
+def cmd_tests(args: argparse.Namespace) -> int:
+    suites = []
+    if not args.only or args.only == PYTEST:
+        suites.append(Suite("backend", PYTEST, args.backend, args.backend_tests))
+    if not args.only or args.only == PLAYWRIGHT:
+        suites.append(Suite("e2e", PLAYWRIGHT, args.frontend, args.e2e_tests))
+    suites = [s for s in suites if s.root.is_dir()]
+    if not suites:
+        print(f"❌ No se encontró {args.backend}/ ni {args.frontend}/")
+        return 1
+
+    report = ShardedTestStage(suites, workers=args.workers, state_path=args.state).run(
+        full=args.full
+    )
+
+    full = all(run.full for run in report.runs.values())
+    scope = "suite completa" if full else f"{len(report.changed_files)} archivos cambiados"
+    print(f"🧪 TESTS ({scope})")
+    print("━" * 41)
+    for name, run in report.runs.items():
+        totals = report.totals[name]
+        scope = "completa" if run.full else f"{len(run.selected)} archivos/tests"
+        print(
+            f"   • {name} ({run.runner}): {scope} en {run.shards} shards,"
+            f" {_format_seconds(run.duration)}"
+            f" → {totals['passed']} ✅ {totals['failed']} ❌ {totals['skipped']} ⏭️"
+        )
+        for test_id in run.failed[: None if args.verbose else 10]:
+            print(f"      ❌ {test_id}")
+    metrics = report.metrics()
+    print("\n📈 ExecutionMetrics: " + ", ".join(f"{k}={v}" for k, v in metrics.items()))
+
+    if args.task:
+        store = TaskStateStore(args.db)
+        task = store.get(args.task)
+        store.update(
+            args.task, execution_metrics={**(task.get("execution_metrics") or {}), **metrics}
+        )
+        print(f"💾 Métricas guardadas en {args.task}")
+    return 0 if report.success else 1
+
+
+def cmd_benchmark(args: argparse.Namespace) -> int:
+    profile = LoadProfile.from_file(args.profile) if args.profile else default_profile()
+    profile.app = args.app or profile.app
+    profile.users = args.users or profile.users
+    profile.duration_s = args.duration or profile.duration_s
+    profile.check()
+    task_files = [p for p in args.tasks if Path(p).exists()]
+    if task_files:
+        attribute(profile.scenarios, TaskLoader(task_files))
+
+    run = Benchmark(profile, args.backend, database_url=args.database_url).run()
+    seeded = ", ".join(f"{n} {name}" for name, n in run.seeded.items())
+    print(f"⚡ BENCHMARK ({run.database}, {run.users} usuarios, {_format_seconds(run.duration_s)})")
+    print("━" * 41)
+    if seeded:
+        print(f"🌱 Datos sintéticos: {seeded}")
+    print(
+        f"   {'escenario':<22} {'req':>6} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8}"
+        f" {'req/s':>7} {'queries':>7}"
+    )
+    for result in run.scenarios.values():
+        print(
+            f"   {result.name:<22} {result.requests:>6} {result.errors:>5} {result.p50_ms:>6.1f}ms"
+            f" {result.p95_ms:>6.1f}ms {result.p99_ms:>6.1f}ms {result.throughput_rps:>7.1f}"
+            f" {result.queries_per_request:>7.1f}"
+        )
+    print(f"   Total: {run.throughput_rps:.1f} req/s")
+    scans = {name: r.full_scans for name, r in run.scenarios.items() if r.full_scans}
+    if scans:
+        print("\n🐌 Full scans filtrados (¿falta un índice?):")
+        for name, tables in scans.items():
+            print(f"   • {name}: {', '.join(tables)}")
+
+    baseline = load_run(args.baseline)
+    slos = {s.name: s.slo for s in profile.scenarios if s.slo}
+    regressions = compare(run, baseline, slos, tolerance=args.tolerance)
+    run.save(args.output)
+    # An empty run would disable every later comparison if it became the baseline
+    unmeasured = [name for name, result in run.scenarios.items() if not result.requests]
+    if unmeasured:
+        print(f"\n❌ Sin peticiones medidas tras el warm-up: {', '.join(unmeasured)}")
+        print("   Baseline no guardado; aumenta --duration")
+        return 1
+    if regressions:
+        print(f"\n❌ REGRESIONES ({len(regressions)}):")
+        for regression in regressions:
+            print(f"   • {regression.describe()}")
+    elif baseline is not None:
+        print(f"\n✅ Sin regresiones respecto al baseline del {baseline.started_at}")
+    if baseline is None or args.save_baseline:
+        run.save(args.baseline)
+        print(f"📌 Baseline guardado en {args.baseline}")
+    # --save-baseline accepts the new numbers; SLOs still apply
+    failing = [r for r in regressions if r.slo or not args.save_baseline]
+    return 1 if failing else 0
+
+
+def cmd_telemetry(args: argparse.Namespace) -> int:
+    if args.action == "run":
+        return _telemetry_run(args)
+    if args.action == "import-progress":
+        return _telemetry_import(args)
+
+    if not Path(args.file).exists():
+        print(f"❌ {args.file} no existe (activa la telemetría con --telemetry)")
+        return 1
+    report = build_report(read_spans(args.file), trace_id=args.trace)
+    print(
+        f"📊 TELEMETRÍA ({len(report.tasks)} tareas, {_format_seconds(report.wall_time)} de reloj)"
+    )
+    print("━" * 41)
+    if report.phases:
+        print("⏱️  Fases:")
+        for phase in report.phases:
+            mark = "✅" if phase["status"] == "ok" else "❌"
+            print(f"   {mark} {phase['name']:<36} {_format_seconds(phase['duration'])}")
+    if report.levels:
+        print("\n📶 Niveles de ejecución:")
+        for level, stats in sorted(report.levels.items()):
+            print(
+                f"   Nivel {level}: {stats['tasks']} tareas, "
+                f"{_format_seconds(stats['end'] - stats['start'])} de reloj"
+            )
+    if report.critical_path:
+        total = sum(report.tasks[tid].duration for tid in report.critical_path)
+        print(
+            f"\n🎯 Ruta crítica observada ({len(report.critical_path)} tareas,"
+            f" {_format_seconds(total)}):"
+        )
+        print("   " + " → ".join(report.critical_path))
+    if report.utilization:
+        print("\n🤖 Utilización por agente:")
+        for agent, usage in sorted(report.utilization.items()):
+            print(
+                f"   • {agent:<22} {usage['utilization']:>6.1%} "
+                f"({_format_seconds(usage['busy'])} ocupado, {usage['workers']} workers)"
+            )
+    slowest = report.slowest(args.top)
+    if slowest:
+        print(f"\n🐢 Tareas más lentas (top {len(slowest)}):")
+        for timing in slowest:
+            extras = [f"espera {_format_seconds(timing.queue_wait)}"]
+            if timing.status != "ok":
+                extras.append("❌ fallida")
+            if timing.retries:
+                extras.append(f"{timing.retries} reintentos")
+            if timing.tokens:
+                extras.append(f"{timing.tokens} tokens")
+            if timing.test_runtime:
+                extras.append(f"tests {_format_seconds(timing.test_runtime)}")
+            print(
+                f"   {timing.task_id:<10} {timing.agent:<22} "
+                f"{_format_seconds(timing.duration):>9}  ({', '.join(extras)})"
+            )
+    return 0
+
+
+def _telemetry_run(args: argparse.Namespace) -> int:
+    """Run a command (smoke tests, E2E suite...) as a traced phase."""
+    command = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+    if not command:
+        print("❌ falta el comando a ejecutar")
+        return 2
+    tracer = get_tracer()
+    if not tracer.enabled:
+        tracer = Tracer(args.file)
+    # Framework commands run inside the phase join the same trace
+    env = dict(os.environ, MIGRATION_TELEMETRY=str(tracer.path), MIGRATION_TRACE_ID=tracer.trace_id)
+    with tracer.span(args.phase, kind="phase", command=" ".join(command)) as span:
+        started = time.perf_counter()
+        code = subprocess.call(command, env=env)
+        span.set(exit_code=code, test_runtime_s=time.perf_counter() - started)
+        if code != 0:
+            span.fail(f"exit code {code}")
+    tracer.close()
+    return code
+
+
+def _telemetry_import(args: argparse.Namespace) -> int:
+    """Turn agent progress files (agent-progress-schema.ts) into agent spans."""
+    tracer = get_tracer()
+    if not tracer.enabled:
+        tracer = Tracer(args.file)
+    imported = 0
+    for path in args.progress:
+        progress = json.loads(Path(path).read_text(encoding="utf-8"))
+        for entry in progress.get("tasks", []):
+            if not entry.get("started_at") or not entry.get("completed_at"):
+                continue
+            tracer.record(
+                f"{entry.get('owner', progress.get('agent_name'))} {entry['task_id']}",
+                "agent",
+                parse_time_ns(entry["started_at"]),
+                parse_time_ns(entry["completed_at"]),
+                status="error" if entry.get("status") == "failed" else "ok",
+                task_id=entry["task_id"],
+                agent=entry.get("owner") or progress.get("agent_name"),
+                tests=entry.get("test_count"),
+                test_failures=entry.get("test_failures"),
+            )
+            imported += 1
+    tracer.close()
+    print(f"📥 {imported} tareas importadas de {len(args.progress)} archivos de progreso")
+    return 0
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    return _format_minutes(seconds / 60)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m migration_framework",
+        description="Migration Framework v4.3 orchestrator tooling",
+    )
+    parser.add_argument(
+        "--telemetry",
+        nargs="?",
+        const=DEFAULT_TELEMETRY_PATH,
+        metavar="PATH",
+        help=f"record telemetry spans (default file: {DEFAULT_TELEMETRY_PATH})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schedule = commands.add_parser("schedule", help="project the parallel execution plan (dry-run)")
+    schedule.add_argument(
+        "--tasks", nargs="+", default=[DEFAULT_TASKS_FILE], help="tasks JSON file(s)"
+    )
+    schedule.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="concurrent tasks per agent role (default: 1)",
+    )
+    schedule.add_argument(
+        "--role-workers",
+        type=_role_workers,
+        action="append",
+        default=[],
+        metavar="ROLE=N",
+        help="override the worker count of one agent role (repeatable)",
+    )
+    schedule.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="result cache path")
+    schedule.add_argument(
+        "--no-cache", action="store_true", help="ignore the result cache (every task runs)"
+    )
+    schedule.add_argument(
+        "--invalidate",
+        action="append",
+        default=[],
+        metavar="TASK-xxx",
+        help="plan a task as a cache miss, keeping its entry (repeatable)",
+    )
+    schedule.add_argument("-v", "--verbose", action="store_true", help="print the full timeline")
+    schedule.set_defaults(func=cmd_schedule)
+
+    assign = commands.add_parser("assign", help="auto-assign agents to tasks (Paso 0.4)")
+    assign.add_argument(
+        "--tasks", nargs="+", default=[DEFAULT_TASKS_FILE], help="tasks JSON file(s)"
+    )
+    assign.add_argument(
+        "--rules", help=f"assignment rules JSON (default: {DEFAULT_RULES_PATH} if present)"
+    )
+    assign.add_argument("--explain", action="store_true", help="print the rule behind each task")
+    assign.set_defaults(func=cmd_assign)
+
+    cache = commands.add_parser("cache", help="inspect or invalidate the result cache")
+    cache.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="result cache path")
+    cache_actions = cache.add_subparsers(dest="action", required=True)
+    cache_actions.add_parser("stats", help="show cache size")
+    cache_invalidate = cache_actions.add_parser(
+        "invalidate", help="drop the cached results of tasks (dependents re-run as needed)"
+    )
+    cache_invalidate.add_argument("task_ids", nargs="+", metavar="TASK-xxx")
+    cache_actions.add_parser("clear", help="drop every entry")
+    cache.set_defaults(func=cmd_cache)
+
+    enrich = commands.add_parser(
+        "enrich", help="add test strategies to implementation tasks (FASE 0.8)"
+    )
+    enrich.add_argument(
+        "--tasks", nargs="+", default=["docs/state/tasks.json"], help="tasks JSON file(s)"
+    )
+    enrich.add_argument("--output", default="docs/state/tasks.json", help="enriched tasks.json")
+    enrich.add_argument(
+        "--db", help="enrich the state store in place instead of JSON files (per-task writes)"
+    )
+    enrich.add_argument("--concurrency", type=_positive_int, default=DEFAULT_CONCURRENCY)
+    enrich.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT_PATH, help="resume log")
+    enrich.add_argument("--fresh", action="store_true", help="ignore the existing checkpoint")
+    enrich.set_defaults(func=cmd_enrich)
+
+    validate = commands.add_parser(
+        "validate", help="check task files and report every error in one pass"
+    )
+    validate.add_argument(
+        "tasks", nargs="*", default=[DEFAULT_TASKS_FILE], help="tasks JSON file(s)"
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    state = commands.add_parser("state", help="manage the task state store")
+    state.add_argument("--db", default=DEFAULT_DB_PATH, help="state database path")
+    actions = state.add_subparsers(dest="action", required=True)
+
+    state_import = actions.add_parser("import", help="load tasks into the store")
+    state_import.add_argument(
+        "--tasks", nargs="+", default=[DEFAULT_TASKS_FILE], help="tasks JSON file(s)"
+    )
+    state_import.add_argument(
+        "--replace", action="store_true", help="overwrite tasks that already exist"
+    )
+
+    state_export = actions.add_parser("export", help="write tasks.json from the store")
+    state_export.add_argument("--output", default="docs/state/tasks.json")
+
+    state_claim = actions.add_parser("claim", help="claim a task (exit 1 if already owned)")
+    state_claim.add_argument("task_id")
+    state_claim.add_argument("agent")
+
+    state_claim_next = actions.add_parser(
+        "claim-next", help="claim the agent's next ready task (dependencies completed)"
+    )
+    state_claim_next.add_argument("agent")
+    state_claim_next.add_argument("--layer", help="only tasks of this implementation_layer")
+
+    state_update = actions.add_parser("update", help="update a task's fields")
+    state_update.add_argument("task_id")
+    state_update.add_argument("--agent", help="require this agent to own the task")
+    state_update.add_argument("--status", help="new status")
+    state_update.add_argument("--set", help="extra fields as a JSON object")
+
+    state.set_defaults(func=cmd_state)
+
+    tests = commands.add_parser(
+        "tests", help="run pytest/Playwright in shards, re-running only failed and affected tests"
+    )
+    tests.add_argument("--backend", default="backend", help="pytest root directory")
+    tests.add_argument(
+        "--backend-tests", default="tests", help="pytest tests, relative to --backend"
+    )
+    tests.add_argument("--frontend", default="frontend", help="Playwright root directory")
+    tests.add_argument(
+        "--e2e-tests", default="tests/e2e", help="Playwright specs, relative to --frontend"
+    )
+    tests.add_argument("--only", choices=[PYTEST, PLAYWRIGHT], help="run a single runner")
+    tests.add_argument(
+        "--workers", type=_positive_int, default=DEFAULT_WORKERS, help="shards per suite"
+    )
+    tests.add_argument(
+        "--full", action="store_true", help="ignore previous results and run everything"
+    )
+    tests.add_argument("--state", default=DEFAULT_RESULTS_PATH, help="test results state file")
+    tests.add_argument("--task", help="store the metrics in this task's execution_metrics")
+    tests.add_argument("--db", default=DEFAULT_DB_PATH, help="state database path (with --task)")
+    tests.add_argument("-v", "--verbose", action="store_true", help="list every failing test")
+    tests.set_defaults(func=cmd_tests)
+
+    bench = commands.add_parser(
+        "benchmark", help="load-test the generated backend and compare it with the baseline"
+    )
+    bench.add_argument("--backend", default="backend", help="directory containing the app package")
+    bench.add_argument("--app", help="ASGI app as module:attr (default: app.main:app)")
+    bench.add_argument(
+        "--profile", help=f"load profile JSON (default: {DEFAULT_PROFILE_PATH} if present)"
+    )
+    bench.add_argument(
+        "--database-url",
+        help="database URL instead of a throwaway SQLite file (e.g. local Postgres)",
+    )
+    bench.add_argument("--users", type=_positive_int, help="concurrent virtual users")
+    bench.add_argument(
+        "--duration", type=_positive_float, help="load duration in seconds, warm-up included"
+    )
+    bench.add_argument(
+        "--tasks",
+        nargs="+",
+        default=[DEFAULT_TASKS_FILE],
+        help="tasks JSON file(s), to attribute regressions to tasks and NFRs",
+    )
+    bench.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline results file")
+    bench.add_argument("--output", default=DEFAULT_BENCHMARK_PATH, help="results of this run")
+    bench.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed relative slowdown (0.2 = 20%%)",
+    )
+    bench.add_argument(
+        "--save-baseline", action="store_true", help="accept this run as the new baseline"
+    )
+    bench.set_defaults(func=cmd_benchmark)
+
+    telemetry = commands.add_parser("telemetry", help="report or record run telemetry")
+    telemetry.add_argument("--file", default=DEFAULT_TELEMETRY_PATH, help="telemetry JSONL file")
+    telemetry_actions = telemetry.add_subparsers(dest="action", required=True)
+    telemetry_report = telemetry_actions.add_parser(
+        "report", help="critical path, agent utilization and slowest tasks"
+    )
+    telemetry_report.add_argument("--trace", help="trace ID (default: the most recent run)")
+    telemetry_report.add_argument("--top", type=int, default=10, help="slowest tasks to list")
+    telemetry_run = telemetry_actions.add_parser(
+        "run", help="run a command as a traced phase (e.g. smoke or E2E tests)"
+    )
+    telemetry_run.add_argument("--phase", required=True, help='phase name, e.g. "FASE 4: smoke"')
+    telemetry_run.add_argument("cmd", nargs=argparse.REMAINDER, help="-- command to run")
+    telemetry_import = telemetry_actions.add_parser(
+        "import-progress", help="import agent progress files as agent spans"
+    )
+    telemetry_import.add_argument("progress", nargs="+", help="agent progress JSON file(s)")
+    telemetry.set_defaults(func=cmd_telemetry)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.telemetry:
+        set_tracer(Tracer(args.telemetry))
+    tracer = get_tracer()
+    try:
+        if args.command in PHASES:
+            with tracer.span(PHASES[args.command], kind="phase") as span:
+                code = args.func(args)
+                if code:
+                    span.fail(f"exit code {code}")
+                return code
+        return args.func(args)
+    except (
+        TaskValidationError,
+        DependencyGraphError,
+        AssignmentRuleError,
+        BenchmarkError,
+        SuiteError,
+    ) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
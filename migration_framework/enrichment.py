@@ -0,0 +1,489 @@
+"""
+Test-strategy enrichment (FASE 0.8).
+
+Adds a ``TestStrategy`` (``docs/schemas/tasks-schema.ts``) to every
+``implementation`` task:
+
+- Strategies are generated by a pool of asyncio workers with bounded
+  concurrency. The generator may be a plain function or a coroutine
+  (e.g. an LLM call).
+- The test-file layout depends only on the task's structure (layer, type
+  and deliverable path patterns). The generator is called once per
+  structure with a template task (``{i}`` placeholders instead of names);
+  each task gets a copy with its own names filled in, plus one case per
+  acceptance criterion.
+- Each finished strategy is appended to a JSONL checkpoint right away. A
+  crashed run resumes where it stopped; tasks whose definition changed
+  are regenerated.
+- Finished strategies are published as they arrive.
+  :meth:`EnrichmentPipeline.gate` lets the scheduler start a task as soon
+  as its own strategy is ready, without waiting for the whole batch. A
+  task whose strategy cannot be produced or published is released with an
+  error, never left waiting.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union, cast
+
+from migration_framework.graph import DependencyGraphError, TaskGraph
+from migration_framework.scheduler import RunTask
+
+DEFAULT_CHECKPOINT_PATH = "docs/state/test-strategies.jsonl"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_COVERAGE_TARGET = 0.90
+
+Strategy = Dict[str, Any]
+Generator = Callable[[Dict[str, Any]], Union[Strategy, Awaitable[Strategy]]]
+# A template task and the (task, names) pairs that share its layout
+_Group = Tuple[Dict[str, Any], List[Tuple[Dict[str, Any], Tuple[str, ...]]]]
+
+# Task fields that, when changed, invalidate a checkpointed strategy
+FINGERPRINT_FIELDS = (
+    "description",
+    "deliverables",
+    "acceptance_criteria",
+    "implementation_layer",
+    "type",
+)
+
+_PLACEHOLDER = re.compile(r"\{\d+\}")
+# ``{i}`` fills in a name as-is, ``{i:slug}`` as it would appear in a test name
+_FILL_PLACEHOLDER = re.compile(r"\{(\d+)(:slug)?\}")
+
+# File names that say nothing about what they hold: the folder names them instead
+_GENERIC_STEMS = {"page", "index", "layout", "route", "__init__", "main"}
+
+_SCENARIO_KEYWORDS = (
+    ("error_case", ("error", "invalid", "fail", "reject", "denied", "unauthorized", "not found")),
+    ("boundary", ("limit", "maximum", "minimum", "max ", "min ", "at least", "at most", "between")),
+    ("edge_case", ("empty", "duplicate", "concurrent", "timeout", "null", "missing")),
+    ("business_rule", ("must", "only", "rule", "cannot", "should not", "required")),
+)
+
+
+# ----------------------------------------------------------------------
+# Strategy generation
+# ----------------------------------------------------------------------
+
+
+def structural_signature(task: Dict[str, Any]) -> Tuple[Tuple[Any, ...], Tuple[str, ...]]:
+    """
+    Split a task into its structure and the names that fill it in.
+
+    Returns ``(signature, names)``. ``signature`` holds the layer, the type
+    and every deliverable with its naming segment replaced by ``{i}``.
+    ``names`` holds the values that were replaced.
+    """
+    patterns: List[str] = []
+    names: List[str] = []
+    for deliverable in task.get("deliverables") or []:
+        path = PurePosixPath(deliverable)
+        if not path.suffix:
+            patterns.append(deliverable)
+            continue
+        placeholder = "{%d}" % len(names)
+        if path.stem in _GENERIC_STEMS and path.parent.name:
+            names.append(path.parent.name)
+            patterns.append(str(path.parent.parent / placeholder / path.name))
+        else:
+            names.append(path.stem)
+            patterns.append(str(path.parent / (placeholder + path.suffix)))
+    signature = (task.get("implementation_layer"), task.get("type"), tuple(patterns))
+    return signature, tuple(names)
+
+
+@lru_cache(maxsize=4096)
+def _layout_template(signature: Tuple[Any, ...]) -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    """Test files for a task structure, as ``(kind, file_path, requirements)`` templates."""
+    _, _, patterns = signature
+    specs: List[Tuple[str, str, Tuple[str, ...]]] = []
+    for pattern in patterns:
+        match = _PLACEHOLDER.search(pattern)
+        if match is None:
+            continue
+        placeholder = match.group(0)
+        parts = set(PurePosixPath(pattern).parts)
+        suffix = PurePosixPath(pattern).suffix
+        if "tests" in parts or ".spec." in pattern or ".test." in pattern:
+            continue  # the deliverable is already a test
+        if suffix == ".py":
+            if parts & {"api", "routers", "endpoints"}:
+                specs.append(
+                    (
+                        "integration",
+                        f"tests/integration/api/test_{placeholder}.py",
+                        ("test_database", "api_client"),
+                    )
+                )
+            elif parts & {"models", "repositories", "db", "infrastructure"}:
+                specs.append(
+                    ("integration", f"tests/integration/test_{placeholder}.py", ("test_database",))
+                )
+            elif "domain" in parts:
+                specs.append(("unit", f"tests/unit/domain/test_{placeholder}.py", ()))
+            else:
+                area = "application" if parts & {"use_cases", "application", "services"} else "core"
+                specs.append(("unit", f"tests/unit/{area}/test_{placeholder}.py", ("Repository",)))
+        elif suffix in (".ts", ".tsx"):
+            if pattern.endswith("/page.tsx"):
+                specs.append(("e2e", f"tests/e2e/{placeholder}.spec.ts", (placeholder,)))
+            else:
+                specs.append(("unit", f"tests/unit/frontend/{placeholder}.test.tsx", ()))
+    return tuple(specs)
+
+
+def _scenario(criterion: str) -> str:
+    text = criterion.lower()
+    for scenario, keywords in _SCENARIO_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            return scenario
+    return "happy_path"
+
+
+def _slug(text: str, limit: int = 60) -> str:
+    # Placeholders of template tasks survive, so names can be filled in later
+    slug = re.sub(
+        r"\{(\d+)(?::slug)?\}|[^a-z0-9]+",
+        lambda m: "{%s:slug}" % m.group(1) if m.group(1) else "_",
+        text.lower(),
+    )
+    return re.sub(r"\{[^}]*$", "", slug.strip("_")[:limit]).rstrip("_")
+
+
+def _test_case(name: str, scenario: str, description: str, subject: str) -> Dict[str, str]:
+    return {
+        "name": name,
+        "scenario": scenario,
+        "description": description,
+        "arrange": f"Set up {subject} with the data required by: {description}",
+        "act": f"Exercise {subject}",
+        "assert": description,
+    }
+
+
+def _subject(file_path: str) -> str:
+    """What a test file exercises: ``tests/unit/test_customer.py`` → ``customer``."""
+    return _slug(PurePosixPath(file_path).name.split(".")[0].replace("test_", "", 1))
+
+
+def layout_strategy(task: Dict[str, Any]) -> Strategy:
+    """Build the ``TestStrategy`` of a task's deliverables, without acceptance criteria."""
+    signature, names = structural_signature(task)
+    buckets: Dict[str, List[Dict[str, Any]]] = {"unit": [], "integration": [], "e2e": []}
+
+    for kind, path_template, requirements in _layout_template(signature):
+        subject = path_template
+        for i, name in enumerate(names):
+            subject = subject.replace("{%d}" % i, name)
+            requirements = tuple(r.replace("{%d}" % i, name) for r in requirements)
+        stem = _subject(subject)
+        spec: Dict[str, Any] = {
+            "file_path": subject,
+            "test_cases": [
+                _test_case(
+                    f"test_{stem}_happy_path", "happy_path", f"{stem} works with valid input", stem
+                )
+            ],
+        }
+        key = {
+            "unit": "mocks_required",
+            "integration": "dependencies_required",
+            "e2e": "pages_involved",
+        }[kind]
+        spec[key] = list(requirements)
+        buckets[kind].append(spec)
+
+    strategy: Strategy = {
+        "unit_tests": buckets["unit"],
+        "integration_tests": buckets["integration"],
+        "coverage_target": DEFAULT_COVERAGE_TARGET,
+    }
+    if buckets["e2e"]:
+        strategy["e2e_tests"] = buckets["e2e"]
+    return strategy
+
+
+def add_acceptance_cases(strategy: Strategy, criteria: Iterable[str]) -> Strategy:
+    """Turn acceptance criteria into cases of the most specific spec available."""
+    specs = [strategy.get(key) or [] for key in ("unit_tests", "integration_tests", "e2e_tests")]
+    target = next((specs_of_kind[0] for specs_of_kind in specs if specs_of_kind), None)
+    if target is not None:
+        subject = _subject(target.get("file_path") or "")
+        cases = target.setdefault("test_cases", [])
+        for criterion in criteria:
+            cases.append(
+                _test_case(f"test_{_slug(criterion)}", _scenario(criterion), criterion, subject)
+            )
+    return strategy
+
+
+def template_task(task: Dict[str, Any]) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Split ``task`` into its structure and the names that fill it in.
+
+    Returns ``(template, names)``. ``template`` is a task holding only the
+    layer, the type and the deliverable patterns of
+    :func:`structural_signature`, with ``{i}`` in place of ``names[i]``.
+    """
+    (layer, task_type, patterns), names = structural_signature(task)
+    template = {"deliverables": list(patterns), "implementation_layer": layer, "type": task_type}
+    return template, names
+
+
+def fill_names(value: Any, names: Tuple[str, ...]) -> Any:
+    """Copy of a template result with ``names[i]`` in place of ``{i}`` / ``{i:slug}``."""
+
+    def name(match: "re.Match[str]") -> str:
+        index = int(match.group(1))
+        if index >= len(names):
+            return match.group(0)
+        return _slug(names[index]) if match.group(2) else names[index]
+
+    if isinstance(value, str):
+        return _FILL_PLACEHOLDER.sub(name, value)
+    if isinstance(value, dict):
+        return {key: fill_names(item, names) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill_names(item, names) for item in value]
+    return value
+
+
+def generate_test_strategy(task: Dict[str, Any]) -> Strategy:
+    """Build the ``TestStrategy`` of one task from its deliverables and acceptance criteria."""
+    template, names = template_task(task)
+    strategy = fill_names(layout_strategy(template), names)
+    return add_acceptance_cases(strategy, task.get("acceptance_criteria") or [])
+
+
+def fingerprint(task: Dict[str, Any]) -> str:
+    payload = {name: task.get(name) for name in FINGERPRINT_FIELDS}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def needs_strategy(task: Dict[str, Any]) -> bool:
+    return task.get("type") == "implementation" and not task.get("test_strategy")
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+
+class EnrichmentPipeline:
+    """
+    Bounded-concurrency, resumable enrichment of a task batch.
+
+    ``generator`` receives :func:`template_task` templates, not tasks, and
+    is called once per structure. ``on_result(task_id, strategy)`` is called
+    from the pipeline's event loop for every strategy as soon as it is
+    available (checkpointed ones included), e.g. to persist it through the
+    state store.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        generator: Generator = generate_test_strategy,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: Optional[Union[str, Path]] = DEFAULT_CHECKPOINT_PATH,
+        on_result: Optional[Callable[[str, Strategy], None]] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._all_tasks = list(tasks)
+        self.tasks = {t["id"]: t for t in self._all_tasks if needs_strategy(t)}
+        self.generator = generator
+        self.concurrency = concurrency
+        self.checkpoint = Path(checkpoint) if checkpoint else None
+        self.on_result = on_result
+
+        self.results: Dict[str, Strategy] = {}
+        self.errors: Dict[str, str] = {}
+        self.resumed: List[str] = []
+        # Generator calls made; tasks sharing a template count once
+        self.generated = 0
+        self._done = {tid: threading.Event() for tid in self.tasks}
+        self._thread: Optional[threading.Thread] = None
+
+    # -- public API -----------------------------------------------------
+
+    def run(self) -> Dict[str, Strategy]:
+        """Enrich every pending task and return ``{task_id: strategy}``."""
+        try:
+            asyncio.run(self._run())
+        except BaseException as exc:
+            self._release_waiters(f"enrichment stopped: {exc!r}")
+            raise
+        return self.results
+
+    def start(self) -> threading.Thread:
+        """Run the pipeline in a background thread (see :meth:`gate`)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="test-enrichment", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def wait_for(self, task_id: str, timeout: Optional[float] = None) -> Optional[Strategy]:
+        """Block until ``task_id`` is enriched; ``None`` if it needs no strategy."""
+        event = self._done.get(task_id)
+        if event is None:
+            return None
+        if not event.wait(timeout):
+            raise TimeoutError(f"test strategy for {task_id} not ready after {timeout}s")
+        if task_id in self.errors:
+            raise RuntimeError(
+                f"test strategy generation failed for {task_id}: {self.errors[task_id]}"
+            )
+        return self.results[task_id]
+
+    def gate(self, run_task: RunTask) -> RunTask:
+        """
+        Wrap a scheduler ``run_task`` so each task waits only for its own strategy.
+
+        Call :meth:`start` first. Put the gate outermost (around a
+        ``CachedRunner``), so the cache key sees the ``test_strategy``.
+        """
+
+        def gated(task: Dict[str, Any]) -> Optional[bool]:
+            strategy = self.wait_for(task["id"])
+            if strategy is not None:
+                task["test_strategy"] = strategy
+            return run_task(task)
+
+        return gated
+
+    # -- internals ------------------------------------------------------
+
+    async def _run(self) -> None:
+        groups: Dict[Tuple[Any, ...], _Group] = {}
+        for task in self._execution_order(self._resume()):
+            template, names = template_task(task)
+            structure = (
+                template["implementation_layer"],
+                template["type"],
+                *template["deliverables"],
+            )
+            groups.setdefault(structure, (template, []))[1].append((task, names))
+        queue: "asyncio.Queue[_Group]" = asyncio.Queue()
+        for group in groups.values():
+            queue.put_nowait(group)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    template, members = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    self.generated += 1
+                    shared = await self._generate(template)
+                except Exception as exc:  # one bad task must not stop the batch
+                    for task, _ in members:
+                        self._fail(task["id"], str(exc))
+                    continue
+                for task, names in members:
+                    try:
+                        strategy = add_acceptance_cases(
+                            fill_names(shared, names), task.get("acceptance_criteria") or []
+                        )
+                    except Exception as exc:  # a malformed generator result
+                        self._fail(task["id"], f"invalid test strategy: {exc!r}")
+                        continue
+                    try:
+                        self._append_checkpoint(task, strategy)
+                    except Exception as exc:
+                        self._fail(task["id"], f"checkpoint write failed: {exc}")
+                        continue
+                    self._publish(task["id"], strategy)
+
+        workers = min(self.concurrency, len(groups)) or 1
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def _generate(self, task: Dict[str, Any]) -> Strategy:
+        if inspect.iscoroutinefunction(self.generator):
+            result = await self.generator(task)
+        else:
+            result = await asyncio.to_thread(
+                cast(Callable[[Dict[str, Any]], Any], self.generator), task
+            )
+        # Objects with an ``async def __call__`` (LLM clients) return a coroutine
+        if inspect.isawaitable(result):
+            result = await result
+        return cast(Strategy, result)
+
+    def _execution_order(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich in execution order so the first tasks to run are served first."""
+        try:
+            graph = TaskGraph(self._all_tasks, role_of=lambda task: "")
+        except DependencyGraphError:
+            return tasks  # broken graph: keep input order, Paso 0.3 reports it
+        levels = graph.levels()
+        return sorted(tasks, key=lambda t: (levels[t["id"]], -graph.priority[t["id"]]))
+
+    def _resume(self) -> List[Dict[str, Any]]:
+        """Publish checkpointed strategies and return the tasks still to enrich."""
+        done: Dict[str, Tuple[str, Strategy]] = {}
+        if self.checkpoint is not None and self.checkpoint.exists():
+            torn = False
+            with open(self.checkpoint, encoding="utf-8") as fh:
+                for line in fh:
+                    torn = not line.endswith("\n")
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line from a crash
+                    done[record["task_id"]] = (record["fingerprint"], record["test_strategy"])
+            if torn:
+                # Otherwise the next record would be appended to the torn line
+                with open(self.checkpoint, "a", encoding="utf-8") as fh:
+                    fh.write("\n")
+
+        pending = []
+        for tid, task in self.tasks.items():
+            saved = done.get(tid)
+            if saved is not None and saved[0] == fingerprint(task):
+                self.resumed.append(tid)
+                self._publish(tid, saved[1])
+            else:
+                pending.append(task)
+        return pending
+
+    def _append_checkpoint(self, task: Dict[str, Any], strategy: Strategy) -> None:
+        if self.checkpoint is None:
+            return
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "task_id": task["id"],
+            "fingerprint": fingerprint(task),
+            "test_strategy": strategy,
+        }
+        with open(self.checkpoint, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _publish(self, task_id: str, strategy: Strategy) -> None:
+        self.results[task_id] = strategy
+        try:
+            if self.on_result is not None:
+                self.on_result(task_id, strategy)
+        except Exception as exc:
+            self._fail(task_id, f"on_result failed: {exc}")
+            return
+        self._done[task_id].set()
+
+    def _fail(self, task_id: str, error: str) -> None:
+        self.errors[task_id] = error
+        self._done[task_id].set()
+
+    def _release_waiters(self, error: str) -> None:
+        """Fail every task still waiting, so gated workers never block forever."""
+        for task_id, event in self._done.items():
+            if not event.is_set():
+                self._fail(task_id, error)
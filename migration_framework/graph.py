@@ -0,0 +1,281 @@
+"""
+Indexed task dependency graph.
+
+Replaces ``all_dependencies_completed(task)`` scans with an in-memory
+index built once per run:
+
+- reverse-dependency adjacency (``dependents``) and a per-task counter of
+  unmet dependencies, so completing a task updates readiness in
+  O(out-degree);
+- ready queues per agent role, keyed by ``implementation_layer``, ordered
+  by critical-path priority (effort-weighted longest remaining path);
+- up-front validation of ``dependencies`` and ``layer_dependencies``:
+  dangling IDs and cycles are reported with their exact paths.
+
+``layer_dependencies`` (domain/use_case/infrastructure) are folded into
+the same edges as ``dependencies``, so there is a single readiness check.
+"""
+
+import heapq
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from migration_framework.tasks import effort_minutes, task_role
+
+# Graph-level statuses; "ready" means every dependency is completed.
+PENDING = "pending"
+READY = "ready"
+IN_PROGRESS = "in_progress"
+COMPLETED = "completed"
+FAILED = "failed"
+
+_STATUS_FROM_TASK = {
+    "completed": COMPLETED,
+    "in_progress": IN_PROGRESS,
+    "failed": FAILED,
+}
+
+
+class DependencyGraphError(ValueError):
+    """Raised with every dangling reference and cycle found in the task graph."""
+
+    def __init__(self, issues: List[str]):
+        self.issues = issues
+        lines = "\n".join(f"  - {issue}" for issue in issues)
+        super().__init__(f"{len(issues)} dependency error(s):\n{lines}")
+
+
+class TaskGraph:
+    """
+    Dependency index with incremental readiness tracking.
+
+    Task ``status`` values listed in ``reset_statuses`` are treated as
+    ``pending``, so those tasks (and everything downstream) can run again.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        weight: Callable[[Dict[str, Any]], float] = effort_minutes,
+        role_of: Callable[[Dict[str, Any]], str] = task_role,
+        reset_statuses: Iterable[str] = (),
+    ):
+        self.tasks: Dict[str, Dict[str, Any]] = {t["id"]: t for t in tasks}
+        self.role = {tid: role_of(t) for tid, t in self.tasks.items()}
+        self.layer = {tid: t.get("implementation_layer") for tid, t in self.tasks.items()}
+        self.weight = {tid: weight(t) for tid, t in self.tasks.items()}
+        # Stable tie-break: original task order
+        self._rank = {tid: i for i, tid in enumerate(self.tasks)}
+
+        self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {tid: [] for tid in self.tasks}
+        self._edge_paths: Dict[Tuple[str, str], str] = {}
+        issues = self._build_edges()
+        issues.extend(self._find_cycles())
+        if issues:
+            raise DependencyGraphError(issues)
+
+        self.order = self._topological_order()
+        self.priority = self._bottom_levels()
+
+        self.status: Dict[str, str] = {}
+        self.unmet: Dict[str, int] = {}
+        self._ready: Dict[str, Dict[Optional[str], List[Tuple[float, int, str]]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        reset = set(reset_statuses)
+        for tid, task in self.tasks.items():
+            status = task.get("status") or PENDING
+            self.status[tid] = (
+                PENDING if status in reset else _STATUS_FROM_TASK.get(status, PENDING)
+            )
+        for tid in self.tasks:
+            self.unmet[tid] = sum(
+                1 for dep in self.dependencies[tid] if self.status[dep] != COMPLETED
+            )
+            if self.status[tid] == PENDING and self.unmet[tid] == 0:
+                self._mark_ready(tid)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def roles(self) -> List[str]:
+        return sorted(set(self.role.values()))
+
+    def pending(self) -> List[str]:
+        """Tasks not completed yet, in topological order."""
+        return [tid for tid in self.order if self.status[tid] != COMPLETED]
+
+    def is_ready(self, task_id: str) -> bool:
+        return self.status[task_id] == READY
+
+    def ready(self, role: Optional[str] = None, layer: Optional[str] = None) -> List[str]:
+        """Ready task IDs (optionally of one role/layer), best priority first."""
+        roles = [role] if role is not None else list(self._ready)
+        entries = [
+            entry
+            for r in roles
+            for queue_layer, queue in self._ready.get(r, {}).items()
+            if layer is None or queue_layer == layer
+            for entry in queue
+            if self.status[entry[2]] == READY
+        ]
+        return [tid for _, _, tid in sorted(entries)]
+
+    def levels(self) -> Dict[str, int]:
+        """Execution level of every task (0 = no dependencies), as in Paso 0.3."""
+        level: Dict[str, int] = {}
+        for tid in self.order:
+            level[tid] = 1 + max((level[d] for d in self.dependencies[tid]), default=-1)
+        return level
+
+    def critical_path(self) -> List[str]:
+        """Longest effort-weighted dependency chain among pending tasks."""
+        candidates = [tid for tid in self.pending() if self.unmet[tid] == 0]
+        if not candidates:
+            return []
+        key = self._priority_key
+        current = min(candidates, key=key)
+        path = [current]
+        while True:
+            remaining = [d for d in self.dependents[current] if self.status[d] != COMPLETED]
+            if not remaining:
+                return path
+            current = min(remaining, key=key)
+            path.append(current)
+
+    # ------------------------------------------------------------------
+    # Transitions
+    # ------------------------------------------------------------------
+
+    def pop_ready(self, role: str, layer: Optional[str] = None) -> Optional[str]:
+        """Take the highest-priority ready task of ``role`` and mark it in progress."""
+        queues = self._ready.get(role, {})
+        best: Optional[List[Tuple[float, int, str]]] = None
+        for queue_layer, queue in queues.items():
+            if layer is not None and queue_layer != layer:
+                continue
+            # Drop entries started elsewhere (see start())
+            while queue and self.status[queue[0][2]] != READY:
+                heapq.heappop(queue)
+            if queue and (best is None or queue[0] < best[0]):
+                best = queue
+        if best is None:
+            return None
+        _, _, tid = heapq.heappop(best)
+        self.status[tid] = IN_PROGRESS
+        return tid
+
+    def start(self, task_id: str) -> None:
+        """Mark a ready task as in progress (e.g. claimed through the state store)."""
+        if self.status[task_id] != READY:
+            raise ValueError(f"{task_id} is not ready (status: {self.status[task_id]})")
+        self.status[task_id] = IN_PROGRESS
+
+    def complete(self, task_id: str) -> List[str]:
+        """Mark ``task_id`` completed and return the tasks that became ready."""
+        if self.status[task_id] == COMPLETED:
+            return []
+        self.status[task_id] = COMPLETED
+        newly_ready = []
+        for dependent in self.dependents[task_id]:
+            self.unmet[dependent] -= 1
+            if self.unmet[dependent] == 0 and self.status[dependent] == PENDING:
+                self._mark_ready(dependent)
+                newly_ready.append(dependent)
+        return newly_ready
+
+    def fail(self, task_id: str) -> None:
+        """Mark ``task_id`` failed; its dependents will never become ready."""
+        self.status[task_id] = FAILED
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _mark_ready(self, task_id: str) -> None:
+        self.status[task_id] = READY
+        queue = self._ready[self.role[task_id]][self.layer[task_id]]
+        heapq.heappush(queue, self._priority_key(task_id))
+
+    def _priority_key(self, task_id: str) -> Tuple[float, int, str]:
+        return (-self.priority[task_id], self._rank[task_id], task_id)
+
+    def _build_edges(self) -> List[str]:
+        issues = []
+        for tid, task in self.tasks.items():
+            deps: List[str] = []
+            for path, dep in _dependency_refs(tid, task):
+                if dep not in self.tasks:
+                    issues.append(f"{path}: unknown dependency {dep!r}")
+                elif dep == tid:
+                    issues.append(f"{path}: task depends on itself")
+                elif (tid, dep) not in self._edge_paths:
+                    self._edge_paths[(tid, dep)] = path
+                    deps.append(dep)
+                    self.dependents[dep].append(tid)
+            self.dependencies[tid] = deps
+        return issues
+
+    def _find_cycles(self) -> List[str]:
+        """Report one cycle per back edge found by an iterative DFS."""
+        issues = []
+        color = dict.fromkeys(self.tasks, 0)  # 0 = new, 1 = on stack, 2 = done
+        for root in self.tasks:
+            if color[root]:
+                continue
+            stack: List[Tuple[str, Iterator[str]]] = [(root, iter(self.dependencies.get(root, [])))]
+            color[root] = 1
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    color[node] = 2
+                    stack.pop()
+                elif color[child] == 0:
+                    color[child] = 1
+                    stack.append((child, iter(self.dependencies.get(child, []))))
+                elif color[child] == 1:
+                    on_stack = [n for n, _ in stack]
+                    cycle = on_stack[on_stack.index(child) :] + [child]
+                    hops = " → ".join(self._edge_paths[(a, b)] for a, b in zip(cycle, cycle[1:]))
+                    issues.append(f"dependency cycle {' → '.join(cycle)} (via {hops})")
+        return issues
+
+    def _topological_order(self) -> List[str]:
+        remaining = {tid: len(deps) for tid, deps in self.dependencies.items()}
+        queue = [tid for tid in self.tasks if remaining[tid] == 0]
+        order: List[str] = []
+        while queue:
+            tid = queue.pop()
+            order.append(tid)
+            for dependent in self.dependents[tid]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        return order
+
+    def _bottom_levels(self) -> Dict[str, float]:
+        level: Dict[str, float] = {}
+        for tid in reversed(self.order):
+            tail = max((level[d] for d in self.dependents[tid]), default=0.0)
+            level[tid] = self.weight[tid] + tail
+        return level
+
+
+def dependency_ids(task: Dict[str, Any]) -> List[str]:
+    """IDs ``task`` depends on through ``dependencies`` or ``layer_dependencies``."""
+    return list(dict.fromkeys(dep for _, dep in _dependency_refs(task["id"], task)))
+
+
+def _dependency_refs(task_id: str, task: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """Yield ``(path, dependency_id)`` for ``dependencies`` and ``layer_dependencies``."""
+    # Malformed values are reported by the loader; never walk a string's characters
+    dependencies = task.get("dependencies")
+    for i, dep in enumerate(dependencies if isinstance(dependencies, list) else []):
+        yield f"{task_id}.dependencies[{i}]", dep
+    layers = task.get("layer_dependencies")
+    for layer, deps in layers.items() if isinstance(layers, dict) else ():
+        for i, dep in enumerate(deps if isinstance(deps, list) else []):
+            yield f"{task_id}.layer_dependencies.{layer}[{i}]", dep
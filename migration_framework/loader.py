@@ -0,0 +1,420 @@
+"""
+Streaming task loader (FASE 0 - Pasos 0.1 y 0.2).
+
+Reads task files incrementally and yields one normalized task at a time,
+so memory stays flat no matter how many tasks the SDD produces. Accepted
+layouts:
+
+- a list of input batches, either with ``metadata``/``summary``/
+  ``suggestedNewPhases`` (batches 1-4 of ``docs/input/tasks.json``) or with
+  a ``batch`` object (batch 5);
+- a ``TaskCollection`` object (``{"tasks": [...]}``, ``docs/state/tasks.json``);
+- a plain list of tasks.
+
+Every task is normalized to the ``Task`` interface of
+``docs/schemas/tasks-schema.ts`` (``acceptanceCriteria`` ->
+``acceptance_criteria``...). Instead of failing on the first broken task,
+the loader records a :class:`ValidationIssue` for each problem and keeps
+going; :meth:`TaskLoader.raise_for_errors` reports them all at once.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+PathLike = Union[str, Path]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+PRIORITIES = ("high", "medium", "low")
+# Batch 5 uses "critical", which the Task interface does not define
+PRIORITY_ALIASES = {"critical": "high"}
+
+# Input (camelCase) keys -> Task interface keys
+FIELD_ALIASES = {
+    "acceptanceCriteria": "acceptance_criteria",
+    "businessRules": "business_rules",
+    "effortEstimate": "effort_estimate",
+    "estimatedComplexity": "estimated_complexity",
+    "executionOrder": "execution_order",
+    "implementationLayer": "implementation_layer",
+    "layerDependencies": "layer_dependencies",
+    "relatedRequirements": "related_requirements",
+    "skillsRequired": "skills_required",
+    "suggestedPhase": "phase",
+    "testStrategy": "test_strategy",
+    "validationCommands": "validation_commands",
+}
+
+_REQUIRED_STRINGS = ("id", "title", "description")
+_REQUIRED_LISTS = ("deliverables", "dependencies")
+# Optional: an object mapping each layer to a list of task IDs
+_LAYER_DEPENDENCIES = ("layer_dependencies", "layerDependencies")
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """One problem found while loading tasks, with its JSON path."""
+
+    source: str
+    path: str
+    message: str
+    task_id: Optional[str] = None
+
+    def __str__(self) -> str:
+        where = f"{self.source}:{self.path}"
+        if self.task_id:
+            where += f" ({self.task_id})"
+        return f"{where}: {self.message}"
+
+
+class TaskValidationError(ValueError):
+    """Raised with every :class:`ValidationIssue` found in a load."""
+
+    def __init__(self, issues: List[ValidationIssue]):
+        self.issues = issues
+        lines = "\n".join(f"  - {issue}" for issue in issues)
+        super().__init__(f"{len(issues)} task validation error(s):\n{lines}")
+
+
+class TaskLoader:
+    """
+    Iterate over the normalized tasks of one or more files.
+
+    Invalid tasks are skipped, their problems recorded in :attr:`errors`
+    and the raw objects kept in :attr:`rejected`. Dangling dependency IDs
+    can only be detected once every file has been read, so inspect
+    :attr:`errors` (or call :meth:`raise_for_errors`) after the iteration
+    has finished.
+    """
+
+    def __init__(self, paths: Iterable[PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.paths = [Path(p) for p in paths]
+        self.chunk_size = chunk_size
+        self.errors: List[ValidationIssue] = []
+        self.rejected: List[Dict[str, Any]] = []
+        self._seen_ids: Set[str] = set()
+        self._forward_refs: List[Tuple[str, str, str, str]] = []
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self.errors = []
+        self.rejected = []
+        self._seen_ids = set()
+        self._forward_refs = []
+        for path in self.paths:
+            yield from self._load_file(path)
+        for source, ref_path, task_id, dep in self._forward_refs:
+            if dep not in self._seen_ids:
+                self._issue(source, ref_path, f"unknown dependency {dep!r}", task_id)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return all valid tasks, raising :class:`TaskValidationError` on any issue."""
+        tasks = list(self)
+        self.raise_for_errors()
+        return tasks
+
+    def raise_for_errors(self) -> None:
+        if self.errors:
+            raise TaskValidationError(self.errors)
+
+    # ------------------------------------------------------------------
+    # File layouts
+    # ------------------------------------------------------------------
+
+    def _load_file(self, path: Path) -> Iterator[Dict[str, Any]]:
+        source = str(path)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                stream = _JSONStream(fh, self.chunk_size)
+                first = stream.peek()
+                if first == "[":
+                    for index in stream.iter_array():
+                        yield from self._load_container(stream, source, f"$[{index}]")
+                elif first == "{":
+                    yield from self._load_container(stream, source, "$")
+                else:
+                    self._issue(source, "$", "expected a JSON array or object")
+        except OSError as exc:
+            self._issue(source, "$", f"cannot read file: {exc.strerror or exc}")
+        except _StreamError as exc:
+            self._issue(source, "$", f"invalid JSON at byte {exc.offset}: {exc.reason}")
+
+    def _load_container(
+        self, stream: "_JSONStream", source: str, path: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Handle one batch, collection or bare task object."""
+        if stream.peek() != "{":
+            self._issue(source, path, "expected an object")
+            stream.value()
+            return
+
+        header: Dict[str, Any] = {}
+        has_tasks = False
+        for key in stream.iter_object():
+            if key == "tasks" and stream.peek() == "[":
+                has_tasks = True
+                defaults = _batch_defaults(header)
+                for index in stream.iter_array():
+                    raw = stream.value()
+                    task = self._check(raw, source, f"{path}.tasks[{index}]", defaults)
+                    if task is not None:
+                        yield task
+            else:
+                header[key] = stream.value()
+
+        if not has_tasks:
+            # Not a batch: the object is a task itself
+            task = self._check(header, source, path, {})
+            if task is not None:
+                yield task
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def _check(
+        self, raw: Any, source: str, path: str, defaults: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if not isinstance(raw, dict):
+            self._issue(source, path, "task must be an object")
+            return None
+
+        task_id = raw.get("id") if isinstance(raw.get("id"), str) else None
+        errors_before = len(self.errors)
+
+        for key in _REQUIRED_STRINGS:
+            value = raw.get(key)
+            if not isinstance(value, str) or not value.strip():
+                self._issue(source, f"{path}.{key}", "missing or empty string", task_id)
+        for key in _REQUIRED_LISTS:
+            value = raw.get(key)
+            if not isinstance(value, list):
+                self._issue(source, f"{path}.{key}", "missing or not a list", task_id)
+                continue
+            for i, item in enumerate(value):
+                if not isinstance(item, str):
+                    self._issue(source, f"{path}.{key}[{i}]", "must be a string", task_id)
+        for key in _LAYER_DEPENDENCIES:
+            layers = raw.get(key)
+            if layers is None:
+                continue
+            if not isinstance(layers, dict):
+                self._issue(source, f"{path}.{key}", "not an object of dependency lists", task_id)
+                continue
+            for layer, deps in layers.items():
+                if deps is not None and (
+                    not isinstance(deps, list) or not all(isinstance(d, str) for d in deps)
+                ):
+                    self._issue(source, f"{path}.{key}.{layer}", "not a list of strings", task_id)
+
+        priority = raw.get("priority")
+        if priority is not None and (
+            not isinstance(priority, str)
+            or PRIORITY_ALIASES.get(priority, priority) not in PRIORITIES
+        ):
+            self._issue(source, f"{path}.priority", f"invalid priority {priority!r}", task_id)
+
+        if task_id is not None:
+            if task_id in self._seen_ids:
+                self._issue(source, f"{path}.id", f"duplicate task id {task_id!r}", task_id)
+            self._seen_ids.add(task_id)
+            dependencies = raw.get("dependencies")
+            # A non-list value was reported above; don't walk a string's characters
+            for i, dep in enumerate(dependencies if isinstance(dependencies, list) else []):
+                dep_path = f"{path}.dependencies[{i}]"
+                if dep == task_id:
+                    self._issue(source, dep_path, "task depends on itself", task_id)
+                elif isinstance(dep, str) and dep not in self._seen_ids:
+                    self._forward_refs.append((source, dep_path, task_id, dep))
+
+        if len(self.errors) > errors_before:
+            self.rejected.append(raw)
+            return None
+        return normalize_task(raw, defaults)
+
+    def _issue(self, source: str, path: str, message: str, task_id: Optional[str] = None) -> None:
+        self.errors.append(ValidationIssue(source, path, message, task_id))
+
+
+def iter_tasks(*paths: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Stream normalized tasks from ``paths``, raising at the end if any were invalid."""
+    loader = TaskLoader(paths, chunk_size=chunk_size)
+    yield from loader
+    loader.raise_for_errors()
+
+
+def collection_fields(path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Top-level fields other than ``tasks`` of an object file (``TaskCollection``).
+
+    Tasks are skipped one at a time, so memory stays flat. Returns ``{}``
+    for array layouts.
+    """
+    fields: Dict[str, Any] = {}
+    with open(path, encoding="utf-8") as fh:
+        stream = _JSONStream(fh, chunk_size)
+        if stream.peek() != "{":
+            return fields
+        for key in stream.iter_object():
+            if key == "tasks" and stream.peek() == "[":
+                for _ in stream.iter_array():
+                    stream.value()
+            else:
+                fields[key] = stream.value()
+    fields.pop("tasks", None)
+    return fields
+
+
+def normalize_task(
+    raw: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Map an input task (either batch shape) onto the ``Task`` interface."""
+    task = {FIELD_ALIASES.get(key, key): value for key, value in raw.items()}
+    for key, value in (defaults or {}).items():
+        if task.get(key) is None:
+            task[key] = value
+
+    task.setdefault("type", _infer_type(task))
+    task.setdefault("module", "")
+    task.setdefault("phase", "")
+    priority = task.get("priority") or "medium"
+    task["priority"] = PRIORITY_ALIASES.get(priority, priority)
+    task.setdefault("implementation_layer", None)
+    task.setdefault("owner", None)
+    task.setdefault("status", "pending")
+    task.setdefault("dependencies", [])
+    task.setdefault("related_requirements", [])
+    task.setdefault("deliverables", [])
+    task.setdefault("effort_estimate", "")
+    task.setdefault("skills_required", [])
+    task.setdefault("created_at", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return task
+
+
+def _infer_type(task: Dict[str, Any]) -> str:
+    if task.get("phase") == "deployment":
+        return "deployment"
+    deliverables = task.get("deliverables") or []
+    if deliverables and all("tests/" in d or ".spec." in d for d in deliverables):
+        return "tests"
+    return "implementation"
+
+
+def _batch_defaults(header: Dict[str, Any]) -> Dict[str, Any]:
+    """Task defaults taken from a batch header of either shape."""
+    metadata = header.get("metadata")
+    batch = header.get("batch")
+    if not isinstance(metadata, dict):
+        metadata = {}
+    if not isinstance(batch, dict):
+        batch = {}
+    phase = metadata.get("primary_phase") or batch.get("suggestedPhase")
+    return {"phase": phase} if phase else {}
+
+
+# ----------------------------------------------------------------------
+# Incremental JSON reader
+# ----------------------------------------------------------------------
+
+
+class _StreamError(Exception):
+    def __init__(self, offset: int, reason: str):
+        super().__init__(f"byte {offset}: {reason}")
+        self.offset = offset
+        self.reason = reason
+
+
+class _JSONStream:
+    """
+    Minimal pull parser over a text file.
+
+    Containers are walked with :meth:`iter_array`/:meth:`iter_object`;
+    anything else (including whole tasks) is decoded with :meth:`value`.
+    Only the current chunk plus the value being decoded are kept in memory.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, fh: IO[str], chunk_size: int):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # characters discarded before ``buf``
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        chunk = self.fh.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            found = self.peek() or "end of file"
+            raise _StreamError(self.offset + self.pos, f"expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.eof or not self._fill():
+                    raise _StreamError(self.offset + exc.pos, exc.msg) from None
+                continue
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue  # a number may continue in the next chunk
+            self.pos = end
+            return obj
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield element indexes; the caller must consume each element."""
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("]")
+            return
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield keys; the caller must consume each value."""
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise _StreamError(self.offset + self.pos, "expected an object key")
+            key = self.value()
+            self._expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("}")
+            return
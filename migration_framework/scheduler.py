@@ -0,0 +1,244 @@
+"""
+DAG task scheduler (FASE 1-3).
+
+Replaces the level-by-level loop of ``execute_migration()``: a task is
+started as soon as its own dependencies are completed, without waiting
+for the rest of its execution level. Readiness comes from the per-role
+ready queues of :class:`~migration_framework.graph.TaskGraph`, and each
+role runs up to a configurable number of tasks concurrently. Within a
+role, tasks on the longest remaining path (critical-path priority,
+measured with ``effortEstimate``) go first.
+
+The same dispatch logic drives both real execution (:meth:`Scheduler.run`)
+and the dry-run projection (:meth:`Scheduler.dry_run`). Real runs are
+traced with :mod:`migration_framework.telemetry` when it is enabled.
+"""
+
+import heapq
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from migration_framework.graph import TaskGraph
+from migration_framework.telemetry import Tracer, get_tracer
+
+RunTask = Callable[[Dict[str, Any]], Optional[bool]]
+
+# A failed task, or one left in progress by an interrupted run, is retried
+RESTART_STATUSES = ("failed", "in_progress")
+
+
+@dataclass
+class TaskOutcome:
+    """Start/end times of a scheduled task (minutes in dry-run, seconds when run)."""
+
+    task_id: str
+    role: str
+    start: float
+    end: float
+    success: bool = True
+    error: Optional[str] = None
+    # Time between becoming ready and getting a worker
+    queue_wait: float = 0.0
+
+
+@dataclass
+class Schedule:
+    """Result of a scheduler run or dry-run."""
+
+    outcomes: Dict[str, TaskOutcome] = field(default_factory=dict)
+    # Tasks never started because a dependency failed
+    skipped: List[str] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def makespan(self) -> float:
+        return max((o.end for o in self.outcomes.values()), default=0.0)
+
+    @property
+    def sequential_time(self) -> float:
+        return sum(o.end - o.start for o in self.outcomes.values())
+
+    @property
+    def failed(self) -> List[str]:
+        return [o.task_id for o in self.outcomes.values() if not o.success]
+
+
+class Scheduler:
+    """
+    Critical-path list scheduler over the task dependency graph.
+
+    Tasks whose ``status`` is already ``"completed"`` are treated as
+    satisfied dependencies and are not scheduled again. Tasks whose status
+    is in ``reset_statuses`` (failed or stale ``in_progress`` ones by
+    default) are scheduled again as if they were pending.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        workers_per_role: Optional[Dict[str, int]] = None,
+        default_workers: int = 1,
+        reset_statuses: Iterable[str] = RESTART_STATUSES,
+    ):
+        if default_workers < 1:
+            raise ValueError("default_workers must be >= 1")
+        self.workers_per_role = dict(workers_per_role or {})
+        self.default_workers = default_workers
+        self.reset_statuses = tuple(reset_statuses)
+
+        self.graph = TaskGraph(tasks, reset_statuses=self.reset_statuses)
+        self.tasks = {tid: self.graph.tasks[tid] for tid in self.graph.pending()}
+        self.roles = {tid: self.graph.role[tid] for tid in self.tasks}
+        self.durations = {tid: self.graph.weight[tid] for tid in self.tasks}
+        self.priority = {tid: self.graph.priority[tid] for tid in self.tasks}
+        self._task_list = list(self.graph.tasks.values())
+
+    def workers_for(self, role: str) -> int:
+        return max(1, self.workers_per_role.get(role, self.default_workers))
+
+    def critical_path(self) -> List[str]:
+        """Longest effort-weighted dependency chain among pending tasks."""
+        return self.graph.critical_path()
+
+    def dry_run(self, cached: Iterable[str] = ()) -> Schedule:
+        """
+        Project the schedule using each task's ``effortEstimate`` (minutes).
+
+        Tasks in ``cached`` (result cache hits) are projected as instant.
+        """
+        cached = set(cached)
+        dispatcher = _Dispatcher(self)
+        schedule = Schedule(critical_path=self.critical_path())
+        events: List[tuple] = []
+        now = 0.0
+        seq = 0
+
+        while True:
+            for tid in dispatcher.dispatch():
+                end = now + (0.0 if tid in cached else self.durations[tid])
+                schedule.outcomes[tid] = TaskOutcome(
+                    tid, self.roles[tid], now, end, queue_wait=now - dispatcher.ready_at[tid]
+                )
+                heapq.heappush(events, (end, seq, tid))
+                seq += 1
+            if not events:
+                break
+            now, _, tid = heapq.heappop(events)
+            dispatcher.complete(tid, success=True, now=now)
+
+        return schedule
+
+    def run(self, run_task: RunTask, tracer: Optional[Tracer] = None) -> Schedule:
+        """
+        Execute all pending tasks with ``run_task`` (times in seconds).
+
+        ``run_task(task)`` must block until the task is finished - typically
+        ``invoke_agent`` followed by ``wait_for_task_completion`` and
+        ``validate_task_completion``. Returning ``False`` or raising marks the
+        task as failed; everything downstream of it is skipped while
+        independent branches keep running.
+
+        Each invocation runs inside an ``agent`` span of ``tracer`` (the
+        process-wide tracer by default) carrying its queue wait, execution
+        level and the dependency that unblocked it; ``run_task`` can add
+        retries, tokens or test runtime through ``current_span()``.
+        """
+        tracer = tracer or get_tracer()
+        dispatcher = _Dispatcher(self)
+        schedule = Schedule(critical_path=self.critical_path())
+        roles = set(self.roles.values())
+        total_workers = sum(self.workers_for(r) for r in roles) or 1
+        levels = self.graph.levels() if tracer.enabled else {}
+        started = time.monotonic()
+        running: Dict[Future, str] = {}
+
+        phase_span = tracer.span(
+            "FASE 1-3: execution",
+            kind="phase",
+            tasks=len(self.tasks),
+            workers={r: self.workers_for(r) for r in roles},
+        )
+        with phase_span as phase, ThreadPoolExecutor(max_workers=total_workers) as pool:
+            while True:
+                for tid in dispatcher.dispatch():
+                    start = time.monotonic() - started
+                    outcome = TaskOutcome(tid, self.roles[tid], start, start)
+                    outcome.queue_wait = start - dispatcher.ready_at[tid]
+                    schedule.outcomes[tid] = outcome
+                    future = pool.submit(
+                        self._invoke,
+                        run_task,
+                        tracer.span(
+                            f"{self.roles[tid]} {tid}",
+                            kind="agent",
+                            task_id=tid,
+                            agent=self.roles[tid],
+                            level=levels.get(tid),
+                            queue_wait_s=outcome.queue_wait,
+                            unblocked_by=dispatcher.unblocked_by.get(tid),
+                        ),
+                        tid,
+                    )
+                    running[future] = tid
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tid = running.pop(future)
+                    outcome = schedule.outcomes[tid]
+                    outcome.end = time.monotonic() - started
+                    try:
+                        outcome.success = future.result() is not False
+                    except Exception as exc:  # agent failures must not stop other branches
+                        outcome.success = False
+                        outcome.error = str(exc)
+                    dispatcher.complete(tid, success=outcome.success, now=outcome.end)
+
+            schedule.skipped = [tid for tid in self.tasks if tid not in schedule.outcomes]
+            phase.set(failed=len(schedule.failed), skipped=len(schedule.skipped))
+        return schedule
+
+    def _invoke(self, run_task: RunTask, span: Any, tid: str) -> Optional[bool]:
+        # The span was opened on the dispatching thread, so it is a child of the phase
+        with span:
+            result = run_task(self.tasks[tid])
+            if result is False:
+                span.fail()
+            return result
+
+
+class _Dispatcher:
+    """Per-role worker slots on top of a fresh :class:`TaskGraph` readiness state."""
+
+    def __init__(self, scheduler: Scheduler):
+        self.scheduler = scheduler
+        self.graph = TaskGraph(scheduler._task_list, reset_statuses=scheduler.reset_statuses)
+        self.running = {role: 0 for role in self.graph.roles()}
+        # When each task became ready, and the dependency whose completion made it so
+        self.ready_at: Dict[str, float] = dict.fromkeys(self.graph.ready(), 0.0)
+        self.unblocked_by: Dict[str, str] = {}
+
+    def dispatch(self) -> List[str]:
+        """Pop every ready task that fits in its role's free worker slots."""
+        started = []
+        for role in self.running:
+            capacity = self.scheduler.workers_for(role)
+            while self.running[role] < capacity:
+                tid = self.graph.pop_ready(role)
+                if tid is None:
+                    break
+                self.running[role] += 1
+                started.append(tid)
+        return started
+
+    def complete(self, tid: str, success: bool, now: float = 0.0) -> None:
+        self.running[self.graph.role[tid]] -= 1
+        if success:
+            for ready in self.graph.complete(tid):
+                self.ready_at[ready] = now
+                self.unblocked_by[ready] = tid
+        else:
+            self.graph.fail(tid)
@@ -0,0 +1,337 @@
+"""
+Task state store (``docs/state/tasks.db``).
+
+Replaces whole-file rewrites of ``docs/state/tasks.json`` with a SQLite
+database in WAL mode:
+
+- Claims are an atomic compare-and-set (``owner IS NULL`` -> agent) on a
+  single row, so two agents can never both own a task and claim latency
+  does not depend on the number of tasks.
+- Every change is appended to ``task_events`` (the audit log) and applied
+  to the task's own row only.
+- :meth:`TaskStateStore.export_json` writes the current state back as a
+  ``TaskCollection`` (``docs/schemas/tasks-schema.ts``) for tools that
+  still read ``tasks.json``.
+- Dependency edges and each task's count of unmet dependencies are stored
+  next to the tasks, so :meth:`TaskStateStore.claim_next` is an indexed
+  query and completing a task updates its dependents in O(out-degree).
+
+A store instance can be shared between threads; each thread gets its own
+connection. Separate processes simply open the same database file.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from migration_framework._sqlite import SQLiteDatabase, utc_now
+from migration_framework.graph import TaskGraph
+
+DEFAULT_DB_PATH = "docs/state/tasks.db"
+
+TASK_STATUSES = ("pending", "in_progress", "blocked", "completed", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    owner TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    implementation_layer TEXT,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    role TEXT,
+    priority REAL NOT NULL DEFAULT 0,
+    unmet INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready
+    ON tasks (status, unmet, role, implementation_layer, priority DESC, position);
+CREATE TABLE IF NOT EXISTS task_dependencies (
+    task_id TEXT NOT NULL REFERENCES tasks (id),
+    depends_on TEXT NOT NULL REFERENCES tasks (id),
+    PRIMARY KEY (task_id, depends_on)
+);
+CREATE INDEX IF NOT EXISTS idx_task_dependencies_dependents
+    ON task_dependencies (depends_on);
+CREATE TABLE IF NOT EXISTS task_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL REFERENCES tasks (id),
+    agent TEXT,
+    event TEXT NOT NULL,
+    changes TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_task_events_task ON task_events (task_id, seq);
+"""
+
+
+class TaskStateStore(SQLiteDatabase):
+    """SQLite-backed source of truth for task ownership and status."""
+
+    SCHEMA = _SCHEMA
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB_PATH, timeout: float = 30.0):
+        super().__init__(path, timeout)
+
+    # ------------------------------------------------------------------
+    # Import / export
+    # ------------------------------------------------------------------
+
+    def import_tasks(self, tasks: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        Load tasks into the store and return how many were written.
+
+        Existing tasks are kept as-is unless ``replace`` is set, so
+        re-importing after a restart never loses claims or progress. The
+        dependency index is rebuilt from every stored task; dangling IDs or
+        cycles raise :class:`~migration_framework.graph.DependencyGraphError`
+        and nothing is written.
+        """
+        on_conflict = (
+            "DO UPDATE SET owner = excluded.owner, status = excluded.status,"
+            " implementation_layer = excluded.implementation_layer, data = excluded.data,"
+            " version = version + 1, updated_at = excluded.updated_at"
+            if replace
+            else "DO NOTHING"
+        )
+        written = 0
+        with self._write() as conn:
+            position = conn.execute("SELECT COALESCE(MAX(position), -1) FROM tasks").fetchone()[0]
+            for task in tasks:
+                position += 1
+                cursor = conn.execute(
+                    "INSERT INTO tasks (id, position, owner, status, implementation_layer,"
+                    " data, version, updated_at) VALUES (?, ?, ?, ?, ?, ?, 0, ?)"
+                    f" ON CONFLICT (id) {on_conflict}",
+                    (
+                        task["id"],
+                        position,
+                        task.get("owner"),
+                        task.get("status") or "pending",
+                        task.get("implementation_layer"),
+                        json.dumps(task, ensure_ascii=False),
+                        utc_now(),
+                    ),
+                )
+                written += cursor.rowcount
+            if written:
+                self._index_dependencies(conn)
+        return written
+
+    def export_json(self, path: Union[str, Path], **collection: Any) -> None:
+        """
+        Write the current state as a ``TaskCollection`` JSON file.
+
+        Extra keyword arguments (``project_name``, ``framework_version``...)
+        are added to the top-level object.
+        """
+        tasks = self.tasks()
+        payload = {
+            **collection,
+            "total_tasks": len(tasks),
+            "tasks": tasks,
+            "generated_at": utc_now(),
+            "generated_by": collection.get("generated_by", "orchestrator"),
+            "summary": self.summary(),
+        }
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(target)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, task_id: str) -> Dict[str, Any]:
+        row = (
+            self._conn()
+            .execute("SELECT owner, status, data FROM tasks WHERE id = ?", (task_id,))
+            .fetchone()
+        )
+        if row is None:
+            raise KeyError(task_id)
+        return self._row_to_task(row)
+
+    def tasks(
+        self, status: Optional[str] = None, owner: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = "SELECT owner, status, data FROM tasks"
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if owner is not None:
+            clauses.append("owner = ?")
+            params.append(owner)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        rows = self._conn().execute(query + " ORDER BY position", params).fetchall()
+        return [self._row_to_task(row) for row in rows]
+
+    def history(self, task_id: str) -> List[Dict[str, Any]]:
+        """Return the append-only event log of ``task_id`` in order."""
+        rows = (
+            self._conn()
+            .execute(
+                "SELECT agent, event, changes, created_at FROM task_events"
+                " WHERE task_id = ? ORDER BY seq",
+                (task_id,),
+            )
+            .fetchall()
+        )
+        return [
+            {
+                "agent": row["agent"],
+                "event": row["event"],
+                "changes": json.loads(row["changes"]),
+                "created_at": row["created_at"],
+            }
+            for row in rows
+        ]
+
+    def summary(self) -> Dict[str, int]:
+        counts = dict.fromkeys(TASK_STATUSES, 0)
+        for row in self._conn().execute("SELECT status, COUNT(*) FROM tasks GROUP BY status"):
+            counts[row[0]] = row[1]
+        return counts
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def claim(self, task_id: str, agent: str) -> bool:
+        """
+        Atomically claim ``task_id`` for ``agent``.
+
+        Succeeds only if the task is still ``pending`` with ``owner: null``;
+        returns ``False`` when another agent got there first.
+        """
+        started_at = utc_now()
+        with self._write() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET owner = ?, status = 'in_progress'"
+                " WHERE id = ? AND owner IS NULL AND status = 'pending'",
+                (agent, task_id),
+            )
+            if cursor.rowcount == 0:
+                if conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is None:
+                    raise KeyError(task_id)
+                return False
+            changes = {"owner": agent, "status": "in_progress", "started_at": started_at}
+            self._apply(conn, task_id, agent, "claim", changes)
+        return True
+
+    def claim_next(
+        self,
+        agent: str,
+        implementation_layer: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Claim the next ready task (optionally of one role and/or layer).
+
+        A task is ready when it is unowned, ``pending`` and every dependency
+        is completed. Candidates on the longest remaining path (critical-path
+        priority) go first, then table order.
+        """
+        query = "SELECT id FROM tasks WHERE status = 'pending' AND unmet = 0 AND owner IS NULL"
+        params: List[Any] = []
+        if role is not None:
+            query += " AND role = ?"
+            params.append(role)
+        if implementation_layer is not None:
+            query += " AND implementation_layer = ?"
+            params.append(implementation_layer)
+        query += " ORDER BY priority DESC, position LIMIT 1"
+
+        while True:
+            row = self._conn().execute(query, params).fetchone()
+            if row is None:
+                return None
+            if self.claim(row["id"], agent):
+                return self.get(row["id"])
+
+    def update(self, task_id: str, agent: Optional[str] = None, **changes: Any) -> bool:
+        """
+        Apply ``changes`` to one task and log them.
+
+        When ``agent`` is given the update only succeeds if that agent owns
+        the task; returns ``False`` otherwise.
+        """
+        status = changes.get("status")
+        if status is not None and status not in TASK_STATUSES:
+            raise ValueError(f"invalid status {status!r}")
+        if status == "completed":
+            changes.setdefault("completed_at", utc_now())
+
+        with self._write() as conn:
+            row = conn.execute("SELECT owner FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                raise KeyError(task_id)
+            if agent is not None and row["owner"] != agent:
+                return False
+            self._apply(conn, task_id, agent, "update", changes)
+        return True
+
+    def release(self, task_id: str, agent: str) -> bool:
+        """Give a claimed task back (``owner: null``, ``status: pending``)."""
+        return self.update(task_id, agent=agent, owner=None, status="pending")
+
+    def _apply(
+        self,
+        conn: sqlite3.Connection,
+        task_id: str,
+        agent: Optional[str],
+        event: str,
+        changes: Dict[str, Any],
+    ) -> None:
+        row = conn.execute("SELECT status, data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        data = json.loads(row["data"])
+        data.update(changes)
+        now = utc_now()
+
+        was_completed = row["status"] == "completed"
+        if "status" in changes and (changes["status"] == "completed") != was_completed:
+            conn.execute(
+                "UPDATE tasks SET unmet = unmet + ? WHERE id IN"
+                " (SELECT task_id FROM task_dependencies WHERE depends_on = ?)",
+                (1 if was_completed else -1, task_id),
+            )
+
+        assignments = ["data = ?", "version = version + 1", "updated_at = ?"]
+        params: List[Any] = [json.dumps(data, ensure_ascii=False), now]
+        for column in ("owner", "status", "implementation_layer"):
+            if column in changes:
+                assignments.append(f"{column} = ?")
+                params.append(changes[column])
+        conn.execute(f"UPDATE tasks SET {', '.join(assignments)} WHERE id = ?", (*params, task_id))
+        conn.execute(
+            "INSERT INTO task_events (task_id, agent, event, changes, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (task_id, agent, event, json.dumps(changes, ensure_ascii=False), now),
+        )
+
+    def _index_dependencies(self, conn: sqlite3.Connection) -> None:
+        """Rebuild the dependency edges, roles, priorities and unmet counts."""
+        rows = conn.execute("SELECT owner, status, data FROM tasks ORDER BY position").fetchall()
+        graph = TaskGraph(self._row_to_task(row) for row in rows)
+        conn.execute("DELETE FROM task_dependencies")
+        conn.executemany(
+            "INSERT INTO task_dependencies (task_id, depends_on) VALUES (?, ?)",
+            [(tid, dep) for tid, deps in graph.dependencies.items() for dep in deps],
+        )
+        conn.executemany(
+            "UPDATE tasks SET role = ?, priority = ?, unmet = ? WHERE id = ?",
+            [(graph.role[tid], graph.priority[tid], graph.unmet[tid], tid) for tid in graph.tasks],
+        )
+
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> Dict[str, Any]:
+        task = json.loads(row["data"])
+        task["owner"] = row["owner"]
+        task["status"] = row["status"]
+        return task
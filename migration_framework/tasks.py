@@ -0,0 +1,56 @@
+"""
+Task helpers shared by the orchestrator tooling.
+
+Tasks arrive in two spellings: the pre-generated input batches in
+``docs/input/`` use camelCase keys (``effortEstimate``), while
+``docs/state/tasks.json`` follows ``docs/schemas/tasks-schema.ts``
+(``effort_estimate``). The helpers here accept both.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from migration_framework.assignment import assign_agent
+from migration_framework.loader import TaskLoader
+
+_EFFORT_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|m|hours?|hrs?|h|days?|d)\b",
+    re.IGNORECASE,
+)
+_UNIT_MINUTES = {"m": 1.0, "h": 60.0, "d": 8 * 60.0}  # a working day is 8 hours
+
+DEFAULT_EFFORT_MINUTES = 60.0
+
+
+def load_tasks(*paths: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Load and validate the tasks of one or more files (see :mod:`migration_framework.loader`).
+
+    Raises :class:`~migration_framework.loader.TaskValidationError` listing
+    every problem found.
+    """
+    return TaskLoader(paths).load()
+
+
+def effort_minutes(task: Dict[str, Any]) -> float:
+    """
+    Parse the task's effort estimate into minutes.
+
+    Understands strings such as ``"90 minutes"``, ``"8 hours"`` or
+    ``"40 hours (spread over 30 days)"`` (the first quantity wins).
+    Unparseable or missing estimates fall back to one hour.
+    """
+    raw: Optional[str] = task.get("effort_estimate") or task.get("effortEstimate")
+    if not raw:
+        return DEFAULT_EFFORT_MINUTES
+    match = _EFFORT_PATTERN.search(str(raw))
+    if not match:
+        return DEFAULT_EFFORT_MINUTES
+    amount, unit = match.groups()
+    return float(amount) * _UNIT_MINUTES[unit[0].lower()]
+
+
+def task_role(task: Dict[str, Any]) -> str:
+    """Return the agent role for ``task``: its owner, assigned agent or auto-assignment."""
+    return task.get("owner") or task.get("assigned_agent") or assign_agent(task)
@@ -0,0 +1,374 @@
+"""
+Run-wide telemetry for phases, execution levels and agent invocations.
+
+``ExecutionMetrics.actual_time_spent`` is free text and agent progress
+files are never aggregated, so this module records structured spans
+instead:
+
+- a :class:`Tracer` opens spans around phases (``kind="phase"``) and agent
+  invocations (``kind="agent"``). Each span records wall time and whatever
+  attributes the code running inside it adds through
+  :func:`current_span`: queue wait, retries, tokens, test runtime;
+- finished spans are appended to a JSONL file
+  (``docs/state/telemetry.jsonl``), one OpenTelemetry-shaped record per
+  line;
+- :func:`build_report` aggregates the file: time per phase, the observed
+  critical path, agent utilization and the slowest tasks.
+
+When telemetry is disabled (the default), :meth:`Tracer.span` returns a
+shared no-op span: nothing is allocated, timed or written.
+"""
+
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+DEFAULT_TELEMETRY_PATH = "docs/state/telemetry.jsonl"
+
+
+_current: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "migration_framework_span", default=None
+)
+
+
+class Span:
+    """A timed operation; use as a context manager."""
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "status",
+        "start_ns",
+        "end_ns",
+        "_t0",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        kind: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id: str = parent.trace_id if parent is not None else tracer.trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_ns = 0
+        self.end_ns = 0
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def add(self, key: str, amount: float = 1) -> None:
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def fail(self, error: Optional[str] = None) -> None:
+        self.status = "error"
+        if error:
+            self.attributes["error"] = error
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        self.start_ns = time.time_ns()
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._t0)
+        _current.reset(self._token)
+        if exc is not None:
+            self.fail(f"{exc_type.__name__}: {exc}")
+        self.tracer.export(self)
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stands in for :class:`Span` when telemetry is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: float = 1) -> None:
+        pass
+
+    def fail(self, error: Optional[str] = None) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Writes finished spans to a JSONL file, or does nothing if ``path`` is None.
+
+    Safe to share between threads. A span's parent is the span open where
+    it is created; context does not cross threads, so spans for worker
+    threads are created on the dispatching thread or given ``parent``.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, trace_id: Optional[str] = None):
+        self.path = Path(path) if path is not None else None
+        self.enabled = self.path is not None
+        # Processes sharing MIGRATION_TRACE_ID report as a single run
+        self.trace_id = trace_id or os.environ.get("MIGRATION_TRACE_ID") or secrets.token_hex(16)
+        self._lock = threading.Lock()
+        self._fh: Optional[IO[str]] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def span(
+        self,
+        name: str,
+        kind: str = "internal",
+        parent: Optional[Span] = None,
+        **attributes: Any,
+    ) -> Union[Span, _NoopSpan]:
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, kind, parent or _current.get(), attributes)
+
+    def record(
+        self,
+        name: str,
+        kind: str,
+        start_ns: int,
+        end_ns: int,
+        status: str = "ok",
+        **attributes: Any,
+    ) -> None:
+        """Export a span timed elsewhere (e.g. imported from an agent progress file)."""
+        if not self.enabled:
+            return
+        span = Span(self, name, kind, _current.get(), attributes)
+        span.start_ns, span.end_ns, span.status = start_ns, end_ns, status
+        self.export(span)
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_record(), ensure_ascii=False, default=str)
+        with self._lock:
+            if self.path is None:
+                return
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8")
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+# Enabled for the whole process tree by exporting MIGRATION_TELEMETRY=<path>
+_tracer = Tracer(os.environ.get("MIGRATION_TELEMETRY") or None)
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Install ``tracer`` as the process-wide tracer and return the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """The innermost open span of this thread/task, for adding attributes."""
+    span = _current.get()
+    return span if span is not None else NOOP_SPAN
+
+
+def parse_time_ns(value: str) -> int:
+    """ISO-8601 timestamp (``2026-01-02T10:00:00Z``) to Unix nanoseconds."""
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1e9)
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class TaskTiming:
+    task_id: str
+    agent: str
+    start: float
+    end: float
+    queue_wait: float = 0.0
+    retries: int = 0
+    tokens: int = 0
+    test_runtime: float = 0.0
+    status: str = "ok"
+    level: Optional[int] = None
+    unblocked_by: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class TelemetryReport:
+    """Aggregated view of a telemetry file (times in seconds)."""
+
+    phases: List[Dict[str, Any]] = field(default_factory=list)
+    tasks: Dict[str, TaskTiming] = field(default_factory=dict)
+    # execution level -> tasks, first start, last end
+    levels: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    # agent -> busy seconds, worker slots, utilization (0-1)
+    utilization: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    def slowest(self, limit: int = 10) -> List[TaskTiming]:
+        return sorted(self.tasks.values(), key=lambda t: t.duration, reverse=True)[:limit]
+
+
+def read_spans(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Span records from a JSONL file; a torn last line is ignored."""
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def build_report(
+    spans: Iterable[Dict[str, Any]], trace_id: Optional[str] = None
+) -> TelemetryReport:
+    """
+    Aggregate span records, by default those of the most recent trace.
+
+    The critical path follows ``unblocked_by`` back from the task that
+    finished last: each agent span names the dependency whose completion
+    made it ready, so the chain is the one actually observed, waits
+    included.
+    """
+    spans = list(spans)
+    if trace_id is None and spans:
+        trace_id = max(spans, key=lambda s: s["end_time_unix_nano"])["trace_id"]
+    spans = [s for s in spans if s["trace_id"] == trace_id]
+    report = TelemetryReport()
+    if not spans:
+        return report
+
+    origin = min(s["start_time_unix_nano"] for s in spans)
+    report.wall_time = (max(s["end_time_unix_nano"] for s in spans) - origin) / 1e9
+    workers: Dict[str, int] = {}
+
+    for span in sorted(spans, key=lambda s: s["start_time_unix_nano"]):
+        attrs = span.get("attributes") or {}
+        start = (span["start_time_unix_nano"] - origin) / 1e9
+        end = (span["end_time_unix_nano"] - origin) / 1e9
+        if span["kind"] == "phase":
+            report.phases.append(
+                {
+                    "name": span["name"],
+                    "start": start,
+                    "duration": end - start,
+                    "status": span["status"],
+                }
+            )
+            workers.update(attrs.get("workers") or {})
+        elif span["kind"] == "agent" and attrs.get("task_id"):
+            report.tasks[attrs["task_id"]] = TaskTiming(
+                task_id=attrs["task_id"],
+                agent=attrs.get("agent", "unknown"),
+                start=start,
+                end=end,
+                queue_wait=attrs.get("queue_wait_s", 0.0),
+                retries=attrs.get("retries", 0),
+                tokens=attrs.get("tokens", 0),
+                test_runtime=attrs.get("test_runtime_s", 0.0),
+                status=span["status"],
+                level=attrs.get("level"),
+                unblocked_by=attrs.get("unblocked_by"),
+            )
+
+    for timing in report.tasks.values():
+        if timing.level is None:
+            continue
+        stats = report.levels.setdefault(
+            timing.level, {"tasks": 0, "start": timing.start, "end": timing.end}
+        )
+        stats["tasks"] += 1
+        stats["start"] = min(stats["start"], timing.start)
+        stats["end"] = max(stats["end"], timing.end)
+
+    if report.tasks:
+        current: Optional[TaskTiming] = max(report.tasks.values(), key=lambda t: t.end)
+        path: List[str] = []
+        while current is not None and current.task_id not in path:
+            path.append(current.task_id)
+            current = report.tasks.get(current.unblocked_by or "")
+        report.critical_path = path[::-1]
+
+        by_agent: Dict[str, List[TaskTiming]] = defaultdict(list)
+        for timing in report.tasks.values():
+            by_agent[timing.agent].append(timing)
+        # Utilization is measured over the execution window: first agent start to last end
+        first_start = min(t.start for t in report.tasks.values())
+        window = max(t.end for t in report.tasks.values()) - first_start
+        for agent, timings in by_agent.items():
+            busy = sum(t.duration for t in timings)
+            slots = workers.get(agent) or _peak_concurrency(timings)
+            report.utilization[agent] = {
+                "busy": busy,
+                "workers": slots,
+                "utilization": busy / (window * slots) if window > 0 else 1.0,
+            }
+    return report
+
+
+def _peak_concurrency(timings: List[TaskTiming]) -> int:
+    events = sorted([(t.start, 1) for t in timings] + [(t.end, -1) for t in timings])
+    peak = running = 0
+    for _, delta in events:
+        running += delta
+        peak = max(peak, running)
+    return peak or 1
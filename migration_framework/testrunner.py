@@ -0,0 +1,670 @@
+"""
+Sharded smoke/E2E test stage with failure-only re-execution.
+
+The e2e-qa-agent loop used to re-run the whole Playwright suite after
+every fix (``ExecutionMetrics.e2e_iterations``). This stage runs the
+pytest and Playwright suites of the generated project instead:
+
+- test files are sharded across local worker processes, balanced by the
+  durations recorded on previous runs (longest first);
+- on the next iteration only the tests that failed, the test files
+  affected by files changed since the last run and new test files are
+  run again. Impact comes from the Python import graph (pytest) and
+  from spec imports plus feature names in paths (Playwright, e.g.
+  ``frontend/app/customers/page.tsx`` → ``tests/e2e/customers/``); a
+  change whose impact cannot be traced re-runs the whole suite;
+- per-test results are kept in ``docs/state/test-runs.json`` so the
+  ``tests_passed``/``tests_failed``/``e2e_pass_rate`` metrics always
+  describe the whole suite, not only the tests of the last iteration.
+
+Each shard gets ``MIGRATION_TEST_SHARD``/``MIGRATION_TEST_SHARDS`` in its
+environment so fixtures can isolate per-shard resources (databases).
+"""
+
+import ast
+import hashlib
+import heapq
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from io import BufferedWriter
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from migration_framework.telemetry import current_span, get_tracer
+
+DEFAULT_RESULTS_PATH = "docs/state/test-runs.json"
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+# Weight of a test file never run before, in seconds
+DEFAULT_FILE_WEIGHT = 1.0
+
+PYTEST = "pytest"
+PLAYWRIGHT = "playwright"
+
+PYTEST_COMMAND = (sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider")
+PLAYWRIGHT_COMMAND = ("npx", "playwright", "test", "--workers=1")
+
+# Directories never snapshotted (build output, dependencies, reports)
+EXCLUDED_DIRS = {
+    ".git",
+    ".next",
+    ".pytest_cache",
+    ".venv",
+    "__pycache__",
+    "build",
+    "coverage",
+    "dist",
+    "node_modules",
+    "playwright-report",
+    "test-results",
+    "venv",
+}
+# Changes to these never affect tests
+IGNORED_SUFFIXES = {".md", ".txt", ".log"}
+
+_PYTEST_FILE = re.compile(r"(^test_.*|.*_test)\.py$")
+_PLAYWRIGHT_FILE = re.compile(r".*\.(spec|test)\.[cm]?[jt]sx?$")
+_JS_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+_JS_IMPORT = re.compile(
+    r"""(?:from\s*|import\s*\(\s*|require\s*\(\s*|^\s*import\s+)['"]([^'"]+)['"]""", re.M
+)
+
+# Path segments that name a layer or a framework folder rather than a feature
+_GENERIC_SEGMENTS = {
+    "api", "app", "application", "backend", "component", "components", "core",
+    "domain", "e2e", "entities", "entity", "frontend", "hooks", "index", "infrastructure",
+    "layout", "lib", "models", "page", "pages", "repositories", "repository", "route",
+    "routes", "schemas", "services", "spec", "src", "styles", "test", "tests", "types",
+    "ui", "use_cases", "usecases", "utils", "v1", "value_objects",
+}  # fmt: skip
+
+
+class SuiteError(ValueError):
+    """Raised when a suite's test runner cannot be started."""
+
+
+@dataclass
+class Suite:
+    """A test suite of the generated project."""
+
+    name: str
+    runner: str  # PYTEST or PLAYWRIGHT
+    root: Path  # working directory of the runner
+    test_dir: str = "tests"  # relative to ``root``
+
+    def __post_init__(self):
+        self.root = Path(self.root)
+        if self.runner not in (PYTEST, PLAYWRIGHT):
+            raise ValueError(f"unknown test runner {self.runner!r}")
+
+    def is_test_file(self, path: str) -> bool:
+        pattern = _PYTEST_FILE if self.runner == PYTEST else _PLAYWRIGHT_FILE
+        return pattern.match(PurePosixPath(path).name) is not None
+
+
+@dataclass
+class SuiteRun:
+    """What one iteration ran for a suite."""
+
+    name: str
+    runner: str
+    full: bool
+    selected: List[str] = field(default_factory=list)  # files and test IDs
+    shards: int = 0
+    duration: float = 0.0
+    results: Dict[str, str] = field(default_factory=dict)  # test ID -> status
+
+    @property
+    def failed(self) -> List[str]:
+        return sorted(tid for tid, status in self.results.items() if status == "failed")
+
+
+@dataclass
+class RunReport:
+    """One iteration of the test stage, plus whole-suite totals."""
+
+    changed_files: List[str] = field(default_factory=list)
+    runs: Dict[str, SuiteRun] = field(default_factory=dict)
+    # suite -> {"passed": n, "failed": n, "skipped": n} over every known test
+    totals: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    e2e_iterations: int = 0
+
+    @property
+    def success(self) -> bool:
+        return all(t["failed"] == 0 for t in self.totals.values())
+
+    def metrics(self) -> Dict[str, Any]:
+        """The ``ExecutionMetrics`` fields (``docs/schemas/tasks-schema.ts``)."""
+        passed = sum(t["passed"] for t in self.totals.values())
+        failed = sum(t["failed"] for t in self.totals.values())
+        metrics: Dict[str, Any] = {"tests_passed": passed, "tests_failed": failed}
+        e2e = [self.totals[name] for name, run in self.runs.items() if run.runner == PLAYWRIGHT]
+        ran = sum(t["passed"] + t["failed"] for t in e2e)
+        if ran:
+            metrics["e2e_pass_rate"] = round(sum(t["passed"] for t in e2e) / ran, 4)
+            metrics["e2e_iterations"] = self.e2e_iterations
+        return metrics
+
+
+class ShardedTestStage:
+    """Runs suites in shards and remembers results between iterations."""
+
+    def __init__(
+        self,
+        suites: Iterable[Suite],
+        workers: int = DEFAULT_WORKERS,
+        state_path: Union[str, Path] = DEFAULT_RESULTS_PATH,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.suites = list(suites)
+        self.workers = workers
+        self.state_path = Path(state_path)
+        self.state = self._load_state()
+
+    def run(self, full: bool = False) -> RunReport:
+        """Run one iteration; ``full`` ignores previous results."""
+        snapshot = self._snapshot()
+        previous = self.state.get("files", {})
+        changed = sorted(
+            path
+            for path in set(snapshot) | set(previous)
+            if snapshot.get(path, [None])[-1] != previous.get(path, [None])[-1]
+        )
+        report = RunReport(changed_files=[] if full or not previous else changed)
+
+        for suite in self.suites:
+            suite_state = self.state["suites"].setdefault(suite.name, {"tests": {}})
+            run = self._run_suite(suite, suite_state, snapshot, report.changed_files, full)
+            report.runs[suite.name] = run
+            counts = {"passed": 0, "failed": 0, "skipped": 0}
+            for test in suite_state["tests"].values():
+                counts[test["status"]] = counts.get(test["status"], 0) + 1
+            report.totals[suite.name] = counts
+            if suite.runner == PLAYWRIGHT and run.selected:
+                suite_state["iterations"] = suite_state.get("iterations", 0) + 1
+            if suite.runner == PLAYWRIGHT:
+                report.e2e_iterations = max(report.e2e_iterations, suite_state.get("iterations", 0))
+
+        # The pre-run snapshot: edits made while tests ran show up next time
+        self.state["files"] = snapshot
+        self._save_state()
+        return report
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def _run_suite(
+        self,
+        suite: Suite,
+        suite_state: Dict[str, Any],
+        snapshot: Dict[str, List[Any]],
+        changed: List[str],
+        full: bool,
+    ) -> SuiteRun:
+        prefix = _relative_prefix(suite.root)
+        files = sorted(
+            p[len(prefix) :]
+            for p in snapshot
+            if p.startswith(prefix)
+            and p[len(prefix) :].startswith(suite.test_dir.rstrip("/") + "/")
+            and suite.is_test_file(p)
+        )
+        tests = suite_state["tests"]
+        # Forget tests whose file is gone
+        for tid in [t for t, v in tests.items() if v["file"] not in files]:
+            del tests[tid]
+
+        known_files = {v["file"] for v in tests.values()}
+        run_all = full or not known_files
+        if run_all:
+            selected_files = set(files)
+        else:
+            local_changes = [p[len(prefix) :] for p in changed if p.startswith(prefix)]
+            foreign_changes = [p for p in changed if not p.startswith(prefix)]
+            affected = self._affected(suite, files, snapshot, local_changes, foreign_changes)
+            selected_files = affected | (set(files) - known_files)
+        failed_ids = [
+            tid
+            for tid, v in tests.items()
+            if v["status"] == "failed" and v["file"] not in selected_files
+        ]
+        run = SuiteRun(suite.name, suite.runner, full=run_all)
+        run.selected = sorted(selected_files) + sorted(failed_ids)
+        if not run.selected:
+            return run
+
+        durations: Dict[str, float] = {}
+        for v in tests.values():
+            durations[v["file"]] = durations.get(v["file"], 0.0) + v.get("duration", 0.0)
+        weights = [
+            (
+                (
+                    durations.get(u, DEFAULT_FILE_WEIGHT)
+                    if u in selected_files
+                    else tests[u].get("duration", 0.0)
+                ),
+                u,
+            )
+            for u in run.selected
+        ]
+        shards = _balance(weights, self.workers)
+        run.shards = len(shards)
+
+        enclosing = current_span()
+        started = time.perf_counter()
+        with get_tracer().span(
+            f"tests: {suite.name}",
+            kind="tests",
+            selected=len(run.selected),
+            shards=run.shards,
+            full=run_all,
+        ) as span:
+            results = _execute(suite, shards)
+            span.set(failed=sum(1 for s in results.values() if s["status"] == "failed"))
+        run.duration = time.perf_counter() - started
+        enclosing.add("test_runtime_s", run.duration)
+
+        # Files run whole are replaced so renamed/removed tests disappear
+        for tid in [t for t, v in tests.items() if v["file"] in selected_files]:
+            del tests[tid]
+        for tid in failed_ids:
+            tests.pop(tid, None)
+        tests.update(results)
+        run.results = {tid: v["status"] for tid, v in results.items()}
+        return run
+
+    def _affected(
+        self,
+        suite: Suite,
+        test_files: List[str],
+        snapshot: Dict[str, List[Any]],
+        local_changes: List[str],
+        foreign_changes: List[str],
+    ) -> Set[str]:
+        """Test files (relative to the suite root) affected by the changed files."""
+        local_changes = [
+            p for p in local_changes if PurePosixPath(p).suffix not in IGNORED_SUFFIXES
+        ]
+        affected = {p for p in local_changes if p in test_files}
+        sources = [p for p in local_changes if p not in affected]
+        prefix = _relative_prefix(suite.root)
+        local_files = [p[len(prefix) :] for p in snapshot if p.startswith(prefix)]
+
+        if suite.runner == PYTEST:
+            imports = self.state.setdefault("imports", {})
+            graph = _python_dependents(suite.root, local_files, imports, snapshot, prefix)
+            for path in sources:
+                if path.endswith(".py"):
+                    affected |= _reachable(graph, path) & set(test_files)
+                else:
+                    # Data/config files: the tests that mention them by name
+                    name = PurePosixPath(path).name
+                    affected |= {t for t in test_files if name in _read(suite.root / t)}
+            return affected
+
+        # Playwright: spec imports first, then feature names shared with the spec path
+        graph = _js_dependents(suite.root, local_files)
+        other_tests = tuple(
+            _relative_prefix(s.root) + s.test_dir.rstrip("/") + "/"
+            for s in self.suites
+            if s is not suite
+        )
+        foreign = [
+            p
+            for p in foreign_changes
+            if PurePosixPath(p).suffix not in IGNORED_SUFFIXES and not p.startswith(other_tests)
+        ]
+        for path in sources + foreign:
+            hits = _reachable(graph, path) & set(test_files)
+            tokens = _feature_tokens(path)
+            hits |= {t for t in test_files if tokens & _feature_tokens(t)}
+            if not hits:
+                return set(test_files)  # impact unknown
+            affected |= hits
+        return affected
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> Dict[str, List[Any]]:
+        """``path -> [mtime_ns, size, sha1]``; files whose stat is unchanged are not re-hashed."""
+        previous = self.state.get("files", {})
+        snapshot: Dict[str, List[Any]] = {}
+        for suite in self.suites:
+            if not suite.root.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(suite.root):
+                dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    key = Path(os.path.relpath(path)).as_posix()
+                    stat = os.stat(path)
+                    old = previous.get(key)
+                    if old and old[0] == stat.st_mtime_ns and old[1] == stat.st_size:
+                        snapshot[key] = old
+                    else:
+                        snapshot[key] = [stat.st_mtime_ns, stat.st_size, _sha1(path)]
+        return snapshot
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        return {"suites": {}, "files": {}}
+
+    def _save_state(self) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.state, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+
+# ----------------------------------------------------------------------
+# Execution
+# ----------------------------------------------------------------------
+
+
+def _balance(weights: Sequence[Tuple[float, str]], workers: int) -> List[List[str]]:
+    """Longest-processing-time-first assignment of units to ``workers`` shards."""
+    count = min(workers, len(weights))
+    heap = [(0.0, i) for i in range(count)]
+    shards: List[List[str]] = [[] for _ in range(count)]
+    for weight, unit in sorted(weights, key=lambda w: (-w[0], w[1])):
+        load, i = heapq.heappop(heap)
+        shards[i].append(unit)
+        heapq.heappush(heap, (load + weight, i))
+    return shards
+
+
+def _execute(suite: Suite, shards: List[List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Run every shard as a subprocess at once and merge their results."""
+    # Reports and logs only live until the results are parsed
+    with tempfile.TemporaryDirectory(prefix=f"shards-{suite.name}-") as tmp:
+        out_dir = Path(tmp)
+        processes: List[Tuple[List[str], Path, "subprocess.Popen[bytes]", BufferedWriter]] = []
+        for index, units in enumerate(shards):
+            env = dict(
+                os.environ, MIGRATION_TEST_SHARD=str(index), MIGRATION_TEST_SHARDS=str(len(shards))
+            )
+            report = out_dir / f"shard-{index}.{'xml' if suite.runner == PYTEST else 'json'}"
+            if suite.runner == PYTEST:
+                command = [
+                    *PYTEST_COMMAND,
+                    "-o",
+                    "junit_family=xunit1",
+                    f"--junitxml={report}",
+                    *units,
+                ]
+            else:
+                output = out_dir / f"shard-{index}"
+                command = [*PLAYWRIGHT_COMMAND, "--reporter=json", f"--output={output}", *units]
+                env["PLAYWRIGHT_JSON_OUTPUT_NAME"] = str(report)
+            log = open(out_dir / f"shard-{index}.log", "wb")
+            try:
+                process = subprocess.Popen(
+                    command, cwd=suite.root, env=env, stdout=log, stderr=subprocess.STDOUT
+                )
+            except OSError as exc:
+                # Runner not installed: stop the shards already started, nothing ran
+                log.close()
+                for _, _, started, started_log in processes:
+                    started.kill()
+                    started.wait()
+                    started_log.close()
+                raise SuiteError(
+                    f"cannot run the {suite.name} suite ({command[0]}): {exc}"
+                ) from exc
+            processes.append((units, report, process, log))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for units, report, process, log in processes:
+            process.wait()
+            log.close()
+            parsed = _parse_report(suite, report) if report.exists() else {}
+            if not parsed:
+                # Crashed before reporting: fail the shard's units so they run again
+                parsed = {
+                    unit: {"file": _unit_file(suite, unit), "status": "failed", "duration": 0.0}
+                    for unit in units
+                }
+            results.update(parsed)
+        if suite.runner == PLAYWRIGHT:
+            _merge_last_run(suite, out_dir, len(processes))
+    return results
+
+
+def _unit_file(suite: Suite, unit: str) -> str:
+    """Test file of a shard unit (a file, a pytest node ID or a Playwright ``file:line``)."""
+    if suite.runner == PYTEST:
+        return unit.split("::")[0]
+    return re.sub(r":\d+$", "", unit)
+
+
+def _parse_report(suite: Suite, report: Path) -> Dict[str, Dict[str, Any]]:
+    if suite.runner == PYTEST:
+        return _parse_junit(report)
+    return _parse_playwright(suite, report)
+
+
+def _parse_junit(report: Path) -> Dict[str, Dict[str, Any]]:
+    """pytest ``junit_family=xunit1`` XML to ``node ID -> result``."""
+    results = {}
+    for case in ET.parse(report).iter("testcase"):
+        path = case.get("file")
+        if not path:
+            continue
+        module = path[:-3].replace("/", ".")
+        if case.get("name") == module:
+            node_id = path  # collection error: re-run the whole file
+        else:
+            cls = case.get("classname", "")[len(module) + 1 :]
+            node_id = "::".join(p for p in (path, cls, case.get("name", "")) if p)
+        if case.find("failure") is not None or case.find("error") is not None:
+            status = "failed"
+        elif case.find("skipped") is not None:
+            status = "skipped"
+        else:
+            status = "passed"
+        results[node_id] = {
+            "file": path,
+            "status": status,
+            "duration": float(case.get("time") or 0),
+        }
+    return results
+
+
+def _parse_playwright(suite: Suite, report: Path) -> Dict[str, Dict[str, Any]]:
+    """Playwright JSON report to ``file:line -> result`` (paths relative to the suite root)."""
+    data = json.loads(report.read_text(encoding="utf-8"))
+    root_dir = Path(data.get("config", {}).get("rootDir") or suite.root)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def walk(node: Dict[str, Any]) -> None:
+        for spec in node.get("specs", []):
+            path = Path(os.path.relpath(root_dir / spec["file"], suite.root)).as_posix()
+            tid = f"{path}:{spec['line']}"
+            entry = results.setdefault(tid, {"file": path, "status": "skipped", "duration": 0.0})
+            for test in spec.get("tests", []):
+                entry["duration"] += (
+                    sum(r.get("duration", 0) for r in test.get("results", [])) / 1000
+                )
+                status = test.get("status")
+                if status == "unexpected":
+                    entry["status"] = "failed"
+                elif status in ("expected", "flaky") and entry["status"] != "failed":
+                    entry["status"] = "passed"
+        for child in node.get("suites", []):
+            walk(child)
+
+    walk(data)
+    return results
+
+
+def _merge_last_run(suite: Suite, out_dir: Path, shards: int) -> None:
+    """Combine the shards' ``.last-run.json`` so ``playwright test --last-failed`` keeps working."""
+    failed: List[str] = []
+    for index in range(shards):
+        last_run = out_dir / f"shard-{index}" / ".last-run.json"
+        if last_run.exists():
+            failed.extend(json.loads(last_run.read_text(encoding="utf-8")).get("failedTests", []))
+    target = suite.root / "test-results" / ".last-run.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps({"status": "failed" if failed else "passed", "failedTests": failed}, indent=2),
+        encoding="utf-8",
+    )
+
+
+# ----------------------------------------------------------------------
+# Impact analysis
+# ----------------------------------------------------------------------
+
+
+def _python_dependents(
+    root: Path,
+    files: List[str],
+    cache: Dict[str, List[Any]],
+    snapshot: Dict[str, List[Any]],
+    prefix: str,
+) -> Dict[str, Set[str]]:
+    """Reverse import graph of the Python files under ``root`` (``module file -> importers``)."""
+    modules = {}
+    for path in files:
+        if path.endswith(".py"):
+            parts = path[:-3].split("/")
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            modules[".".join(parts)] = path
+
+    dependents: Dict[str, Set[str]] = {}
+    for path in files:
+        if not path.endswith(".py"):
+            continue
+        digest = snapshot[prefix + path][-1]
+        cached = cache.get(prefix + path)
+        if cached is None or cached[0] != digest:
+            cached = cache[prefix + path] = [digest, _python_imports(root / path, path)]
+        for name in cached[1]:
+            # Importing a.b.c also runs a/__init__.py and a/b/__init__.py
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = modules.get(".".join(parts[:i]))
+                if target is not None and target != path:
+                    dependents.setdefault(target, set()).add(path)
+        # Tests use the fixtures of every conftest.py above them
+        parent = PurePosixPath(path).parent
+        while True:
+            conftest = (parent / "conftest.py").as_posix()
+            if conftest in files and conftest != path:
+                dependents.setdefault(conftest, set()).add(path)
+            if parent == parent.parent:
+                break
+            parent = parent.parent
+    return dependents
+
+
+def _python_imports(path: Path, relative: str) -> List[str]:
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return []
+    package = relative[:-3].split("/")[:-1]
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = package[: len(package) - node.level + 1] if node.level else []
+            module = ".".join([*base, node.module] if node.module else base)
+            names.extend(f"{module}.{alias.name}" if module else alias.name for alias in node.names)
+            if module:
+                names.append(module)
+    return sorted(set(names))
+
+
+def _js_dependents(root: Path, files: List[str]) -> Dict[str, Set[str]]:
+    """Reverse import graph of the JS/TS files under ``root`` (relative and ``@/`` imports)."""
+    known = set(files)
+    dependents: Dict[str, Set[str]] = {}
+    for path in files:
+        if not path.endswith(_JS_SUFFIXES):
+            continue
+        for spec in _JS_IMPORT.findall(_read(root / path)):
+            if spec.startswith("."):
+                base = os.path.normpath(os.path.join(os.path.dirname(path), spec))
+                candidates = [base]
+            elif spec.startswith("@/"):
+                candidates = [spec[2:], f"src/{spec[2:]}"]
+            else:
+                continue
+            target = _resolve_js(candidates, known)
+            if target is not None:
+                dependents.setdefault(target, set()).add(path)
+    return dependents
+
+
+def _resolve_js(candidates: List[str], known: Set[str]) -> Optional[str]:
+    for base in candidates:
+        base = Path(base).as_posix()
+        options = [
+            base,
+            *(base + s for s in _JS_SUFFIXES),
+            *(f"{base}/index{s}" for s in _JS_SUFFIXES),
+        ]
+        for option in options:
+            if option in known:
+                return option
+    return None
+
+
+def _reachable(dependents: Dict[str, Set[str]], start: str) -> Set[str]:
+    seen = {start}
+    stack = [start]
+    while stack:
+        for dependent in dependents.get(stack.pop(), ()):
+            if dependent not in seen:
+                seen.add(dependent)
+                stack.append(dependent)
+    return seen
+
+
+def _feature_tokens(path: str) -> Set[str]:
+    """Feature names in a path: ``frontend/app/customers/[id]/page.tsx`` → ``{"customer"}``."""
+    tokens = set()
+    parts = PurePosixPath(path).parts
+    for i, part in enumerate(parts):
+        if i == len(parts) - 1:
+            part = part.split(".")[0]
+        for word in re.split(r"[-_.\[\]()\s]+", part.lower()):
+            if len(word) < 3 or word in _GENERIC_SEGMENTS or word.isdigit():
+                continue
+            tokens.add(word[:-1] if word.endswith("s") and len(word) > 3 else word)
+    return tokens
+
+
+def _relative_prefix(root: Path) -> str:
+    prefix = Path(os.path.relpath(root)).as_posix()
+    return "" if prefix == "." else prefix + "/"
+
+
+def _sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
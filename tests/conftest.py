@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+
+def make_task(
+    task_id: str,
+    dependencies: Optional[List[str]] = None,
+    owner: str = "domain-agent",
+    effort: str = "60 minutes",
+    **fields: Any,
+) -> Dict[str, Any]:
+    """A minimal valid task in the ``docs/input`` spelling."""
+    task = {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "description": f"Implement {task_id}",
+        "deliverables": [f"src/{task_id.lower()}.py"],
+        "dependencies": list(dependencies or []),
+        "effortEstimate": effort,
+        "owner": owner,
+    }
+    task.update(fields)
+    return task
+
+
+@pytest.fixture
+def task_factory():
+    return make_task
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from migration_framework.assignment import (
+    DEFAULT_RULES,
+    AssignmentEngine,
+    AssignmentRuleError,
+    assign_agent,
+)
+
+
+@pytest.fixture
+def engine():
+    return AssignmentEngine(DEFAULT_RULES)
+
+
+@pytest.mark.parametrize(
+    "fields, agent, rule",
+    [
+        (
+            {"implementation_layer": "domain", "deliverables": ["models/x.py"]},
+            "domain-agent",
+            "domain-layer",
+        ),
+        ({"implementation_layer": "use_case"}, "use-case-agent", "application-layer"),
+        (
+            {"deliverables": ["schemas/x.py", "models/x.py"]},
+            "infrastructure-agent",
+            "sqlalchemy-models",
+        ),
+        ({"deliverables": ["src/schemas/x.py"]}, "use-case-agent", "pydantic-schemas"),
+        ({"description": "Pure Business Logic"}, "domain-agent", "business-rules"),
+        ({"title": "Domain", "deliverables": ["tests/e2e/x.spec.ts"]}, "e2e-qa-agent", "e2e-tests"),
+        ({"deliverables": ["tests/unit/test_x.py"]}, "qa-test-generator", "unit-integration-tests"),
+        (
+            {"deliverables": ["frontend/tests/E2E/x.spec.ts"]},
+            "qa-test-generator",
+            "unit-integration-tests",
+        ),
+        ({"deliverables": ["frontend/src/App.tsx"]}, "infrastructure-agent", "api-and-ui"),
+        ({"deliverables": ["README.md"]}, "infrastructure-agent", None),
+    ],
+)
+def test_first_matching_rule_wins(engine, task_factory, fields, agent, rule):
+    task = task_factory("TASK-001", **{"description": "Implement it", **fields})
+
+    decision = engine.classify(task)
+
+    assert (decision.agent, decision.rule) == (agent, rule)
+    assert engine.agent_for(task) == agent
+
+
+def test_patterns_do_not_span_two_deliverables(engine, task_factory):
+    task = task_factory("TASK-001", description="", deliverables=["src/tests", "/x.py"])
+
+    assert engine.classify(task).rule is None
+
+
+def test_decision_explains_the_matched_patterns(engine, task_factory):
+    task = task_factory(
+        "TASK-001", description="", deliverables=["tests/e2e/a.spec.ts", "frontend/app.tsx"]
+    )
+
+    decision = engine.classify(task)
+
+    assert decision.matched == {"deliverables": ["tests/", "e2e"]}
+    assert decision.explain() == "TASK-001 → e2e-qa-agent [e2e-tests] deliverables: tests/, e2e"
+    assert engine.classify(task_factory("TASK-002", description="", deliverables=[])).explain() == (
+        "TASK-002 → infrastructure-agent (default)"
+    )
+
+
+def test_repeated_descriptions_are_classified_consistently(engine, task_factory):
+    tasks = [task_factory(f"TASK-{i}", description=f"Domain rule {i % 2}") for i in range(6)]
+    tasks.append(task_factory("TASK-X", description="Other", deliverables=["api/x.py"]))
+
+    agents = [d.agent for d in engine.classify_all(tasks + tasks)]
+
+    assert agents == (["domain-agent"] * 6 + ["infrastructure-agent"]) * 2
+
+
+def test_config_rules_are_tried_before_the_defaults(task_factory, tmp_path):
+    path = tmp_path / "assignment-rules.json"
+    config = {
+        "rules": [
+            {
+                "name": "shadcn",
+                "agent": "shadcn-ui-agent",
+                "when": {"deliverables": "components/ui/"},
+            }
+        ]
+    }
+    path.write_text(json.dumps(config), encoding="utf-8")
+    engine = AssignmentEngine.from_file(path)
+
+    ui = task_factory("TASK-001", deliverables=["frontend/components/ui/button.tsx"])
+    api = task_factory("TASK-002", description="", deliverables=["api/x.py"])
+
+    assert engine.classify(ui).agent == "shadcn-ui-agent"
+    assert engine.classify(api).rule == "api-and-ui"
+
+    replaced = AssignmentEngine.from_config(
+        {**config, "extend_defaults": False, "default_agent": "x"}
+    )
+    assert replaced.classify(api).agent == "x"
+
+
+@pytest.mark.parametrize(
+    "rule, message",
+    [
+        ({"when": {"title": "x"}}, "missing 'agent'"),
+        ({"agent": "a", "when": {"owner": "x"}}, "unknown field 'owner'"),
+        ({"agent": "a"}, "no conditions"),
+    ],
+)
+def test_malformed_rules_are_rejected(rule, message):
+    with pytest.raises(AssignmentRuleError, match=message):
+        AssignmentEngine([rule])
+
+
+def test_assign_agent_uses_the_default_engine(task_factory):
+    assert assign_agent(task_factory("TASK-001", deliverables=["schemas/x.py"])) == "use-case-agent"
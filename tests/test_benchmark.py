@@ -0,0 +1,268 @@
+import json
+import sys
+
+import pytest
+
+from migration_framework.benchmark import (
+    BenchmarkError,
+    BenchmarkRun,
+    LoadProfile,
+    Scenario,
+    ScenarioResult,
+    attribute,
+    compare,
+    load_run,
+)
+from migration_framework.cli import main
+
+
+def make_run(throughput=100.0, **scenarios):
+    return BenchmarkRun(
+        started_at="2026-01-02T10:00:00+00:00",
+        database="sqlite",
+        users=10,
+        duration_s=15,
+        scenarios={
+            name: ScenarioResult(
+                name, requests=100, throughput_rps=throughput / len(scenarios), **metrics
+            )
+            for name, metrics in scenarios.items()
+        },
+    )
+
+
+def test_compare_flags_slower_p95_extra_queries_and_new_full_scans():
+    baseline = make_run(
+        get=dict(p95_ms=50, queries_per_request=2),
+        listing=dict(p95_ms=10, queries_per_request=1),
+        transfer=dict(p95_ms=100, queries_per_request=5, full_scans=["accounts"]),
+    )
+    run = make_run(
+        get=dict(p95_ms=70, queries_per_request=2.5),
+        # +40% but only 4 ms: noise
+        listing=dict(p95_ms=14, queries_per_request=51),
+        transfer=dict(p95_ms=110, queries_per_request=5, full_scans=["accounts", "transactions"]),
+    )
+
+    regressions = compare(run, baseline)
+
+    assert [(r.scenario, r.metric) for r in regressions] == [
+        ("get", "p95_ms"),
+        ("listing", "queries_per_request"),
+        ("transfer", "full scan transactions"),
+    ]
+    assert regressions[0].describe() == "get: p95_ms 50.00 → 70.00"
+    assert regressions[2].describe() == "transfer: new full scan transactions"
+
+
+def test_compare_checks_slos_errors_and_total_throughput():
+    baseline = make_run(throughput=100, get=dict(p95_ms=50))
+    run = make_run(throughput=70, get=dict(p95_ms=52, errors=5, tasks=["TASK-025"]))
+
+    regressions = compare(run, baseline, slos={"get": {"p95_ms": 40, "error_rate": 0.01}})
+
+    assert [(r.scenario, r.metric, r.slo) for r in regressions] == [
+        ("get", "p95_ms", True),
+        ("get", "error_rate", True),
+        ("get", "error_rate", False),
+        ("total", "throughput_rps", False),
+    ]
+    assert regressions[0].describe() == "get: p95_ms 52.00 (SLO 40) — TASK-025"
+    assert compare(run, None) == []
+
+
+def test_attribute_maps_scenarios_to_owning_tasks_and_nfrs(task_factory):
+    tasks = [
+        task_factory(
+            "TASK-025",
+            deliverables=["app/api/v1/endpoints/customers.py", "tests/test_customers.py"],
+            related_requirements=["FR-1", "NFR-21"],
+        ),
+        task_factory(
+            "TASK-008",
+            deliverables=["app/services/customer_service.py (updated)"],
+            related_requirements=["NFR-3"],
+        ),
+        task_factory("TASK-099", deliverables=["tests/integration/customers.py"]),
+    ]
+    scenarios = [
+        Scenario("get-customer", "/api/v1/customers/{customer_number}", requirements=["NFR-10"]),
+        Scenario("transfer", "/api/v1/transactions/transfer", resource="transactions"),
+    ]
+
+    attribute(scenarios, tasks)
+
+    assert scenarios[0].endpoint_resource == "customers"
+    assert scenarios[0].tasks == ["TASK-008", "TASK-025"]
+    assert scenarios[0].requirements == ["NFR-3", "NFR-10", "NFR-21"]
+    assert scenarios[1].tasks == []
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"scenarios": []}, "no scenarios"),
+        ({"users": 0}, "must be positive"),
+        ({"warmup_s": 15}, "warmup_s .15. must be shorter"),
+        ({"scenarios": [{"name": "a", "path": "/"}, {"name": "a", "path": "/x"}]}, "duplicate"),
+        ({"scenarios": [{"name": "a", "url": "/"}]}, "unexpected keyword"),
+    ],
+)
+def test_invalid_profiles_are_rejected(config, message):
+    with pytest.raises(BenchmarkError, match=message):
+        LoadProfile.from_config(config)
+
+
+def test_runs_round_trip_through_json(tmp_path):
+    run = make_run(get=dict(p95_ms=50, full_scans=["customers"]))
+    run.save(tmp_path / "state" / "benchmark.json")
+
+    assert load_run(tmp_path / "state" / "benchmark.json") == run
+    assert load_run(tmp_path / "missing.json") is None
+
+
+BACKEND = {
+    "app/__init__.py": "",
+    "app/db.py": """
+import os
+
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+engine = create_engine(os.environ["DATABASE_URL"])
+
+
+class Customer(Base):
+    __tablename__ = "customers"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+""",
+    "app/main.py": """
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db import Customer, engine
+
+app = FastAPI()
+
+
+@app.post("/api/v1/customers")
+def create_customer(body: dict):
+    with Session(engine) as session:
+        customer = Customer(name=body["name"])
+        session.add(customer)
+        session.commit()
+        return {"customer": {"name": customer.name}}
+
+
+@app.get("/api/v1/customers/{name}")
+def get_customer(name: str):
+    with Session(engine) as session:
+        customer = session.scalars(select(Customer).where(Customer.name == name)).first()
+        if customer is None:
+            raise HTTPException(404)
+        return {"name": customer.name}
+""",
+}
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    for module in ("fastapi", "httpx", "sqlalchemy"):
+        pytest.importorskip(module)
+    root = tmp_path / "backend"
+    for path, source in BACKEND.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(source, encoding="utf-8")
+    monkeypatch.setenv("DATABASE_URL", "")
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    yield root
+    for module in ("app", "app.main", "app.db"):
+        sys.modules.pop(module, None)
+
+
+PROFILE = {
+    "database_url": "sqlite:///{db_path}",
+    "metadata": "app.db:Base",
+    "users": 2,
+    "duration_s": 0.4,
+    "warmup_s": 0.1,
+    "data": [
+        {
+            "name": "customers",
+            "path": "/api/v1/customers",
+            "count": 5,
+            "json": {"name": "c{i}"},
+            "save": {"name": "customer.name"},
+        }
+    ],
+    "scenarios": [
+        {"name": "get-customer", "path": "/api/v1/customers/{name}"},
+        {"name": "missing", "path": "/api/v1/customers/nobody", "weight": 0.2},
+    ],
+}
+
+
+def benchmark_args(backend, tmp_path, **overrides):
+    profile = tmp_path / "benchmark.json"
+    profile.write_text(json.dumps({**PROFILE, **overrides}), encoding="utf-8")
+    state = tmp_path / "state"
+    return [
+        "benchmark",
+        "--backend",
+        str(backend),
+        "--profile",
+        str(profile),
+        "--baseline",
+        str(state / "baseline.json"),
+        "--output",
+        str(state / "benchmark.json"),
+    ]
+
+
+def test_cli_benchmarks_an_in_process_backend(backend, tmp_path, task_factory, capsys):
+    tasks = tmp_path / "tasks.json"
+    tasks.write_text(
+        json.dumps([task_factory("TASK-025", deliverables=["app/models/customer.py"])]),
+        encoding="utf-8",
+    )
+    state = tmp_path / "state"
+
+    assert main([*benchmark_args(backend, tmp_path), "--tasks", str(tasks)]) == 0
+
+    out = capsys.readouterr().out
+    assert "🌱 Datos sintéticos: 5 customers" in out
+    assert "📌 Baseline guardado" in out
+    run = load_run(state / "benchmark.json")
+    assert run is not None
+    result = run.scenarios["get-customer"]
+    assert result.requests > 0 and result.errors == 0
+    assert result.queries_per_request == 1
+    # customers.name has no index
+    assert result.full_scans == ["customers"]
+    assert result.tasks == ["TASK-025"]
+    assert run.scenarios["missing"].error_rate == 1.0
+
+
+def test_runs_without_measured_requests_never_become_the_baseline(backend, tmp_path, capsys):
+    scenarios = [*PROFILE["scenarios"], {"name": "idle", "path": "/", "weight": 0}]
+
+    assert main(benchmark_args(backend, tmp_path, scenarios=scenarios)) == 1
+
+    assert "❌ Sin peticiones medidas tras el warm-up: idle" in capsys.readouterr().out
+    assert not (tmp_path / "state" / "baseline.json").exists()
+
+
+def test_cli_rejects_durations_that_leave_nothing_to_measure(tmp_path, capsys):
+    args = benchmark_args(tmp_path, tmp_path)
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([*args, "--duration", "0"])
+    assert exit_info.value.code == 2
+    assert "expected a positive number, got '0'" in capsys.readouterr().err
+
+    # The profile's warm-up must still fit once --duration is applied
+    assert main([*args, "--duration", "0.1"]) == 1
+    assert "warmup_s (0.1) must be shorter than duration_s (0.1)" in capsys.readouterr().err
@@ -0,0 +1,150 @@
+import pytest
+
+from migration_framework.cache import CachedRunner, ResultCache
+from migration_framework.graph import TaskGraph
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "output"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path, workspace):
+    return ResultCache(tmp_path / "cache.db", root=workspace)
+
+
+class Agent:
+    """Writes one file per task and reports it as ``files_generated``."""
+
+    def __init__(self, root, contents=None):
+        self.root = root
+        self.contents = dict(contents or {})
+        self.calls = []
+        self.results = {}
+
+    def __call__(self, task):
+        self.calls.append(task["id"])
+        path = f"{task['id']}.py"
+        (self.root / path).write_text(self.contents.get(task["id"], task["id"]), encoding="utf-8")
+        self.results[task["id"]] = {"files_generated": [path], "execution_metrics": {"retries": 0}}
+        return True
+
+    def result_of(self, task):
+        return self.results[task["id"]]
+
+
+def run(tasks, agent, cache):
+    runner = CachedRunner(agent, cache, result_of=agent.result_of)
+    for task_id in TaskGraph(tasks).order:
+        runner(next(t for t in tasks if t["id"] == task_id))
+    return runner
+
+
+def test_unchanged_tasks_hit_and_restore_their_files(task_factory, cache, workspace):
+    tasks = [task_factory("A"), task_factory("B", ["A"])]
+    run(tasks, Agent(workspace), cache)
+    (workspace / "A.py").unlink()
+
+    agent = Agent(workspace)
+    runner = run(tasks, agent, cache)
+
+    assert agent.calls == []
+    assert sorted(runner.hits) == ["A", "B"]
+    assert (workspace / "A.py").read_text(encoding="utf-8") == "A"
+    assert cache.peek(cache.task_key(tasks[0], {})).execution_metrics == {"retries": 0}
+
+
+def test_changed_output_invalidates_dependents_only(task_factory, cache, workspace):
+    tasks = [task_factory("A"), task_factory("B", ["A"]), task_factory("C")]
+    run(tasks, Agent(workspace), cache)
+    tasks[0]["description"] = "Implement A differently"
+
+    agent = Agent(workspace, {"A": "A v2"})
+    runner = run(tasks, agent, cache)
+
+    assert agent.calls == ["A", "B"]
+    assert runner.hits == ["C"]
+
+
+def test_identical_rerun_output_keeps_dependents_cached(task_factory, cache, workspace):
+    tasks = [task_factory("A"), task_factory("B", ["A"])]
+    run(tasks, Agent(workspace), cache)
+    tasks[0]["description"] = "Reworded, same code"
+
+    agent = Agent(workspace)
+    runner = run(tasks, agent, cache)
+
+    assert agent.calls == ["A"]
+    assert runner.hits == ["B"]
+
+
+def test_layer_dependencies_are_part_of_the_key(task_factory, cache, workspace):
+    tasks = [task_factory("A"), task_factory("B", layer_dependencies={"domain": ["A"]})]
+    run(tasks, Agent(workspace), cache)
+
+    agent = Agent(workspace, {"A": "A v2"})
+    cache.invalidate(["A"])
+    run(tasks, agent, cache)
+
+    assert agent.calls == ["A", "B"]
+
+
+def test_results_without_files_are_not_cached(task_factory, cache, workspace):
+    tasks = [task_factory("A"), task_factory("B", ["A"])]
+    calls = []
+
+    def run_task(task):
+        calls.append(task["id"])
+        return True
+
+    for _ in range(2):
+        runner = CachedRunner(run_task, cache, result_of=lambda task: task)
+        for task in tasks:
+            runner(task)
+
+    assert calls == ["A", "B", "A", "B"]
+    assert cache.stats()["entries"] == 0
+
+
+def test_failed_runs_are_not_cached(task_factory, cache):
+    runner = CachedRunner(lambda task: False, cache, result_of=lambda task: {})
+
+    assert runner(task_factory("A")) is False
+    assert cache.stats()["entries"] == 0
+
+
+def test_plan_follows_graph_edges(task_factory, cache, workspace):
+    tasks = [
+        task_factory("A", status="completed"),
+        task_factory("B", ["A"]),
+        task_factory("C", layer_dependencies={"domain": ["B"]}),
+        task_factory("D"),
+    ]
+    run(tasks, Agent(workspace), cache)
+
+    assert cache.plan(TaskGraph(tasks)) == {"B", "C", "D"}
+    # Forced misses are only planned
+    assert cache.plan(TaskGraph(tasks), misses=["B"]) == {"D"}
+    assert cache.plan(TaskGraph(tasks)) == {"B", "C", "D"}
+    cache.invalidate(["B"])
+    assert cache.plan(TaskGraph(tasks)) == {"D"}
+
+
+def test_lru_eviction_and_clear(task_factory, tmp_path, workspace, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr("migration_framework.cache.time.time", lambda: next(clock))
+    cache = ResultCache(tmp_path / "small.db", root=workspace, max_entries=2)
+    tasks = [task_factory(t) for t in "ABC"]
+    run(tasks[:2], Agent(workspace), cache)
+    cache.get(cache.task_key(tasks[0], {}))  # A is now more recent than B
+
+    run(tasks[2:], Agent(workspace), cache)
+
+    assert cache.stats() == {"entries": 2, "tasks": 2, "bytes": 2}
+    assert cache.latest_output_hash("B") is None
+    assert cache.latest_output_hash("A") is not None
+    cache.clear()
+    assert cache.stats()["entries"] == 0
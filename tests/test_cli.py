@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from migration_framework.cache import ResultCache
+from migration_framework.cli import main
+from migration_framework.tasks import load_tasks
+
+
+@pytest.fixture
+def tasks_file(tmp_path, task_factory):
+    path = tmp_path / "tasks.json"
+    tasks = [task_factory("TASK-001"), task_factory("TASK-002", ["TASK-001"])]
+    path.write_text(json.dumps({"tasks": tasks}), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "option", [["--workers", "0"], ["--role-workers", "foo"], ["--role-workers", "domain-agent=0"]]
+)
+def test_schedule_rejects_invalid_worker_counts(tasks_file, capsys, option):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["schedule", "--tasks", str(tasks_file), "--no-cache", *option])
+
+    assert exit_info.value.code == 2
+    assert "error: argument" in capsys.readouterr().err
+
+
+def test_schedule_applies_role_workers(tasks_file, capsys):
+    code = main(
+        ["schedule", "--tasks", str(tasks_file), "--no-cache", "--role-workers", "domain-agent=3"]
+    )
+
+    assert code == 0
+    assert "domain-agent: 3 workers, 2 tareas" in capsys.readouterr().out
+
+
+def test_schedule_invalidate_plans_a_miss_without_deleting(tasks_file, tmp_path, capsys):
+    cache = ResultCache(tmp_path / "cache.db", root=tmp_path)
+    (tmp_path / "a.py").write_text("a", encoding="utf-8")
+    task = load_tasks(tasks_file)[0]
+    cache.put(cache.task_key(task, {}), task["id"], ["a.py"])
+    schedule = ["schedule", "--tasks", str(tasks_file), "--cache", str(tmp_path / "cache.db")]
+
+    assert main([*schedule, "--invalidate", "TASK-001"]) == 0
+    assert "en caché" not in capsys.readouterr().out
+    assert main(schedule) == 0
+    assert "Tareas en caché:   1" in capsys.readouterr().out
+
+
+def test_validate_reports_field_errors_and_cycles_together(tmp_path, task_factory, capsys):
+    path = tmp_path / "tasks.json"
+    tasks = [
+        task_factory("TASK-001", deliverables="src/app.py"),
+        task_factory("TASK-002", ["TASK-003"]),
+        task_factory("TASK-003", ["TASK-002", "TASK-404"]),
+    ]
+    path.write_text(json.dumps(tasks), encoding="utf-8")
+
+    assert main(["validate", str(path)]) == 1
+
+    out = capsys.readouterr().out
+    assert "❌ 3 errores de validación" in out
+    assert "$[0].deliverables (TASK-001): missing or not a list" in out
+    assert "$[2].dependencies[1] (TASK-003): unknown dependency 'TASK-404'" in out
+    assert "dependency cycle TASK-002 → TASK-003 → TASK-002" in out
+
+
+def test_validate_rejects_list_layer_dependencies(tmp_path, task_factory, capsys):
+    path = tmp_path / "tasks.json"
+    tasks = [task_factory("TASK-001"), task_factory("TASK-002", layerDependencies=["TASK-001"])]
+    path.write_text(json.dumps(tasks), encoding="utf-8")
+
+    assert main(["validate", str(path)]) == 1
+    assert "$[1].layerDependencies (TASK-002): not an object" in capsys.readouterr().out
+
+
+def test_validate_accepts_a_valid_file(tasks_file, capsys):
+    assert main(["validate", str(tasks_file)]) == 0
+    assert "✅ 2 tareas válidas (1 archivos)" in capsys.readouterr().out
+
+
+def test_state_claim_next_follows_dependencies(tmp_path, task_factory, capsys):
+    path = tmp_path / "tasks.json"
+    tasks = [
+        task_factory("TASK-001", owner=None, assigned_agent="domain-agent"),
+        task_factory("TASK-002", ["TASK-001"], owner=None, assigned_agent="domain-agent"),
+    ]
+    path.write_text(json.dumps(tasks), encoding="utf-8")
+    db = str(tmp_path / "tasks.db")
+    state = ["state", "--db", db]
+
+    assert main([*state, "import", "--tasks", str(path)]) == 0
+    assert main([*state, "claim-next", "domain-agent"]) == 0
+    assert json.loads(capsys.readouterr().out.split("\n", 1)[1])["id"] == "TASK-001"
+    assert main([*state, "claim-next", "domain-agent"]) == 1
+    assert (
+        main([*state, "update", "TASK-001", "--agent", "domain-agent", "--status", "completed"])
+        == 0
+    )
+    capsys.readouterr()
+    assert main([*state, "claim-next", "domain-agent"]) == 0
+    assert '"id": "TASK-002"' in capsys.readouterr().out
@@ -0,0 +1,252 @@
+import json
+import threading
+
+import pytest
+
+from migration_framework.cli import main
+from migration_framework.enrichment import (
+    EnrichmentPipeline,
+    fingerprint,
+    generate_test_strategy,
+    structural_signature,
+)
+
+
+def entity(task_factory, name, **fields):
+    return task_factory(
+        f"TASK-{name.upper()}",
+        type="implementation",
+        implementation_layer="domain",
+        deliverables=[f"app/domain/{name}.py", f"app/api/routers/{name}.py"],
+        acceptance_criteria=[f"{name} id must be unique"],
+        **fields,
+    )
+
+
+def test_structural_signature_separates_structure_from_names(task_factory):
+    signature, names = structural_signature(entity(task_factory, "customer"))
+
+    assert signature == (
+        "domain",
+        "implementation",
+        ("app/domain/{0}.py", "app/api/routers/{1}.py"),
+    )
+    assert names == ("customer", "customer")
+
+
+def test_generated_strategy_covers_layout_and_acceptance_criteria(task_factory):
+    strategy = generate_test_strategy(entity(task_factory, "customer"))
+
+    unit, integration = strategy["unit_tests"], strategy["integration_tests"]
+    assert [s["file_path"] for s in unit] == ["tests/unit/domain/test_customer.py"]
+    assert [s["file_path"] for s in integration] == ["tests/integration/api/test_customer.py"]
+    assert integration[0]["dependencies_required"] == ["test_database", "api_client"]
+    assert [(c["name"], c["scenario"]) for c in unit[0]["test_cases"]] == [
+        ("test_customer_happy_path", "happy_path"),
+        ("test_customer_id_must_be_unique", "business_rule"),
+    ]
+
+
+def test_generator_runs_once_per_structure(task_factory, tmp_path):
+    tasks = [entity(task_factory, name) for name in ("customer", "account", "transaction")]
+    tasks.append(task_factory("TASK-UI", type="implementation", deliverables=["app/ui/page.tsx"]))
+    calls = []
+
+    async def generator(template):
+        calls.append(template)
+        return generate_test_strategy(template)
+
+    pipeline = EnrichmentPipeline(tasks, generator=generator, checkpoint=None)
+    results = pipeline.run()
+
+    assert len(calls) == pipeline.generated == 2
+    assert all("{0}" in json.dumps(template) for template in calls)
+    for task in tasks:
+        assert results[task["id"]] == generate_test_strategy(task)
+
+
+def test_resume_skips_checkpointed_tasks_and_regenerates_changed_ones(task_factory, tmp_path):
+    checkpoint = tmp_path / "strategies.jsonl"
+    tasks = [entity(task_factory, "customer"), entity(task_factory, "account")]
+    EnrichmentPipeline(tasks, checkpoint=checkpoint).run()
+    with open(checkpoint, "a", encoding="utf-8") as fh:
+        fh.write('{"task_id": "TASK-CUS')  # torn line from a crash
+
+    tasks[1]["acceptance_criteria"] = ["account balance cannot be negative"]
+    published = []
+    pipeline = EnrichmentPipeline(
+        tasks, checkpoint=checkpoint, on_result=lambda tid, s: published.append(tid)
+    )
+    results = pipeline.run()
+
+    assert pipeline.resumed == ["TASK-CUSTOMER"]
+    assert sorted(published) == ["TASK-ACCOUNT", "TASK-CUSTOMER"]
+    cases = results["TASK-ACCOUNT"]["unit_tests"][0]["test_cases"]
+    assert cases[-1]["scenario"] == "business_rule"
+    records = [json.loads(line) for line in checkpoint.read_text(encoding="utf-8").splitlines()[3:]]
+    assert [(r["task_id"], r["fingerprint"]) for r in records] == [
+        ("TASK-ACCOUNT", fingerprint(tasks[1]))
+    ]
+
+
+def test_tasks_with_a_strategy_or_of_other_types_are_not_enriched(task_factory):
+    tasks = [
+        entity(task_factory, "customer", test_strategy={"unit_tests": []}),
+        task_factory("TASK-DOCS", type="documentation"),
+    ]
+
+    pipeline = EnrichmentPipeline(tasks, checkpoint=None)
+
+    assert pipeline.run() == {}
+    assert pipeline.wait_for("TASK-DOCS") is None
+
+
+def test_gate_waits_only_for_its_own_strategy(task_factory):
+    release = threading.Event()
+    tasks = [entity(task_factory, "customer"), entity(task_factory, "account")]
+
+    def generator(template):
+        release.wait(5)
+        return generate_test_strategy(template)
+
+    pipeline = EnrichmentPipeline(tasks, generator=generator, checkpoint=None)
+    pipeline.start()
+    gated = pipeline.gate(lambda task: "test_strategy" in task)
+
+    with pytest.raises(TimeoutError):
+        pipeline.wait_for("TASK-CUSTOMER", timeout=0.01)
+    release.set()
+    assert gated(tasks[0]) is True
+    assert gated(task_factory("TASK-OTHER")) is False
+
+
+def test_failing_on_result_releases_the_waiter(task_factory):
+    tasks = [entity(task_factory, "customer"), entity(task_factory, "account")]
+
+    def on_result(task_id, strategy):
+        if task_id == "TASK-ACCOUNT":
+            raise OSError("database is locked")
+
+    pipeline = EnrichmentPipeline(tasks, checkpoint=None, on_result=on_result)
+    pipeline.start().join(5)
+
+    assert pipeline.wait_for("TASK-CUSTOMER", timeout=1)
+    with pytest.raises(RuntimeError, match="database is locked"):
+        pipeline.wait_for("TASK-ACCOUNT", timeout=1)
+
+
+def test_checkpoint_write_errors_are_per_task(task_factory, tmp_path):
+    (tmp_path / "state").write_text("", encoding="utf-8")
+    checkpoint = tmp_path / "state" / "strategies.jsonl"  # its parent is a file
+    pipeline = EnrichmentPipeline([entity(task_factory, "customer")], checkpoint=checkpoint)
+
+    assert pipeline.run() == {}
+    assert pipeline.errors["TASK-CUSTOMER"].startswith("checkpoint write failed")
+
+
+def test_a_dead_pipeline_thread_fails_every_waiter(task_factory, tmp_path):
+    checkpoint = tmp_path / "strategies.jsonl"
+    checkpoint.write_text('{"unexpected": "record"}\n', encoding="utf-8")
+    pipeline = EnrichmentPipeline([entity(task_factory, "customer")], checkpoint=checkpoint)
+    hook, threading.excepthook = threading.excepthook, lambda args: None
+    try:
+        pipeline.start().join(5)
+    finally:
+        threading.excepthook = hook
+
+    with pytest.raises(RuntimeError, match="enrichment stopped"):
+        pipeline.wait_for("TASK-CUSTOMER", timeout=1)
+
+
+def test_generator_errors_fail_the_whole_structure(task_factory):
+    tasks = [entity(task_factory, "customer"), entity(task_factory, "account")]
+
+    def generator(template):
+        raise ValueError("model overloaded")
+
+    pipeline = EnrichmentPipeline(tasks, generator=generator, checkpoint=None)
+
+    assert pipeline.run() == {}
+    assert pipeline.errors == {
+        "TASK-CUSTOMER": "model overloaded",
+        "TASK-ACCOUNT": "model overloaded",
+    }
+
+
+def test_generator_objects_with_an_async_call_are_awaited(task_factory):
+    class Client:
+        async def __call__(self, template):
+            return generate_test_strategy(template)
+
+    task = entity(task_factory, "customer")
+
+    assert EnrichmentPipeline([task], generator=Client(), checkpoint=None).run() == {
+        task["id"]: generate_test_strategy(task)
+    }
+
+
+def test_malformed_generator_results_fail_only_their_structure(task_factory):
+    tasks = [
+        entity(task_factory, "customer"),
+        task_factory(
+            "TASK-UI",
+            type="implementation",
+            deliverables=["app/ui/page.tsx"],
+            acceptance_criteria=["page renders"],
+        ),
+    ]
+
+    def generator(template):
+        if template["implementation_layer"] == "domain":
+            return {"unit_tests": ["not a spec"]}
+        return {"unit_tests": [{"file_path": "tests/unit/test_page.py"}]}
+
+    pipeline = EnrichmentPipeline(tasks, generator=generator, checkpoint=None)
+    results = pipeline.run()
+
+    assert list(pipeline.errors) == ["TASK-CUSTOMER"]
+    assert pipeline.errors["TASK-CUSTOMER"].startswith("invalid test strategy")
+    cases = results["TASK-UI"]["unit_tests"][0]["test_cases"]
+    assert [(c["name"], c["act"]) for c in cases] == [("test_page_renders", "Exercise page")]
+
+
+def test_enrich_keeps_the_task_collection_fields(task_factory, tmp_path, capsys):
+    source = tmp_path / "tasks.json"
+    collection = {
+        "project_name": "Banking",
+        "framework_version": "4.3",
+        "total_tasks": 1,
+        "tasks": [entity(task_factory, "customer")],
+        "summary": {"pending": 1},
+    }
+    source.write_text(json.dumps(collection), encoding="utf-8")
+    output = tmp_path / "enriched.json"
+
+    code = main(
+        [
+            "enrich",
+            "--tasks",
+            str(source),
+            "--output",
+            str(output),
+            "--checkpoint",
+            str(tmp_path / "strategies.jsonl"),
+        ]
+    )
+
+    assert code == 0
+    enriched = json.loads(output.read_text(encoding="utf-8"))
+    assert {k: enriched[k] for k in ("project_name", "framework_version", "summary")} == {
+        "project_name": "Banking",
+        "framework_version": "4.3",
+        "summary": {"pending": 1},
+    }
+    assert enriched["total_tasks"] == 1
+    assert "test_strategy" in enriched["tasks"][0]
+    assert "1 generadas (1 llamadas al generador)" in capsys.readouterr().out
+
+
+def test_enrich_rejects_zero_concurrency(tmp_path):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["enrich", "--concurrency", "0"])
+    assert exit_info.value.code == 2
@@ -0,0 +1,93 @@
+import pytest
+
+from migration_framework.graph import COMPLETED, IN_PROGRESS, DependencyGraphError, TaskGraph
+
+
+def test_dangling_ids_self_references_and_cycles_are_reported_together(task_factory):
+    tasks = [
+        task_factory("TASK-001", ["TASK-404"]),
+        task_factory("TASK-002", ["TASK-003"]),
+        task_factory("TASK-003", layer_dependencies={"domain": ["TASK-002"]}),
+        task_factory("TASK-004", ["TASK-004"]),
+    ]
+
+    with pytest.raises(DependencyGraphError) as exc_info:
+        TaskGraph(tasks)
+
+    assert exc_info.value.issues == [
+        "TASK-001.dependencies[0]: unknown dependency 'TASK-404'",
+        "TASK-004.dependencies[0]: task depends on itself",
+        "dependency cycle TASK-002 → TASK-003 → TASK-002"
+        " (via TASK-002.dependencies[0] → TASK-003.layer_dependencies.domain[0])",
+    ]
+
+
+def test_layer_dependencies_are_edges(task_factory):
+    graph = TaskGraph(
+        [
+            task_factory("A"),
+            task_factory("B", layer_dependencies={"domain": ["A"], "use_case": None}),
+        ]
+    )
+
+    assert graph.dependencies["B"] == ["A"]
+    assert graph.ready() == ["A"]
+    assert graph.levels() == {"A": 0, "B": 1}
+
+
+def test_malformed_dependency_fields_are_not_walked(task_factory):
+    graph = TaskGraph(
+        [
+            task_factory("A"),
+            task_factory("B", layer_dependencies=["A"]),
+            task_factory("C", layer_dependencies={"domain": "AB"}),
+        ]
+    )
+
+    assert graph.dependencies == {"A": [], "B": [], "C": []}
+
+
+def test_completion_unlocks_dependents_by_role_and_priority(task_factory):
+    graph = TaskGraph(
+        [
+            task_factory("A"),
+            task_factory("B", ["A"], owner="use-case-agent", implementation_layer="use_case"),
+            task_factory("C", ["A"], effort="3 hours"),
+            task_factory("D", ["A", "C"]),
+        ]
+    )
+
+    assert graph.pop_ready("domain-agent") == "A"
+    assert graph.status["A"] == IN_PROGRESS
+    assert graph.complete("A") == ["B", "C"]
+    assert graph.complete("A") == []
+    assert graph.ready() == ["C", "B"]
+    assert graph.ready(role="use-case-agent", layer="use_case") == ["B"]
+    assert graph.pop_ready("domain-agent", layer="use_case") is None
+    assert graph.unmet["D"] == 1
+
+
+def test_failed_dependencies_block_dependents(task_factory):
+    graph = TaskGraph([task_factory("A"), task_factory("B", ["A"])])
+
+    graph.start("A")
+    graph.fail("A")
+
+    assert graph.ready() == []
+    assert graph.pending() == ["A", "B"]
+    with pytest.raises(ValueError):
+        graph.start("B")
+
+
+def test_reset_statuses_make_tasks_pending_again(task_factory):
+    tasks = [
+        task_factory("A", status="completed"),
+        task_factory("B", ["A"], status="failed"),
+        task_factory("C", ["B"], status="in_progress"),
+    ]
+
+    assert TaskGraph(tasks).ready() == []
+    graph = TaskGraph(tasks, reset_statuses=("failed", "in_progress"))
+    assert graph.status["A"] == COMPLETED
+    assert graph.ready() == ["B"]
+    assert graph.critical_path() == ["B", "C"]
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+
+from migration_framework.loader import TaskLoader, TaskValidationError, iter_tasks, normalize_task
+
+
+def write(tmp_path, name, payload):
+    path = tmp_path / name
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def ids(tasks):
+    return [t["id"] for t in tasks]
+
+
+def test_batches_with_metadata_and_batch_headers(tmp_path, task_factory):
+    path = write(
+        tmp_path,
+        "tasks.json",
+        [
+            {
+                "metadata": {"primary_phase": "domain"},
+                "summary": {"total": 1},
+                "tasks": [task_factory("TASK-001", acceptanceCriteria=["ok"])],
+                "suggestedNewPhases": [],
+            },
+            {
+                "batch": {"suggestedPhase": "deployment"},
+                "tasks": [task_factory("TASK-002", ["TASK-001"], priority="critical")],
+            },
+        ],
+    )
+
+    first, second = TaskLoader([path]).load()
+
+    assert first["phase"] == "domain"
+    assert first["acceptance_criteria"] == ["ok"]
+    assert first["effort_estimate"] == "60 minutes"
+    assert second["phase"] == "deployment"
+    assert second["type"] == "deployment"
+    assert second["priority"] == "high"
+
+
+def test_task_collection_and_plain_list(tmp_path, task_factory):
+    collection = write(
+        tmp_path,
+        "state.json",
+        {"project_name": "Banking", "tasks": [task_factory("TASK-001", phase="domain")]},
+    )
+    plain = write(tmp_path, "plain.json", [task_factory("TASK-002", ["TASK-001"])])
+
+    tasks = TaskLoader([collection, plain]).load()
+
+    assert ids(tasks) == ["TASK-001", "TASK-002"]
+    assert tasks[0]["phase"] == "domain"
+
+
+def test_small_chunks_parse_the_same(tmp_path, task_factory):
+    path = write(tmp_path, "tasks.json", [task_factory(f"TASK-{i:03}") for i in range(20)])
+
+    assert ids(TaskLoader([path], chunk_size=7).load()) == ids(TaskLoader([path]).load())
+
+
+def test_forward_references_across_files(tmp_path, task_factory):
+    later = write(tmp_path, "a.json", [task_factory("TASK-002", ["TASK-001"])])
+    earlier = write(tmp_path, "b.json", [task_factory("TASK-001")])
+
+    assert ids(iter_tasks(later, earlier)) == ["TASK-002", "TASK-001"]
+
+
+def test_every_issue_is_reported(tmp_path, task_factory):
+    path = write(
+        tmp_path,
+        "tasks.json",
+        [
+            task_factory("TASK-001", ["TASK-404"]),
+            task_factory("TASK-001"),
+            task_factory("TASK-003", ["TASK-003"], priority="urgent", title=""),
+            task_factory("TASK-004", deliverables="src/x.py"),
+            "not a task",
+        ],
+    )
+    loader = TaskLoader([path])
+
+    assert ids(loader) == ["TASK-001"]
+    messages = [(issue.path, issue.message) for issue in loader.errors]
+    assert messages == [
+        ("$[1].id", "duplicate task id 'TASK-001'"),
+        ("$[2].title", "missing or empty string"),
+        ("$[2].priority", "invalid priority 'urgent'"),
+        ("$[2].dependencies[0]", "task depends on itself"),
+        ("$[3].deliverables", "missing or not a list"),
+        ("$[4]", "expected an object"),
+        ("$[0].dependencies[0]", "unknown dependency 'TASK-404'"),
+    ]
+    with pytest.raises(TaskValidationError, match="7 task validation error"):
+        loader.raise_for_errors()
+
+
+def test_string_dependencies_are_one_issue(tmp_path, task_factory):
+    task = task_factory("TASK-001")
+    task["dependencies"] = "TASK-000"
+    path = write(tmp_path, "tasks.json", [task])
+    loader = TaskLoader([path])
+
+    assert list(loader) == []
+    assert [str(issue) for issue in loader.errors] == [
+        f"{path}:$[0].dependencies (TASK-001): missing or not a list"
+    ]
+
+
+def test_malformed_layer_dependencies_are_reported(tmp_path, task_factory):
+    tasks = [
+        task_factory("TASK-001", layerDependencies=["TASK-000"]),
+        task_factory("TASK-002", layer_dependencies={"domain": "TASK-001", "api": None}),
+        task_factory("TASK-003", layerDependencies={"domain": ["TASK-001"]}),
+    ]
+    path = write(tmp_path, "tasks.json", tasks)
+    loader = TaskLoader([path])
+
+    assert ids(loader) == ["TASK-003"]
+    assert [str(issue) for issue in loader.errors] == [
+        f"{path}:$[0].layerDependencies (TASK-001): not an object of dependency lists",
+        f"{path}:$[1].layer_dependencies.domain (TASK-002): not a list of strings",
+    ]
+
+
+def test_unreadable_and_malformed_files(tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text('[{"id": "TASK-001",', encoding="utf-8")
+    scalar = write(tmp_path, "scalar.json", 42)
+    loader = TaskLoader([tmp_path / "missing.json", broken, scalar])
+
+    assert list(loader) == []
+    assert [issue.message.split(":")[0] for issue in loader.errors] == [
+        "cannot read file",
+        "invalid JSON at byte 19",
+        "expected a JSON array or object",
+    ]
+
+
+def test_normalize_task_infers_type_and_keeps_values():
+    task = normalize_task(
+        {"id": "T", "deliverables": ["tests/test_a.py", "a.spec.ts"], "priority": "low"},
+        {"phase": "testing"},
+    )
+
+    assert task["type"] == "tests"
+    assert task["priority"] == "low"
+    assert task["phase"] == "testing"
+    assert task["status"] == "pending"
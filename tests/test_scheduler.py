@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from migration_framework.scheduler import Scheduler
+
+
+def test_dry_run_respects_dependencies_and_runs_branches_in_parallel(task_factory):
+    tasks = [
+        task_factory("A", effort="60 minutes"),
+        task_factory("B", ["A"], effort="30 minutes"),
+        task_factory("C", ["A"], effort="90 minutes", owner="use-case-agent"),
+        task_factory("D", ["B", "C"], effort="10 minutes"),
+    ]
+    schedule = Scheduler(tasks).dry_run()
+
+    outcomes = schedule.outcomes
+    assert outcomes["B"].start == outcomes["A"].end == 60
+    assert outcomes["C"].start == 60  # another role: runs next to B
+    assert outcomes["D"].start == outcomes["C"].end == 150
+    assert schedule.makespan == 160
+    assert schedule.sequential_time == 190
+    assert schedule.critical_path == ["A", "C", "D"]
+
+
+def test_dry_run_prioritizes_the_critical_path_within_a_role(task_factory):
+    tasks = [
+        task_factory("short", effort="10 minutes"),
+        task_factory("long", effort="10 minutes"),
+        task_factory("tail", ["long"], effort="120 minutes"),
+    ]
+    schedule = Scheduler(tasks, default_workers=1).dry_run()
+
+    assert schedule.outcomes["long"].start == 0
+    # "tail" is ready at 10 and outranks "short" on the single worker
+    assert schedule.outcomes["tail"].start == 10
+    assert schedule.outcomes["short"].start == 130
+
+
+def test_cached_tasks_are_projected_as_instant(task_factory):
+    tasks = [task_factory("A"), task_factory("B", ["A"])]
+    schedule = Scheduler(tasks).dry_run(cached={"A"})
+
+    assert schedule.outcomes["B"].start == 0
+    assert schedule.makespan == 60
+
+
+def test_completed_tasks_are_not_scheduled(task_factory):
+    tasks = [task_factory("A", status="completed"), task_factory("B", ["A"])]
+    scheduler = Scheduler(tasks)
+
+    assert list(scheduler.tasks) == ["B"]
+    assert list(scheduler.dry_run().outcomes) == ["B"]
+
+
+def test_run_limits_concurrency_per_role(task_factory):
+    tasks = [task_factory(f"D{i}") for i in range(6)] + [
+        task_factory(f"U{i}", owner="use-case-agent") for i in range(3)
+    ]
+    lock = threading.Lock()
+    running = {"domain-agent": 0, "use-case-agent": 0}
+    peak = dict(running)
+
+    def run_task(task):
+        role = task["owner"]
+        with lock:
+            running[role] += 1
+            peak[role] = max(peak[role], running[role])
+        time.sleep(0.02)
+        with lock:
+            running[role] -= 1
+        return True
+
+    schedule = Scheduler(tasks, workers_per_role={"domain-agent": 2}).run(run_task)
+
+    assert len(schedule.outcomes) == 9
+    assert peak == {"domain-agent": 2, "use-case-agent": 1}
+
+
+def test_run_starts_a_task_only_after_its_dependencies(task_factory):
+    tasks = [task_factory("A"), task_factory("B", ["A"]), task_factory("C", ["B"])]
+    finished = []
+
+    def run_task(task):
+        assert all(dep in finished for dep in task["dependencies"])
+        finished.append(task["id"])
+
+    schedule = Scheduler(tasks).run(run_task)
+
+    assert finished == ["A", "B", "C"]
+    assert not schedule.failed and not schedule.skipped
+
+
+@pytest.mark.parametrize("failure", [False, RuntimeError("agent crashed")])
+def test_failure_skips_only_the_downstream_subgraph(task_factory, failure):
+    tasks = [
+        task_factory("A"),
+        task_factory("B", ["A"]),
+        task_factory("C", ["B"]),
+        task_factory("X", owner="use-case-agent"),
+        task_factory("Y", ["X"], owner="use-case-agent"),
+    ]
+
+    def run_task(task):
+        if task["id"] == "A":
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return True
+
+    schedule = Scheduler(tasks).run(run_task)
+
+    assert schedule.failed == ["A"]
+    assert sorted(schedule.skipped) == ["B", "C"]
+    assert {"X", "Y"} <= set(schedule.outcomes)
+    if isinstance(failure, Exception):
+        assert schedule.outcomes["A"].error == "agent crashed"
+
+
+def test_restart_reschedules_failed_and_stale_in_progress_tasks(task_factory):
+    tasks = [
+        task_factory("A", status="failed"),
+        task_factory("B", ["A"]),
+        task_factory("C", status="in_progress"),
+        task_factory("D", status="completed"),
+    ]
+    ran = []
+
+    schedule = Scheduler(tasks).run(lambda task: ran.append(task["id"]))
+
+    assert sorted(ran) == ["A", "B", "C"]
+    assert ran.index("A") < ran.index("B")
+    assert not schedule.skipped
+
+
+def test_restart_can_keep_failed_tasks_blocked(task_factory):
+    tasks = [task_factory("A", status="failed"), task_factory("B", ["A"])]
+
+    schedule = Scheduler(tasks, reset_statuses=()).run(lambda task: True)
+
+    assert schedule.outcomes == {}
+    assert sorted(schedule.skipped) == ["A", "B"]
+
+
+def test_default_workers_must_be_positive(task_factory):
+    with pytest.raises(ValueError):
+        Scheduler([task_factory("A")], default_workers=0)
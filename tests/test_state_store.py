@@ -0,0 +1,177 @@
+import json
+import threading
+
+import pytest
+
+from migration_framework.graph import DependencyGraphError
+from migration_framework.state_store import TaskStateStore
+
+
+@pytest.fixture
+def store(tmp_path, task_factory):
+    store = TaskStateStore(tmp_path / "tasks.db")
+    store.import_tasks(
+        [
+            task_factory("TASK-001", owner=None, implementation_layer="domain"),
+            task_factory("TASK-002", owner=None, implementation_layer="application"),
+            task_factory("TASK-003", owner=None, implementation_layer="domain"),
+        ]
+    )
+    return store
+
+
+def test_import_keeps_existing_state_unless_replace(store, task_factory):
+    store.claim("TASK-001", "domain-agent")
+
+    assert (
+        store.import_tasks(
+            [task_factory("TASK-001", owner=None), task_factory("TASK-004", owner=None)]
+        )
+        == 1
+    )
+    assert store.get("TASK-001")["owner"] == "domain-agent"
+
+    store.import_tasks([task_factory("TASK-001", owner=None, title="Renamed")], replace=True)
+    task = store.get("TASK-001")
+    assert task["title"] == "Renamed"
+    assert task["owner"] is None and task["status"] == "pending"
+    assert [t["id"] for t in store.tasks()] == ["TASK-001", "TASK-002", "TASK-003", "TASK-004"]
+
+
+def test_claim_is_exclusive_across_threads(store):
+    barrier = threading.Barrier(8)
+    winners = []
+
+    def claim(agent):
+        barrier.wait()
+        if store.claim("TASK-002", agent):
+            winners.append(agent)
+
+    threads = [threading.Thread(target=claim, args=(f"agent-{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(winners) == 1
+    task = store.get("TASK-002")
+    assert task["owner"] == winners[0]
+    assert task["status"] == "in_progress"
+    assert "started_at" in task
+    assert [e["event"] for e in store.history("TASK-002")] == ["claim"]
+
+
+def test_claim_unknown_task_raises(store):
+    with pytest.raises(KeyError):
+        store.claim("TASK-999", "domain-agent")
+    with pytest.raises(KeyError):
+        store.get("TASK-999")
+
+
+def test_claim_next_follows_table_order_and_layer(store):
+    assert store.claim_next("a", implementation_layer="domain")["id"] == "TASK-001"
+    assert store.claim_next("b", implementation_layer="domain")["id"] == "TASK-003"
+    assert store.claim_next("c", implementation_layer="domain") is None
+    assert store.claim_next("d")["id"] == "TASK-002"
+    assert store.claim_next("e") is None
+
+
+def test_update_requires_ownership_and_logs_changes(store):
+    store.claim("TASK-001", "domain-agent")
+
+    assert not store.update("TASK-001", agent="other-agent", status="completed")
+    assert store.update("TASK-001", agent="domain-agent", status="completed", files_generated=["a"])
+
+    task = store.get("TASK-001")
+    assert task["status"] == "completed"
+    assert task["files_generated"] == ["a"]
+    assert "completed_at" in task
+    assert [e["event"] for e in store.history("TASK-001")] == ["claim", "update"]
+    assert store.summary()["completed"] == 1
+
+
+def test_update_rejects_unknown_status_and_task(store):
+    with pytest.raises(ValueError):
+        store.update("TASK-001", status="done")
+    with pytest.raises(KeyError):
+        store.update("TASK-999", status="completed")
+
+
+def test_release_returns_the_task_to_the_pool(store):
+    store.claim("TASK-001", "domain-agent")
+
+    assert not store.release("TASK-001", "other-agent")
+    assert store.release("TASK-001", "domain-agent")
+    assert store.claim("TASK-001", "other-agent")
+
+
+def test_tasks_filters_by_status_and_owner(store):
+    store.claim("TASK-003", "domain-agent")
+
+    assert [t["id"] for t in store.tasks(status="pending")] == ["TASK-001", "TASK-002"]
+    assert [t["id"] for t in store.tasks(owner="domain-agent")] == ["TASK-003"]
+
+
+def test_export_json_writes_a_task_collection(store, tmp_path):
+    store.claim("TASK-001", "domain-agent")
+    target = tmp_path / "state" / "tasks.json"
+
+    store.export_json(target, project_name="Banking", framework_version="4.3")
+
+    exported = json.loads(target.read_text(encoding="utf-8"))
+    assert exported["project_name"] == "Banking"
+    assert exported["total_tasks"] == 3
+    assert exported["summary"]["in_progress"] == 1
+    assert exported["tasks"][0]["owner"] == "domain-agent"
+    assert not target.with_suffix(".json.tmp").exists()
+
+
+def test_separate_connections_see_each_others_writes(store):
+    other = TaskStateStore(store.path)
+
+    assert other.claim("TASK-001", "domain-agent")
+    assert not store.claim("TASK-001", "use-case-agent")
+    other.close()
+
+
+@pytest.fixture
+def chain_store(tmp_path, task_factory):
+    store = TaskStateStore(tmp_path / "chain.db")
+    store.import_tasks(
+        [
+            task_factory("A", owner=None, assigned_agent="domain-agent"),
+            task_factory("B", ["A"], owner=None, assigned_agent="domain-agent"),
+            task_factory("C", ["A"], owner=None, assigned_agent="domain-agent", effort="3 hours"),
+            task_factory("D", owner=None, assigned_agent="use-case-agent"),
+        ]
+    )
+    return store
+
+
+def test_claim_next_waits_for_dependencies(chain_store):
+    assert chain_store.claim_next("domain-agent", role="domain-agent")["id"] == "A"
+    assert chain_store.claim_next("domain-agent", role="domain-agent") is None
+
+    chain_store.update("A", status="completed")
+
+    # C is on the longer remaining path
+    assert chain_store.claim_next("domain-agent", role="domain-agent")["id"] == "C"
+    assert chain_store.claim_next("domain-agent", role="domain-agent")["id"] == "B"
+    assert chain_store.claim_next("use-case-agent", role="use-case-agent")["id"] == "D"
+
+
+def test_reopening_a_completed_task_blocks_its_dependents_again(chain_store):
+    chain_store.update("A", status="completed")
+    chain_store.update("A", status="failed")
+
+    assert chain_store.claim_next("domain-agent", role="domain-agent") is None
+    assert chain_store.claim_next("use-case-agent")["id"] == "D"
+
+
+def test_import_with_a_cycle_writes_nothing(tmp_path, task_factory):
+    store = TaskStateStore(tmp_path / "tasks.db")
+
+    with pytest.raises(DependencyGraphError):
+        store.import_tasks([task_factory("A", ["B"]), task_factory("B", ["A"])])
+
+    assert store.tasks() == []
@@ -0,0 +1,153 @@
+import json
+import sys
+
+import pytest
+
+from migration_framework.cli import main
+from migration_framework.scheduler import Scheduler
+from migration_framework.telemetry import (
+    NOOP_SPAN,
+    Tracer,
+    build_report,
+    current_span,
+    parse_time_ns,
+    read_spans,
+)
+
+
+def agent_span(task_id, start, end, trace_id="t1", agent="domain-agent", **attributes):
+    return {
+        "trace_id": trace_id,
+        "span_id": task_id,
+        "name": f"{agent} {task_id}",
+        "kind": "agent",
+        "start_time_unix_nano": int(start * 1e9),
+        "end_time_unix_nano": int(end * 1e9),
+        "status": "ok",
+        "attributes": {"task_id": task_id, "agent": agent, **attributes},
+    }
+
+
+def test_report_follows_unblocked_by_and_measures_utilization():
+    spans = [
+        agent_span("A", 0, 10, level=0),
+        agent_span("B", 0, 4, level=0),
+        agent_span("C", 10, 20, level=1, unblocked_by="A", queue_wait_s=1.5),
+        agent_span("X", 5, 6, agent="qa-test-generator"),
+    ]
+
+    report = build_report(spans)
+
+    assert report.wall_time == 20
+    assert report.critical_path == ["A", "C"]
+    assert report.levels == {
+        0: {"tasks": 2, "start": 0, "end": 10},
+        1: {"tasks": 1, "start": 10, "end": 20},
+    }
+    # Two domain tasks overlap, so two slots are inferred over the 20 s window
+    assert report.utilization["domain-agent"] == {"busy": 24, "workers": 2, "utilization": 0.6}
+    assert report.utilization["qa-test-generator"]["utilization"] == 0.05
+    assert [t.task_id for t in report.slowest(2)] == ["A", "C"]
+    assert report.tasks["C"].queue_wait == 1.5
+
+
+def test_report_defaults_to_the_most_recent_trace():
+    spans = [agent_span("OLD", 0, 50, trace_id="t0"), agent_span("NEW", 60, 61, trace_id="t1")]
+
+    assert list(build_report(spans).tasks) == ["NEW"]
+    assert list(build_report(spans, trace_id="t0").tasks) == ["OLD"]
+    assert build_report([]).tasks == {}
+
+
+def test_scheduler_run_is_traced(tmp_path, task_factory):
+    path = tmp_path / "telemetry.jsonl"
+    tracer = Tracer(path)
+    tasks = [task_factory("A"), task_factory("B", ["A"])]
+
+    def run_task(task):
+        current_span().add("retries")
+        return task["id"] != "B"
+
+    Scheduler(tasks).run(run_task, tracer=tracer)
+    tracer.close()
+    report = build_report(read_spans(path))
+
+    assert [p["name"] for p in report.phases] == ["FASE 1-3: execution"]
+    assert report.critical_path == ["A", "B"]
+    assert report.tasks["A"].retries == 1
+    assert report.tasks["B"].status == "error"
+    assert report.utilization["domain-agent"]["workers"] == 1
+
+
+def test_disabled_tracer_records_nothing(tmp_path):
+    tracer = Tracer()
+
+    with tracer.span("phase", kind="phase") as span:
+        span.set(tasks=1)
+    tracer.record("x", "agent", 0, 1)
+
+    assert span is NOOP_SPAN
+    assert current_span() is NOOP_SPAN
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text(json.dumps(agent_span("A", 0, 1)) + '\n{"trace_id": ', encoding="utf-8")
+
+    assert [s["span_id"] for s in read_spans(path)] == ["A"]
+
+
+def test_cli_reports_a_trace_without_agent_spans(tmp_path, capsys):
+    telemetry = ["telemetry", "--file", str(tmp_path / "telemetry.jsonl")]
+
+    assert (
+        main([*telemetry, "run", "--phase", "FASE 4: smoke", "--", sys.executable, "-c", ""]) == 0
+    )
+    assert main([*telemetry, "report"]) == 0
+
+    out = capsys.readouterr().out
+    assert "📊 TELEMETRÍA (0 tareas" in out
+    assert "✅ FASE 4: smoke" in out
+    assert "Utilización" not in out
+
+
+def test_cli_imports_agent_progress_files(tmp_path, capsys):
+    progress = tmp_path / "progress.json"
+    progress.write_text(
+        json.dumps(
+            {
+                "agent_name": "domain-agent",
+                "tasks": [
+                    {
+                        "task_id": "TASK-001",
+                        "started_at": "2026-01-02T10:00:00Z",
+                        "completed_at": "2026-01-02T10:01:30Z",
+                    },
+                    {"task_id": "TASK-002", "started_at": "2026-01-02T10:02:00Z"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    telemetry = ["telemetry", "--file", str(tmp_path / "telemetry.jsonl")]
+
+    assert main([*telemetry, "import-progress", str(progress)]) == 0
+    assert main([*telemetry, "report", "--top", "1"]) == 0
+
+    out = capsys.readouterr().out
+    assert "📥 1 tareas importadas de 1 archivos de progreso" in out
+    assert "TASK-001   domain-agent              0h 02m" in out
+
+
+@pytest.mark.parametrize(
+    "command, code, message",
+    [(["report"], 1, "no existe"), (["run", "--phase", "x"], 2, "falta el comando")],
+)
+def test_cli_telemetry_errors(tmp_path, capsys, command, code, message):
+    assert main(["telemetry", "--file", str(tmp_path / "missing.jsonl"), *command]) == code
+    assert message in capsys.readouterr().out
+
+
+def test_parse_time_ns():
+    assert parse_time_ns("1970-01-01T00:00:01Z") == 1_000_000_000
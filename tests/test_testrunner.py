@@ -0,0 +1,178 @@
+import json
+import tempfile
+
+import pytest
+
+from migration_framework import testrunner
+from migration_framework.cli import main
+from migration_framework.testrunner import (
+    PLAYWRIGHT,
+    PYTEST,
+    ShardedTestStage,
+    Suite,
+    _balance,
+    _feature_tokens,
+    _parse_playwright,
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A generated backend with two test files, run from ``tmp_path``."""
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "backend"
+    (root / "app").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "conftest.py").write_text("", encoding="utf-8")
+    (root / "app" / "__init__.py").write_text("", encoding="utf-8")
+    (root / "app" / "calc.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (root / "app" / "notes.md").write_text("notes\n", encoding="utf-8")
+    (root / "tests" / "test_calc.py").write_text(
+        "from app.calc import add\n\n\ndef test_add():\n    assert add(1, 2) == 3\n",
+        encoding="utf-8",
+    )
+    (root / "tests" / "test_misc.py").write_text(
+        "def test_one():\n    pass\n\n\ndef test_two():\n    pass\n", encoding="utf-8"
+    )
+    return root
+
+
+def make_stage(project, workers=2):
+    suite = Suite("backend", PYTEST, project)
+    return ShardedTestStage([suite], workers=workers, state_path="state/test-runs.json")
+
+
+def test_iterations_rerun_only_failed_and_affected_tests(project, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    first = make_stage(project).run()
+
+    assert first.runs["backend"].full
+    assert first.runs["backend"].shards == 2
+    assert first.metrics() == {"tests_passed": 3, "tests_failed": 0}
+
+    # Nothing changed: nothing runs, totals still describe the whole suite
+    idle = make_stage(project).run()
+    assert idle.runs["backend"].selected == []
+    assert idle.totals["backend"] == {"passed": 3, "failed": 0, "skipped": 0}
+
+    (project / "app" / "calc.py").write_text("def add(a, b):\n    return a - b\n", encoding="utf-8")
+    (project / "app" / "notes.md").write_text("more notes\n", encoding="utf-8")
+    broken = make_stage(project).run()
+    assert broken.changed_files == ["backend/app/calc.py", "backend/app/notes.md"]
+    assert broken.runs["backend"].selected == ["tests/test_calc.py"]
+    assert broken.runs["backend"].failed == ["tests/test_calc.py::test_add"]
+    assert not broken.success
+
+    # The failure is re-run on its own, next to a brand new test file
+    (project / "tests" / "test_new.py").write_text("def test_new():\n    pass\n", encoding="utf-8")
+    retry = make_stage(project).run()
+    assert retry.runs["backend"].selected == ["tests/test_new.py", "tests/test_calc.py::test_add"]
+    assert retry.totals["backend"] == {"passed": 3, "failed": 1, "skipped": 0}
+
+    assert not list(tmp_path.glob("shards-*"))
+
+
+def test_full_run_ignores_previous_results(project):
+    make_stage(project).run()
+
+    report = make_stage(project, workers=1).run(full=True)
+
+    assert report.runs["backend"].full
+    assert report.runs["backend"].shards == 1
+    assert sorted(report.runs["backend"].results) == [
+        "tests/test_calc.py::test_add",
+        "tests/test_misc.py::test_one",
+        "tests/test_misc.py::test_two",
+    ]
+
+
+def test_a_missing_runner_is_a_clean_error(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(testrunner, "PLAYWRIGHT_COMMAND", ("no-such-playwright-runner", "test"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    specs = tmp_path / "frontend" / "tests" / "e2e"
+    specs.mkdir(parents=True)
+    (specs / "a.spec.ts").write_text("", encoding="utf-8")
+    (specs / "b.spec.ts").write_text("", encoding="utf-8")
+
+    assert main(["tests", "--only", "playwright", "--workers", "2"]) == 1
+
+    assert "❌ cannot run the e2e suite (no-such-playwright-runner)" in capsys.readouterr().err
+    assert not list(tmp_path.glob("shards-*"))
+
+
+def test_playwright_impact_uses_imports_and_feature_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    suite = Suite("e2e", PLAYWRIGHT, tmp_path / "frontend")
+    stage = ShardedTestStage([suite], state_path="state/test-runs.json")
+    tests = ["tests/e2e/customers.spec.ts", "tests/e2e/orders.spec.ts"]
+    snapshot = {
+        "frontend/tests/e2e/customers.spec.ts": [0, 0, "a"],
+        "frontend/tests/e2e/orders.spec.ts": [0, 0, "b"],
+        "frontend/src/lib/money.ts": [0, 0, "c"],
+    }
+    (tmp_path / "frontend" / "tests" / "e2e").mkdir(parents=True)
+    (tmp_path / "frontend" / "tests" / "e2e" / "orders.spec.ts").write_text(
+        "import { total } from '@/lib/money';\n", encoding="utf-8"
+    )
+
+    def affected(*changes):
+        return stage._affected(suite, tests, snapshot, list(changes), [])
+
+    assert affected("app/customers/[id]/page.tsx") == {"tests/e2e/customers.spec.ts"}
+    assert affected("src/lib/money.ts") == {"tests/e2e/orders.spec.ts"}
+    assert affected("src/lib/util.ts") == set(tests)  # impact unknown
+    assert affected("README.md") == set()
+
+
+def test_parse_playwright_report(tmp_path):
+    report = tmp_path / "report.json"
+    spec = {"file": "e2e/a.spec.ts", "line": 3}
+    report.write_text(
+        json.dumps(
+            {
+                "config": {"rootDir": str(tmp_path / "tests")},
+                "suites": [
+                    {
+                        "specs": [
+                            {
+                                **spec,
+                                "tests": [{"status": "flaky", "results": [{"duration": 1500}]}],
+                            },
+                            {**spec, "line": 9, "tests": [{"status": "unexpected"}]},
+                        ]
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    results = _parse_playwright(Suite("e2e", PLAYWRIGHT, tmp_path), report)
+
+    assert results == {
+        "tests/e2e/a.spec.ts:3": {
+            "file": "tests/e2e/a.spec.ts",
+            "status": "passed",
+            "duration": 1.5,
+        },
+        "tests/e2e/a.spec.ts:9": {"file": "tests/e2e/a.spec.ts", "status": "failed", "duration": 0},
+    }
+
+
+def test_balance_puts_the_longest_files_first():
+    shards = _balance([(1.0, "a"), (5.0, "b"), (3.0, "c"), (2.0, "d")], workers=2)
+
+    assert shards == [["b", "a"], ["c", "d"]]
+
+
+def test_feature_tokens():
+    assert _feature_tokens("frontend/app/customers/[id]/page.tsx") == {"customer"}
+    assert _feature_tokens("tests/e2e/order-items.spec.ts") == {"order", "item"}
+
+
+def test_invalid_configuration_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Suite("x", "jest", tmp_path)
+    with pytest.raises(ValueError):
+        ShardedTestStage([], workers=0)